@@ -247,6 +247,13 @@ TEMPLATE="$REPO_ROOT/.spec-mix/templates/spec-template.md"
 SPEC_FILE="$FEATURE_DIR/spec.md"
 if [ -f "$TEMPLATE" ]; then cp "$TEMPLATE" "$SPEC_FILE"; else touch "$SPEC_FILE"; fi
 
+# Start the feature's task ID sequence (see specmix/task_ids.py). The counter
+# has no board stamp yet, so the first allocation also checks tasks.md.
+TASK_STATE_DIR="$REPO_ROOT/.spec-mix/state"
+mkdir -p "$TASK_STATE_DIR/$BRANCH_NAME"
+[ -f "$TASK_STATE_DIR/.gitignore" ] || echo '*' > "$TASK_STATE_DIR/.gitignore"
+[ -f "$TASK_STATE_DIR/$BRANCH_NAME/task-seq" ] || echo 0 > "$TASK_STATE_DIR/$BRANCH_NAME/task-seq"
+
 # Set the SPECIFY_FEATURE environment variable for the current session
 export SPECIFY_FEATURE="$BRANCH_NAME"
 
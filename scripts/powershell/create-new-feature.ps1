@@ -269,6 +269,19 @@ if (Test-Path $template) {
     New-Item -ItemType File -Path $specFile | Out-Null 
 }
 
+# Start the feature's task ID sequence (see specmix/task_ids.py). The counter
+# has no board stamp yet, so the first allocation also checks tasks.md.
+$taskStateDir = Join-Path $repoRoot '.spec-mix/state'
+New-Item -ItemType Directory -Path (Join-Path $taskStateDir $branchName) -Force | Out-Null
+$stateIgnore = Join-Path $taskStateDir '.gitignore'
+if (-not (Test-Path $stateIgnore)) {
+    Set-Content -Path $stateIgnore -Value '*' -Encoding ascii
+}
+$taskSeqFile = Join-Path (Join-Path $taskStateDir $branchName) 'task-seq'
+if (-not (Test-Path $taskSeqFile)) {
+    Set-Content -Path $taskSeqFile -Value '0' -Encoding ascii
+}
+
 # Set the SPECIFY_FEATURE environment variable for the current session
 $env:SPECIFY_FEATURE = $branchName
 
@@ -32,9 +32,10 @@ import tempfile
 import shutil
 import shlex
 import json
+import hashlib
 from importlib.metadata import version as get_version, PackageNotFoundError
-from pathlib import Path
-from typing import Optional, Tuple
+from pathlib import Path, PurePosixPath
+from typing import Optional, Tuple, TYPE_CHECKING
 
 # Get version from package metadata
 try:
@@ -43,60 +44,77 @@ except PackageNotFoundError:
     __version__ = "0.0.0-dev"
 
 import typer
-import httpx
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
-from rich.live import Live
 from rich.align import Align
 from rich.table import Table
 from rich.tree import Tree
 from typer.core import TyperGroup
+from importlib.util import find_spec
 
-# For cross-platform keyboard input
-import readchar
-import ssl
-import truststore
+from .template_cache import TemplateCache
+
+# Network, TLS, keyboard and live-display modules are imported where they
+# are used, so short commands (note, mode, ...) start without them
+if TYPE_CHECKING:
+    import httpx
 
 # Import i18n support
 try:
     from .i18n import init_i18n, get_locale_manager, t
-    from .lang_command import lang_app
     HAS_I18N = True
 except ImportError:
     HAS_I18N = False
     # Fallback if i18n modules not available
     def t(key, **kwargs):
         return key
-    lang_app = None
 
-# Import mission support
-try:
-    from .mission_command import mission_app
-    HAS_MISSION = True
-except ImportError:
-    HAS_MISSION = False
-    mission_app = None
+# Sub-apps are registered by name and only imported when invoked:
+# command name -> (module, attribute)
+LAZY_SUBCOMMANDS = {
+    "lang": (".lang_command", "lang_app"),
+    "mission": (".mission_command", "mission_app"),
+    "dashboard": (".dashboard_command", "dashboard_app"),
+    "mode": (".mode_command", "mode_app"),
+}
 
-# Import dashboard support
-try:
-    from .dashboard_command import dashboard_app
-    HAS_DASHBOARD = True
-except ImportError:
-    HAS_DASHBOARD = False
-    dashboard_app = None
+HAS_MISSION = find_spec(".mission_command", __name__) is not None
+HAS_DASHBOARD = find_spec(".dashboard_command", __name__) is not None
+HAS_MODE = find_spec(".mode_command", __name__) is not None
 
-# Import mode support
-try:
-    from .mode_command import mode_app
-    HAS_MODE = True
-except ImportError:
-    HAS_MODE = False
-    mode_app = None
+_ssl_context = None
+
+
+def get_ssl_context():
+    """Return the shared system-trust SSL context, creating it on first use."""
+    global _ssl_context
+    if _ssl_context is None:
+        import ssl
+        import truststore
+        _ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    return _ssl_context
 
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
+
+_client = None
+
+
+def get_client() -> "httpx.Client":
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        import httpx
+        _client = httpx.Client(verify=get_ssl_context())
+    return _client
+
+
+def __getattr__(name):
+    # Keep the old module attributes available without eager setup
+    if name == "ssl_context":
+        return get_ssl_context()
+    if name == "client":
+        return get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def _github_token(cli_token: str | None = None) -> str | None:
     """Return sanitized GitHub token (cli arg takes precedence) or None."""
@@ -161,6 +179,17 @@ AGENT_CONFIG = {
 
 SCRIPT_TYPE_CHOICES = {"sh": "POSIX Shell (bash/zsh)", "ps": "PowerShell"}
 
+# Template archives downloaded at once when several agents are requested
+MAX_PARALLEL_DOWNLOADS = 6
+
+# Copy buffer used when streaming archive entries to disk
+EXTRACT_BUFFER_SIZE = 1024 * 1024
+
+# Template download tuning; SPEC_MIX_DOWNLOAD_CHUNK_SIZE overrides the chunk size
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+DOWNLOAD_RETRIES = 3
+PROGRESS_REFRESH_INTERVAL = 0.1
+
 CLAUDE_LOCAL_PATH = Path.home() / ".claude" / "local" / "claude"
 
 BANNER = """
@@ -260,6 +289,8 @@ class StepTracker:
 
 def get_key():
     """Get a single keypress in a cross-platform way using readchar."""
+    import readchar
+
     key = readchar.readkey()
 
     if key == readchar.key.UP or key == readchar.key.CTRL_P:
@@ -324,6 +355,8 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
 
     def run_selection_loop():
         nonlocal selected_key, selected_index
+        from rich.live import Live
+
         with Live(create_selection_panel(), console=console, transient=True, auto_refresh=False) as live:
             while True:
                 try:
@@ -356,7 +389,31 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
 console = Console()
 
 class BannerGroup(TyperGroup):
-    """Custom group that shows banner before help."""
+    """Custom group that shows banner before help and loads sub-apps lazily."""
+
+    def list_commands(self, ctx):
+        commands = list(super().list_commands(ctx))
+        for name, (module, _) in LAZY_SUBCOMMANDS.items():
+            if name not in commands and find_spec(module, __name__) is not None:
+                commands.append(name)
+        return commands
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in LAZY_SUBCOMMANDS:
+            return command
+
+        module_name, attr = LAZY_SUBCOMMANDS[cmd_name]
+        try:
+            from importlib import import_module
+            sub_app = getattr(import_module(module_name, __name__), attr)
+        except ImportError:
+            return None
+
+        command = typer.main.get_group(sub_app)
+        command.name = cmd_name
+        self.commands[cmd_name] = command
+        return command
 
     def format_help(self, ctx, formatter):
         # Show banner before help
@@ -372,21 +429,8 @@ app = typer.Typer(
     cls=BannerGroup,
 )
 
-# Add lang subcommand if available
-if HAS_I18N and lang_app is not None:
-    app.add_typer(lang_app, name="lang")
-
-# Add mission subcommand if available
-if HAS_MISSION and mission_app is not None:
-    app.add_typer(mission_app, name="mission")
-
-# Add dashboard subcommand if available
-if HAS_DASHBOARD and dashboard_app is not None:
-    app.add_typer(dashboard_app, name="dashboard")
-
-# Add mode subcommand if available
-if HAS_MODE and mode_app is not None:
-    app.add_typer(mode_app, name="mode")
+# lang, mission, dashboard and mode are attached by BannerGroup on demand
+# (see LAZY_SUBCOMMANDS)
 
 def show_banner():
     """Display the ASCII art banner."""
@@ -528,14 +572,26 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
         os.chdir(original_cwd)
 
 def handle_vscode_settings(sub_item, dest_file, rel_path, verbose=False, tracker=None) -> None:
-    """Handle merging or copying of .vscode/settings.json files."""
+    """Handle merging or copying of .vscode/settings.json files.
+
+    ``sub_item`` is the template's settings file, either a path or its raw bytes.
+    """
     def log(message, color="green"):
         if verbose and not tracker:
             console.print(f"[{color}]{message}[/] {rel_path}")
 
+    def copy_new():
+        if isinstance(sub_item, bytes):
+            dest_file.write_bytes(sub_item)
+        else:
+            shutil.copy2(sub_item, dest_file)
+
     try:
-        with open(sub_item, 'r', encoding='utf-8') as f:
-            new_settings = json.load(f)
+        if isinstance(sub_item, bytes):
+            new_settings = json.loads(sub_item)
+        else:
+            with open(sub_item, 'r', encoding='utf-8') as f:
+                new_settings = json.load(f)
 
         if dest_file.exists():
             merged = merge_json_files(dest_file, new_settings, verbose=verbose and not tracker)
@@ -544,12 +600,12 @@ def handle_vscode_settings(sub_item, dest_file, rel_path, verbose=False, tracker
                 f.write('\n')
             log("Merged:", "green")
         else:
-            shutil.copy2(sub_item, dest_file)
+            copy_new()
             log("Copied (no existing settings.json):", "blue")
 
     except Exception as e:
         log(f"Warning: Could not merge, copying instead: {e}", "yellow")
-        shutil.copy2(sub_item, dest_file)
+        copy_new()
 
 def merge_json_files(existing_path: Path, new_content: dict, verbose: bool = False) -> dict:
     """Merge new JSON content into existing JSON file.
@@ -594,24 +650,42 @@ def merge_json_files(existing_path: Path, new_content: dict, verbose: bool = Fal
 
     return merged
 
-def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Tuple[Path, dict]:
-    repo_owner = "dan1901"
-    repo_name = "spec-mix"
+GITHUB_RELEASES_URL = "https://api.github.com/repos/dan1901/spec-mix/releases/latest"
+
+
+def fetch_latest_release(*, client: "httpx.Client" = None, cache: TemplateCache = None, verbose: bool = True, debug: bool = False, github_token: str = None, from_cache: bool = False) -> Optional[dict]:
+    """Return the latest release JSON, revalidated against the template cache.
+
+    Returns None only with ``from_cache`` when no release data was cached.
+    """
+    api_url = GITHUB_RELEASES_URL
+    cached_etag, cached_release = cache.get_release(api_url) if cache else (None, None)
+
+    if from_cache:
+        if verbose:
+            console.print("[cyan]Using cached release information (offline)...[/cyan]")
+        return cached_release
+
     if client is None:
-        client = httpx.Client(verify=ssl_context)
+        client = get_client()
 
     if verbose:
         console.print("[cyan]Fetching latest release information...[/cyan]")
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
+
+    headers = _github_auth_headers(github_token)
+    if cached_etag and cached_release:
+        headers["If-None-Match"] = cached_etag
 
     try:
         response = client.get(
             api_url,
             timeout=30,
             follow_redirects=True,
-            headers=_github_auth_headers(github_token),
+            headers=headers,
         )
         status = response.status_code
+        if status == 304:
+            return cached_release
         if status != 200:
             msg = f"GitHub API returned {status} for {api_url}"
             if debug:
@@ -622,109 +696,698 @@ def download_template_from_github(ai_assistant: str, download_dir: Path, *, scri
         except ValueError as je:
             raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
     except Exception as e:
-        console.print(f"[red]Error fetching release information[/red]")
-        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
-        raise typer.Exit(1)
+        if not cached_release:
+            console.print(f"[red]Error fetching release information[/red]")
+            console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+            raise typer.Exit(1)
+        # Offline or rate limited: fall back to the last known release
+        if verbose:
+            console.print(f"[yellow]Could not reach GitHub, using cached release {cached_release.get('tag_name', '?')}[/yellow]")
+        return cached_release
+
+    if cache:
+        try:
+            cache.put_release(api_url, response.headers.get("etag"), release_data)
+        except OSError as e:
+            if debug:
+                console.print(f"[yellow]Could not update template cache: {e}[/yellow]")
+    return release_data
+
+
+class DownloadVerificationError(RuntimeError):
+    """Raised when a downloaded template does not match its release asset."""
+
+
+def _download_chunk_size() -> int:
+    """Return the download chunk size (SPEC_MIX_DOWNLOAD_CHUNK_SIZE or the default)."""
+    try:
+        return max(4096, int(os.environ["SPEC_MIX_DOWNLOAD_CHUNK_SIZE"]))
+    except (KeyError, ValueError):
+        return DOWNLOAD_CHUNK_SIZE
+
+
+def download_with_resume(client: "httpx.Client", url: str, dest: Path, *, expected_size: int = 0, headers: dict | None = None, chunk_size: int = DOWNLOAD_CHUNK_SIZE, show_progress: bool = False, retries: int = DOWNLOAD_RETRIES) -> None:
+    """Download url into dest, continuing an existing partial file.
+
+    Partial files are resumed with an HTTP Range request; if the server ignores
+    the range the download restarts. Network errors and 5xx responses are
+    retried up to ``retries`` times, each time from where the last attempt
+    stopped. On final failure dest is left in place for a later resume.
+    """
+    import time
+    import httpx
+
+    progress = None
+    task = None
+    if show_progress and expected_size:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            console=console,
+        )
+        task = progress.add_task("Downloading...", total=expected_size)
+        progress.start()
+
+    attempt = 0
+    try:
+        while True:
+            offset = dest.stat().st_size if dest.exists() else 0
+            if expected_size and offset > expected_size:
+                # Not a prefix of this asset; start over
+                dest.unlink()
+                offset = 0
+            if expected_size and offset == expected_size:
+                return
+
+            request_headers = dict(headers or {})
+            if offset:
+                request_headers["Range"] = f"bytes={offset}-"
+
+            try:
+                with client.stream("GET", url, timeout=60, follow_redirects=True, headers=request_headers) as response:
+                    status = response.status_code
+                    if status == 416 and offset:
+                        # Range not satisfiable: the partial file is stale
+                        dest.unlink()
+                        continue
+                    if status >= 500:
+                        raise httpx.HTTPStatusError(f"Download failed with {status}", request=response.request, response=response)
+                    if status not in (200, 206):
+                        response.read()
+                        body_sample = response.text[:400]
+                        raise RuntimeError(f"Download failed with {status}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
+                    if status == 200:
+                        offset = 0  # Range ignored; the full body follows
+
+                    downloaded = offset
+                    last_refresh = 0.0
+                    with open(dest, 'ab' if offset else 'wb') as f:
+                        for chunk in response.iter_bytes(chunk_size=chunk_size):
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            if progress is not None:
+                                now = time.monotonic()
+                                if now - last_refresh >= PROGRESS_REFRESH_INTERVAL:
+                                    progress.update(task, completed=downloaded)
+                                    last_refresh = now
+                    if progress is not None:
+                        progress.update(task, completed=downloaded)
+                    return
+            except (httpx.TransportError, httpx.HTTPStatusError):
+                attempt += 1
+                if attempt > retries:
+                    raise
+                time.sleep(min(0.5 * 2 ** attempt, 5))
+    finally:
+        if progress is not None:
+            progress.stop()
+
+
+def verify_download(path: Path, expected_size: int = 0, expected_digest: str | None = None) -> str:
+    """Check a downloaded file against its release asset and return its SHA-256.
+
+    ``expected_digest`` uses GitHub's asset format ("sha256:<hex>"); other
+    algorithms are ignored.
+    """
+    size = path.stat().st_size
+    if expected_size and size != expected_size:
+        raise DownloadVerificationError(f"Downloaded {size:,} bytes, expected {expected_size:,}")
+
+    with open(path, 'rb') as f:
+        sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+
+    algorithm, _, value = (expected_digest or "").partition(":")
+    if algorithm == "sha256" and value.lower() != sha256:
+        raise DownloadVerificationError(f"SHA-256 mismatch: got {sha256}, expected {value}")
+    return sha256
+
 
-    assets = release_data.get("assets", [])
+def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, use_cache: bool = True, from_cache: bool = False, cache: TemplateCache = None, release_data: dict = None, chunk_size: int | None = None) -> Tuple[Path, dict]:
+    """Fetch the template archive for an agent, reusing the local template cache.
+
+    With the cache enabled the release lookup is a conditional request and the
+    archive is read from (or downloaded into) the cache; ``metadata['cached']``
+    is then True and the returned path must not be deleted by the caller.
+    With ``from_cache`` no network access is made at all. Pass ``release_data``
+    to skip the release lookup (see fetch_templates).
+
+    Downloads resume from an earlier partial file and are verified against the
+    asset's size and SHA-256 digest (when the release lists one).
+    """
+    if cache is None and (use_cache or from_cache):
+        cache = TemplateCache()
     pattern = f"spec-mix-template-{ai_assistant}-{script_type}"
-    matching_assets = [
-        asset for asset in assets
-        if pattern in asset["name"] and asset["name"].endswith(".zip")
-    ]
 
-    asset = matching_assets[0] if matching_assets else None
+    if release_data is None:
+        release_data = fetch_latest_release(client=client, cache=cache, verbose=verbose, debug=debug, github_token=github_token, from_cache=from_cache)
+    if not from_cache and client is None:
+        client = get_client()
 
-    if asset is None:
-        console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
-        asset_names = [a.get('name', '?') for a in assets]
-        console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
-        raise typer.Exit(1)
+    if release_data:
+        assets = release_data.get("assets", [])
+        matching_assets = [
+            asset for asset in assets
+            if pattern in asset["name"] and asset["name"].endswith(".zip")
+        ]
 
-    download_url = asset["browser_download_url"]
-    filename = asset["name"]
-    file_size = asset["size"]
+        asset = matching_assets[0] if matching_assets else None
+
+        if asset is None:
+            console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
+            asset_names = [a.get('name', '?') for a in assets]
+            console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
+            raise typer.Exit(1)
+
+        download_url = asset["browser_download_url"]
+        filename = asset["name"]
+        file_size = asset["size"]
+        expected_digest = asset.get("digest")
+        tag_name = release_data["tag_name"]
+        cached_path = cache.lookup(tag_name, filename) if cache else None
+    else:
+        # Offline without release data: use whatever matching archive is cached
+        found = cache.find_latest([pattern, ".zip"])
+        if found is None:
+            console.print(f"[red]No cached template found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
+            console.print(f"[dim]Cache directory: {cache.root}[/dim]")
+            raise typer.Exit(1)
+        tag_name, filename, cached_path = found
+        download_url = None
+        file_size = cached_path.stat().st_size
 
     if verbose:
         console.print(f"[cyan]Found template:[/cyan] {filename}")
         console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
-        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
+        console.print(f"[cyan]Release:[/cyan] {tag_name}")
+
+    metadata = {
+        "filename": filename,
+        "size": file_size,
+        "release": tag_name,
+        "asset_url": download_url,
+        "cached": cache is not None,
+        "cache_hit": cached_path is not None,
+    }
+
+    if cached_path is not None:
+        if verbose:
+            console.print(f"[cyan]Using cached template:[/cyan] {cached_path}")
+        return cached_path, metadata
+
+    if from_cache:
+        console.print(f"[red]Template {filename} ({tag_name}) is not in the cache[/red]")
+        console.print(f"[dim]Cache directory: {cache.root}[/dim]")
+        raise typer.Exit(1)
+
+    part_path = None
+    if cache:
+        try:
+            part_path = cache.partial_path(tag_name, filename)
+        except OSError as e:
+            # Unwritable cache directory: download without caching
+            if debug:
+                console.print(f"[yellow]Template cache unavailable: {e}[/yellow]")
+            cache = None
+            metadata["cached"] = False
+    if part_path is None:
+        part_path = download_dir / f"{filename}.part"
 
-    zip_path = download_dir / filename
     if verbose:
-        console.print(f"[cyan]Downloading template...[/cyan]")
+        resumed = part_path.exists() and part_path.stat().st_size > 0
+        console.print(f"[cyan]{'Resuming' if resumed else 'Downloading'} template...[/cyan]")
 
     try:
-        with client.stream(
-            "GET",
+        download_with_resume(
+            client,
             download_url,
-            timeout=60,
-            follow_redirects=True,
+            part_path,
+            expected_size=file_size,
             headers=_github_auth_headers(github_token),
-        ) as response:
-            if response.status_code != 200:
-                body_sample = response.text[:400]
-                raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
-            total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
-                if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                else:
-                    if show_progress:
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[progress.description]{task.description}"),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                            console=console,
-                        ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
-                            downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                progress.update(task, completed=downloaded)
-                    else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
-                            f.write(chunk)
+            chunk_size=chunk_size or _download_chunk_size(),
+            show_progress=show_progress,
+        )
+        digest = verify_download(part_path, file_size, expected_digest)
+        if cache:
+            zip_path = cache.store(tag_name, filename, part_path, digest)
+        else:
+            zip_path = download_dir / filename
+            os.replace(part_path, zip_path)
     except Exception as e:
         console.print(f"[red]Error downloading template[/red]")
         detail = str(e)
-        if zip_path.exists():
-            zip_path.unlink()
+        if isinstance(e, DownloadVerificationError):
+            part_path.unlink(missing_ok=True)
+        elif part_path.exists() and part_path.stat().st_size > 0:
+            detail += "\n\nThe partial download was kept; run the command again to resume it."
         console.print(Panel(detail, title="Download Error", border_style="red"))
         raise typer.Exit(1)
     if verbose:
         console.print(f"Downloaded: {filename}")
-    metadata = {
-        "filename": filename,
-        "size": file_size,
-        "release": release_data["tag_name"],
-        "asset_url": download_url
-    }
     return zip_path, metadata
 
-def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None, language: str = "en", mission: str = "software-dev") -> Path:
+def parse_agent_list(value: str) -> list[str]:
+    """Split a comma-separated agent option (e.g. "claude,gemini") into unique keys, in order."""
+    agents = []
+    for item in value.split(','):
+        item = item.strip()
+        if item and item not in agents:
+            agents.append(item)
+    return agents
+
+
+def fetch_templates(agents: list[str], download_dir: Path, *, script_type: str = "sh", client: "httpx.Client" = None, debug: bool = False, github_token: str = None, from_cache: bool = False) -> dict:
+    """Fetch template archives for several agents at once.
+
+    The release is resolved once, then the archives are downloaded concurrently
+    over the shared (pooled) client. Returns {agent: (zip_path, metadata)}.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = TemplateCache()
+    if client is None and not from_cache:
+        client = get_client()
+    release_data = fetch_latest_release(client=client, cache=cache, verbose=False, debug=debug, github_token=github_token, from_cache=from_cache)
+
+    def fetch(agent):
+        return download_template_from_github(
+            agent,
+            download_dir,
+            script_type=script_type,
+            verbose=False,
+            show_progress=False,
+            client=client,
+            debug=debug,
+            github_token=github_token,
+            from_cache=from_cache,
+            cache=cache,
+            release_data=release_data,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(agents), MAX_PARALLEL_DOWNLOADS))) as pool:
+        return dict(zip(agents, pool.map(fetch, agents)))
+
+
+def _template_root(names: list[str]) -> str:
+    """Return the top-level directory prefix shared by every archive entry ('' if none)."""
+    first = {name.split('/', 1)[0] for name in names}
+    if len(first) == 1 and all('/' in name for name in names):
+        return f"{first.pop()}/"
+    return ""
+
+
+def install_agent_folder(zip_path: Path, agent: str, project_path: Path) -> int:
+    """Extract only an agent's folder from a template archive into the project.
+
+    Shared files (scripts, templates, memory) are not touched, so archives for
+    several agents can be installed into one project without writing them more
+    than once. The folder is merged, not replaced: files from the archive
+    overwrite their counterparts and everything else already in the folder
+    (e.g. workflows in .github/) is kept. Returns the number of files written.
+    """
+    folder = AGENT_CONFIG[agent]["folder"].rstrip('/')
+    dest_root = project_path / folder
+
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        infos = zip_ref.infolist()
+        root = _template_root([info.filename for info in infos])
+
+        members = []
+        for candidate in (folder, folder.lstrip('.')):
+            prefix = f"{root}{candidate}/"
+            members = [info for info in infos if info.filename.startswith(prefix) and not info.is_dir()]
+            if members:
+                break
+        if not members:
+            raise FileNotFoundError(f"Agent folder {folder} not found in template")
+
+        if dest_root.is_symlink():
+            dest_root.unlink()
+
+        checked_dirs = set()
+        for info in members:
+            rel_path = Path(info.filename[len(prefix):])
+            if rel_path.is_absolute() or '..' in rel_path.parts:
+                continue
+            dest_file = dest_root / rel_path
+            # A commands folder linked to the active mission must not be written through
+            for depth in range(1, len(rel_path.parts)):
+                sub_dir = dest_root.joinpath(*rel_path.parts[:depth])
+                if sub_dir not in checked_dirs:
+                    if sub_dir.is_symlink():
+                        sub_dir.unlink()
+                    checked_dirs.add(sub_dir)
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            with zip_ref.open(info) as src, open(dest_file, 'wb') as dst:
+                shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+
+    return len(members)
+
+
+def link_agent_commands(project_path: Path, agent: str, debug: bool = False) -> Tuple[bool, str]:
+    """Point an agent's commands directory at the active mission commands.
+
+    Returns (linked, detail); linked is False when there was nothing to link.
+    """
+    agent_path = project_path / AGENT_CONFIG[agent]["folder"]
+    mission_commands_dir = project_path / ".spec-mix" / "active-mission" / "commands"
+
+    # Determine agent commands directory
+    if agent == "antigravity":
+        agent_commands_dir = agent_path / "workflows"
+    else:
+        agent_commands_dir = agent_path / "commands"
+
+    # Check if mission commands exist and have files
+    mission_has_commands = (
+        mission_commands_dir.exists() and
+        any(mission_commands_dir.glob("*.md"))
+    )
+
+    if not mission_has_commands:
+        # No mission commands available - keep downloaded package commands if any
+        if agent_commands_dir.exists() and any(agent_commands_dir.glob("*")):
+            cmd_count = len(list(agent_commands_dir.glob("*")))
+            return True, f"using package commands ({cmd_count} files)"
+        if debug:
+            console.print(f"[yellow]No commands in active-mission or package[/yellow]")
+        return False, "no commands available"
+
+    # Remove existing and create symlink
+    agent_commands_dir.parent.mkdir(parents=True, exist_ok=True)
+    if agent_commands_dir.exists() or agent_commands_dir.is_symlink():
+        if agent_commands_dir.is_symlink():
+            agent_commands_dir.unlink()
+        else:
+            shutil.rmtree(agent_commands_dir)
+
+    try:
+        rel_target = os.path.relpath(mission_commands_dir, agent_commands_dir.parent)
+        agent_commands_dir.symlink_to(rel_target, target_is_directory=True)
+        cmd_count = len(list(mission_commands_dir.glob("*.md")))
+        return True, f"symlinked ({cmd_count} commands)"
+    except (OSError, NotImplementedError) as symlink_err:
+        if debug:
+            console.print(f"[yellow]Symlink failed: {symlink_err}, falling back to copy[/yellow]")
+        # Fallback: copy files
+        agent_commands_dir.mkdir(parents=True, exist_ok=True)
+        cmd_count = 0
+        for cmd_file in mission_commands_dir.glob("*.md"):
+            shutil.copy2(cmd_file, agent_commands_dir / cmd_file.name)
+            cmd_count += 1
+        return True, f"copied {cmd_count} commands"
+
+
+def install_agent_rule_file(project_path: Path, agent: str, selected_lang: str, debug: bool = False):
+    """Create an agent's main rule file (CLAUDE.md, GEMINI.md, ...) or add the walkthrough section to an existing one."""
+    try:
+        agent_rule_files = {
+            'claude': 'CLAUDE.md',
+            'copilot': 'agent.md',
+            'codex': 'agent.md',
+            'gemini': 'GEMINI.md',
+            'cursor-agent': 'CURSOR.md',
+            'qwen': 'QWEN.md',
+            'opencode': 'OPENCODE.md',
+            'windsurf': 'WINDSURF.md',
+            'kilocode': 'KILOCODE.md',
+            'auggie': 'AUGGIE.md',
+            'codebuddy': 'CODEBUDDY.md',
+            'amp': 'AMP.md',
+            'antigravity': 'ANTIGRAVITY.md',
+            'roo': 'ROO.md',
+            'q': 'Q.md'
+        }
+
+        # Determine which rule file to use
+        rule_filename = agent_rule_files.get(agent, 'agent.md')
+
+        # Try to find the template file
+        import pkg_resources
+        rule_template_path = None
+
+        # Determine the locale directory
+        locale_dir = 'ko' if selected_lang == 'ko' else 'en'
+
+        # First try agent-specific file
+        try:
+            if agent == 'claude':
+                # For Claude, use CLAUDE.md
+                rule_content = pkg_resources.resource_string('specmix', f'locales/{locale_dir}/agent-rules/CLAUDE.md').decode('utf-8')
+            else:
+                # For others, try to use generic agent.md
+                rule_content = pkg_resources.resource_string('specmix', f'locales/{locale_dir}/agent-rules/agent.md').decode('utf-8')
+        except:
+            # Fallback: try to read from local file system
+            try:
+                module_dir = Path(__file__).parent
+                if agent == 'claude':
+                    rule_template = module_dir / 'locales' / locale_dir / 'agent-rules' / 'CLAUDE.md'
+                else:
+                    rule_template = module_dir / 'locales' / locale_dir / 'agent-rules' / 'agent.md'
+
+                if rule_template.exists():
+                    with open(rule_template, 'r', encoding='utf-8') as f:
+                        rule_content = f.read()
+                else:
+                    rule_content = None
+            except:
+                rule_content = None
+
+        # Write the rule file to project root
+        if rule_content:
+            target_rule_file = project_path / rule_filename
+
+            # Check if rule file already exists
+            if target_rule_file.exists():
+                # Read existing file and check for walkthrough section
+                with open(target_rule_file, 'r', encoding='utf-8') as f:
+                    existing_content = f.read()
+
+                # Check if walkthrough section already exists
+                if 'Walkthrough Memory Loading' not in existing_content and 'walkthrough' not in existing_content.lower():
+                    # Extract just the walkthrough section from template
+                    walkthrough_section = ""
+                    if '## Walkthrough Memory Loading' in rule_content:
+                        # Find the walkthrough section
+                        start_idx = rule_content.find('## Walkthrough Memory Loading')
+                        # Find next section (starts with ##) or end of file
+                        next_section_idx = rule_content.find('\n## ', start_idx + 1)
+                        if next_section_idx == -1:
+                            next_section_idx = rule_content.find('\n# ', start_idx + 1)
+
+                        if next_section_idx != -1:
+                            walkthrough_section = rule_content[start_idx:next_section_idx]
+                        else:
+                            # If no next section found, take everything after walkthrough heading
+                            walkthrough_section = rule_content[start_idx:]
+
+                    if walkthrough_section:
+                        # Append walkthrough section to existing file
+                        updated_content = existing_content.rstrip() + '\n\n' + walkthrough_section.strip() + '\n'
+                        with open(target_rule_file, 'w', encoding='utf-8') as f:
+                            f.write(updated_content)
+                        console.print(f"[green]✓[/green] Updated {rule_filename} with walkthrough memory loading instructions")
+                    else:
+                        console.print(f"[yellow]→[/yellow] {rule_filename} exists, walkthrough section not found in template")
+                else:
+                    console.print(f"[yellow]→[/yellow] {rule_filename} already contains walkthrough instructions")
+            else:
+                # Customize content based on AI assistant
+                if agent != 'claude':
+                    # Replace Claude-specific references
+                    rule_content = rule_content.replace('Claude Code (claude.ai/code)', f'{AGENT_CONFIG[agent]["name"]}')
+                    rule_content = rule_content.replace('.claude/', f'{AGENT_CONFIG[agent]["folder"]}')
+
+                with open(target_rule_file, 'w', encoding='utf-8') as f:
+                    f.write(rule_content)
+
+                console.print(f"[green]✓[/green] Created {rule_filename} for {AGENT_CONFIG[agent]['name']}")
+    except Exception as e:
+        # Non-critical error, just warn
+        if debug:
+            console.print(f"[yellow]Could not create agent rule file: {e}[/yellow]")
+
+
+def install_claude_settings(project_path: Path, debug: bool = False):
+    """Create or merge .claude/settings.local.json with the tool permissions Spec Mix needs."""
+    try:
+        claude_dir = project_path / '.claude'
+        claude_dir.mkdir(exist_ok=True)
+
+        settings_file = claude_dir / 'settings.local.json'
+        settings_data = {
+            "permissions": {
+                "allow": [
+                    "WebSearch",
+                    "WebFetch"
+                ],
+                "deny": [],
+                "ask": []
+            }
+        }
+
+        # Merge with existing settings if file exists
+        if settings_file.exists():
+            try:
+                with open(settings_file, 'r', encoding='utf-8') as f:
+                    existing = json.load(f)
+                # Merge allow lists (avoid duplicates)
+                existing_allow = existing.get('permissions', {}).get('allow', [])
+                for perm in settings_data['permissions']['allow']:
+                    if perm not in existing_allow:
+                        existing_allow.append(perm)
+                existing.setdefault('permissions', {})['allow'] = existing_allow
+                settings_data = existing
+            except Exception:
+                pass  # Use default if can't read existing
+
+        with open(settings_file, 'w', encoding='utf-8') as f:
+            json.dump(settings_data, f, indent=2)
+
+        console.print("[green]✓[/green] Created .claude/settings.local.json with tool permissions")
+    except Exception as e:
+        if debug:
+            console.print(f"[yellow]Could not create settings.local.json: {e}[/yellow]")
+
+
+def confirm_agent_folders(project_path: Path, agents: list[str], force: bool):
+    """Ask before merging agent templates into agent folders that already exist.
+
+    Exits if the user declines; --force skips the question.
+    """
+    for agent in agents:
+        agent_folder = AGENT_CONFIG[agent]["folder"]
+        if (project_path / agent_folder).exists():
+            if not force:
+                console.print(f"\n[yellow]Warning:[/yellow] Agent folder '{agent_folder}' already exists")
+                console.print("[yellow]Template files will be merged into it and may overwrite existing files.[/yellow]")
+                response = typer.confirm("Do you want to continue?")
+                if not response:
+                    console.print("[yellow]Operation cancelled[/yellow]")
+                    raise typer.Exit(0)
+            else:
+                console.print(f"[yellow]--force flag set: merging into existing '{agent_folder}'[/yellow]")
+
+
+def install_agents(project_path: Path, templates: dict, tracker: StepTracker | None = None, debug: bool = False):
+    """Install agent folders from fetched templates in parallel and link their commands."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def install(agent):
+        key = f"agent-{agent}"
+        if tracker:
+            tracker.start(key, "installing")
+        try:
+            zip_path, _ = templates[agent]
+            file_count = install_agent_folder(zip_path, agent, project_path)
+        except Exception as e:
+            if tracker:
+                tracker.error(key, str(e))
+            raise
+        try:
+            _, detail = link_agent_commands(project_path, agent, debug)
+        except Exception as e:
+            # The agent still works with its packaged commands
+            detail = f"commands not linked: {e}"
+        if tracker:
+            tracker.complete(key, f"{file_count} files, {detail}")
+
+    if not templates:
+        return
+    with ThreadPoolExecutor(max_workers=len(templates)) as pool:
+        # list() surfaces the first failure
+        list(pool.map(install, templates))
+
+def merge_template_archive(zip_ref: zipfile.ZipFile, project_path: Path, *, verbose: bool = False, tracker: StepTracker | None = None) -> Tuple[int, bool]:
+    """Merge a template archive into an existing directory, streaming each entry.
+
+    Entries are written straight from the archive to their destination, with a
+    single top-level directory in the archive flattened by rewriting paths.
+    Symlinked directories in the way are replaced, and .vscode/settings.json is
+    merged into an existing one rather than overwritten.
+
+    Returns (files written, whether a nested root was flattened).
+    """
+    infos = zip_ref.infolist()
+    root = _template_root([info.filename for info in infos])
+    seen_dirs = set()
+    written = 0
+
+    for info in infos:
+        rel = PurePosixPath(info.filename[len(root):])
+        if not rel.parts or rel.is_absolute() or '..' in rel.parts:
+            continue
+
+        top = rel.parts[0]
+        dest_top = project_path / top
+        dest_file = project_path.joinpath(*rel.parts)
+
+        if len(rel.parts) == 1 and not info.is_dir():
+            # Top-level file
+            if dest_file.exists() and verbose and not tracker:
+                console.print(f"[yellow]Overwriting file:[/yellow] {top}")
+        else:
+            if top not in seen_dirs:
+                seen_dirs.add(top)
+                if dest_top.is_symlink():
+                    # Handle symlinks first - replace with a real directory
+                    dest_top.unlink()
+                elif dest_top.exists() and verbose and not tracker:
+                    console.print(f"[yellow]Merging directory:[/yellow] {top}")
+
+            if info.is_dir():
+                dest_file.mkdir(parents=True, exist_ok=True)
+                continue
+
+            # Check for symlinks in parent path and remove them
+            for parent in dest_file.parents:
+                if parent == dest_top or parent == project_path:
+                    break
+                if parent.is_symlink():
+                    parent.unlink()
+                    break
+
+        dest_file.parent.mkdir(parents=True, exist_ok=True)
+        # Special handling for .vscode/settings.json - merge instead of overwrite
+        if dest_file.name == "settings.json" and dest_file.parent.name == ".vscode":
+            handle_vscode_settings(zip_ref.read(info), dest_file, PurePosixPath(*rel.parts[1:]), verbose, tracker)
+        else:
+            with zip_ref.open(info) as src, open(dest_file, 'wb') as dst:
+                shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+        written += 1
+
+    return written, bool(root)
+
+
+def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, language: str = "en", mission: str = "software-dev", from_cache: bool = False, prefetched: Tuple[Path, dict] | None = None) -> Path:
     """Download the latest release and extract it to create a new project.
     Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
+    Pass ``prefetched`` (a result of download_template_from_github) to skip the download.
     """
     current_dir = Path.cwd()
 
     if tracker:
         tracker.start("fetch", "contacting GitHub API")
     try:
-        zip_path, meta = download_template_from_github(
-            ai_assistant,
-            current_dir,
-            script_type=script_type,
-            verbose=verbose and tracker is None,
-            show_progress=(tracker is None),
-            client=client,
-            debug=debug,
-            github_token=github_token
-        )
+        if prefetched:
+            zip_path, meta = prefetched
+        else:
+            zip_path, meta = download_template_from_github(
+                ai_assistant,
+                current_dir,
+                script_type=script_type,
+                verbose=verbose and tracker is None,
+                show_progress=(tracker is None),
+                client=client,
+                debug=debug,
+                github_token=github_token,
+                from_cache=from_cache
+            )
         if tracker:
-            tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes)")
+            source = " cached" if meta['cache_hit'] else ""
+            tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes{source})")
             tracker.add("download", "Download template")
             tracker.complete("download", meta['filename'])
     except Exception as e:
@@ -754,61 +1417,17 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
                 console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
 
             if is_current_dir:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-                    zip_ref.extractall(temp_path)
-
-                    extracted_items = list(temp_path.iterdir())
-                    if tracker:
-                        tracker.start("extracted-summary")
-                        tracker.complete("extracted-summary", f"temp {len(extracted_items)} items")
-                    elif verbose:
-                        console.print(f"[cyan]Extracted {len(extracted_items)} items to temp location[/cyan]")
-
-                    source_dir = temp_path
-                    if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                        source_dir = extracted_items[0]
-                        if tracker:
-                            tracker.add("flatten", "Flatten nested directory")
-                            tracker.complete("flatten")
-                        elif verbose:
-                            console.print(f"[cyan]Found nested directory structure[/cyan]")
-
-                    for item in source_dir.iterdir():
-                        dest_path = project_path / item.name
-                        if item.is_dir():
-                            # Handle symlinks first - remove and replace
-                            if dest_path.is_symlink():
-                                dest_path.unlink()
-                                shutil.copytree(item, dest_path)
-                            elif dest_path.exists():
-                                if verbose and not tracker:
-                                    console.print(f"[yellow]Merging directory:[/yellow] {item.name}")
-                                for sub_item in item.rglob('*'):
-                                    if sub_item.is_file():
-                                        rel_path = sub_item.relative_to(item)
-                                        dest_file = dest_path / rel_path
-                                        # Check for symlinks in parent path and remove them
-                                        for parent in dest_file.parents:
-                                            if parent == dest_path or parent == project_path:
-                                                break
-                                            if parent.is_symlink():
-                                                parent.unlink()
-                                                break
-                                        dest_file.parent.mkdir(parents=True, exist_ok=True)
-                                        # Special handling for .vscode/settings.json - merge instead of overwrite
-                                        if dest_file.name == "settings.json" and dest_file.parent.name == ".vscode":
-                                            handle_vscode_settings(sub_item, dest_file, rel_path, verbose, tracker)
-                                        else:
-                                            shutil.copy2(sub_item, dest_file)
-                            else:
-                                shutil.copytree(item, dest_path)
-                        else:
-                            if dest_path.exists() and verbose and not tracker:
-                                console.print(f"[yellow]Overwriting file:[/yellow] {item.name}")
-                            shutil.copy2(item, dest_path)
-                    if verbose and not tracker:
-                        console.print(f"[cyan]Template files merged into current directory[/cyan]")
+                written, flattened = merge_template_archive(zip_ref, project_path, verbose=verbose, tracker=tracker)
+                if tracker:
+                    tracker.start("extracted-summary")
+                    tracker.complete("extracted-summary", f"{written} files merged")
+                    if flattened:
+                        tracker.add("flatten", "Flatten nested directory")
+                        tracker.complete("flatten")
+                elif verbose:
+                    if flattened:
+                        console.print(f"[cyan]Found nested directory structure[/cyan]")
+                    console.print(f"[cyan]Template files merged into current directory[/cyan]")
             else:
                 zip_ref.extractall(project_path)
 
@@ -983,7 +1602,11 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
         if tracker:
             tracker.add("cleanup", "Remove temporary archive")
 
-        if zip_path.exists():
+        if meta['cached']:
+            # The archive lives in the template cache for the next run
+            if tracker:
+                tracker.skip("cleanup", "kept in template cache")
+        elif zip_path.exists():
             zip_path.unlink()
             if tracker:
                 tracker.complete("cleanup")
@@ -1040,7 +1663,7 @@ def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None =
 @app.command()
 def init(
     project_name: str = typer.Argument(None, help="Name for your new project directory (optional if using --here, or use '.' for current directory)"),
-    ai_assistant: str = typer.Option(None, "--ai", help="AI assistant to use: claude, copilot, gemini, cursor-agent, kiro, windsurf, antigravity, or codex"),
+    ai_assistant: str = typer.Option(None, "--ai", help="AI assistant to use: claude, copilot, gemini, cursor-agent, kiro, windsurf, antigravity, or codex (comma-separated for several)"),
     script_type: str = typer.Option(None, "--script", help="Script type to use: sh or ps"),
     language: str = typer.Option(None, "--lang", help="Language to use: en, ko (default: en)"),
     mission: str = typer.Option(None, "--mission", help="Mission to use: software-dev, product-strategy, research (default: software-dev)"),
@@ -1052,6 +1675,7 @@ def init(
     skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
     debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and extraction failures"),
     github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    from_cache: bool = typer.Option(False, "--from-cache", help="Use only the local template cache (no network access)"),
 ):
     """
     Initialize a new Spec Mix project from the latest template.
@@ -1068,6 +1692,7 @@ def init(
         specify init my-project
         specify init my-project --ai claude
         specify init my-project --ai copilot --no-git
+        specify init my-project --ai claude,gemini,cursor-agent
         specify init --ignore-agent-tools my-project
         specify init . --ai claude         # Initialize in current directory
         specify init .                     # Initialize in current directory (interactive AI selection)
@@ -1076,6 +1701,7 @@ def init(
         specify init --here --ai codebuddy
         specify init --here
         specify init --here --force  # Skip confirmation when current directory not empty
+        specify init my-project --ai claude --from-cache  # Offline, from the template cache
     """
 
     show_banner()
@@ -1142,10 +1768,13 @@ def init(
             console.print("[yellow]Git not found - will skip repository initialization[/yellow]")
 
     if ai_assistant:
-        if ai_assistant not in AGENT_CONFIG:
-            console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
+        # The first agent is the primary one (rule file, config ai_assistant)
+        selected_ais = parse_agent_list(ai_assistant)
+        invalid = [agent for agent in selected_ais if agent not in AGENT_CONFIG]
+        if invalid or not selected_ais:
+            console.print(f"[red]Error:[/red] Invalid AI assistant '{', '.join(invalid) or ai_assistant}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
             raise typer.Exit(1)
-        selected_ai = ai_assistant
+        selected_ai = selected_ais[0]
     else:
         # Create options dict for selection (agent_key: display_name)
         ai_choices = {key: config["name"] for key, config in AGENT_CONFIG.items()}
@@ -1154,24 +1783,31 @@ def init(
             "Choose your AI assistant:",
             "claude"
         )
+        selected_ais = [selected_ai]
+
+    # The primary agent's folder is covered by the --here merge prompt above;
+    # additional agents are installed into their folders separately
+    if here:
+        confirm_agent_folders(project_path, selected_ais[1:], force)
 
     if not ignore_agent_tools:
-        agent_config = AGENT_CONFIG.get(selected_ai)
-        if agent_config and agent_config["requires_cli"]:
-            install_url = agent_config["install_url"]
-            if not check_tool(selected_ai):
-                error_panel = Panel(
-                    f"[cyan]{selected_ai}[/cyan] not found\n"
-                    f"Install from: [cyan]{install_url}[/cyan]\n"
-                    f"{agent_config['name']} is required to continue with this project type.\n\n"
-                    "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
-                    title="[red]Agent Detection Error[/red]",
-                    border_style="red",
-                    padding=(1, 2)
-                )
-                console.print()
-                console.print(error_panel)
-                raise typer.Exit(1)
+        for agent_key in selected_ais:
+            agent_config = AGENT_CONFIG.get(agent_key)
+            if agent_config and agent_config["requires_cli"]:
+                install_url = agent_config["install_url"]
+                if not check_tool(agent_key):
+                    error_panel = Panel(
+                        f"[cyan]{agent_key}[/cyan] not found\n"
+                        f"Install from: [cyan]{install_url}[/cyan]\n"
+                        f"{agent_config['name']} is required to continue with this project type.\n\n"
+                        "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
+                        title="[red]Agent Detection Error[/red]",
+                        border_style="red",
+                        padding=(1, 2)
+                    )
+                    console.print()
+                    console.print(error_panel)
+                    raise typer.Exit(1)
 
     if script_type:
         if script_type not in SCRIPT_TYPE_CHOICES:
@@ -1230,7 +1866,7 @@ def init(
     locale_manager = get_locale_manager()
     locale_manager.set_locale(selected_lang)
 
-    console.print(f"[cyan]Selected AI assistant:[/cyan] {selected_ai}")
+    console.print(f"[cyan]Selected AI assistant:[/cyan] {', '.join(selected_ais)}")
     console.print(f"[cyan]Selected script type:[/cyan] {selected_script}")
     console.print(f"[cyan]Selected language:[/cyan] {AVAILABLE_LANGUAGES[selected_lang]}")
     console.print(f"[cyan]Selected mission:[/cyan] {AVAILABLE_MISSIONS[selected_mission]}")
@@ -1243,7 +1879,7 @@ def init(
     tracker.add("precheck", "Check required tools")
     tracker.complete("precheck", "ok")
     tracker.add("ai-select", "Select AI assistant")
-    tracker.complete("ai-select", f"{selected_ai}")
+    tracker.complete("ai-select", ', '.join(selected_ais))
     tracker.add("script-select", "Select script type")
     tracker.complete("script-select", selected_script)
     for key, label in [
@@ -1252,6 +1888,7 @@ def init(
         ("extract", "Extract template"),
         ("zip-list", "Archive contents"),
         ("extracted-summary", "Extraction summary"),
+        *[(f"agent-{agent}", f"Install {AGENT_CONFIG[agent]['name']}") for agent in selected_ais[1:]],
         ("chmod", "Ensure scripts executable"),
         ("cleanup", "Cleanup"),
         ("git", "Initialize git repository"),
@@ -1262,14 +1899,32 @@ def init(
     # Track git error message outside Live context so it persists
     git_error_message = None
 
+    from rich.live import Live
     with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
         tracker.attach_refresh(lambda: live.update(tracker.render()))
         try:
             verify = not skip_tls
-            local_ssl_context = ssl_context if verify else False
+            import httpx
+            local_ssl_context = get_ssl_context() if verify else False
             local_client = httpx.Client(verify=local_ssl_context)
 
-            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token, language=selected_lang, mission=selected_mission)
+            # Several agents: resolve the release once and fetch all archives concurrently
+            prefetched = None
+            extra_templates = {}
+            if len(selected_ais) > 1:
+                tracker.start("fetch", f"{len(selected_ais)} templates in parallel")
+                extra_templates = fetch_templates(selected_ais, current_dir, script_type=selected_script, client=local_client, debug=debug, github_token=github_token, from_cache=from_cache)
+                prefetched = extra_templates.pop(selected_ai)
+
+            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token, language=selected_lang, mission=selected_mission, from_cache=from_cache, prefetched=prefetched)
+
+            # Shared files come from the primary template; other agents only add their folders
+            try:
+                install_agents(project_path, extra_templates, tracker=tracker, debug=debug)
+            finally:
+                for zip_path, meta in extra_templates.values():
+                    if not meta['cached'] and zip_path.exists():
+                        zip_path.unlink()
 
             ensure_executable_scripts(project_path, tracker=tracker)
 
@@ -1335,165 +1990,22 @@ def init(
             'script_type': selected_script,
             'spec_mix_version': spec_mix_version
         }
+        if len(selected_ais) > 1:
+            config_data['agents'] = selected_ais
 
-        config_file = specify_dir / 'config.json'
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, indent=2, ensure_ascii=False)
+        from .project_config import save_project_config
+        save_project_config(config_data, project_path)
 
         # Also save version in separate file for easy access
         version_file = specify_dir / 'version'
         with open(version_file, 'w', encoding='utf-8') as f:
             f.write(spec_mix_version)
 
-        # Copy AI agent-specific main rule file
-        try:
-            agent_rule_files = {
-                'claude': 'CLAUDE.md',
-                'copilot': 'agent.md',
-                'codex': 'agent.md',
-                'gemini': 'GEMINI.md',
-                'cursor-agent': 'CURSOR.md',
-                'qwen': 'QWEN.md',
-                'opencode': 'OPENCODE.md',
-                'windsurf': 'WINDSURF.md',
-                'kilocode': 'KILOCODE.md',
-                'auggie': 'AUGGIE.md',
-                'codebuddy': 'CODEBUDDY.md',
-                'amp': 'AMP.md',
-                'antigravity': 'ANTIGRAVITY.md',
-                'roo': 'ROO.md',
-                'q': 'Q.md'
-            }
-
-            # Determine which rule file to use
-            rule_filename = agent_rule_files.get(selected_ai, 'agent.md')
-
-            # Try to find the template file
-            import pkg_resources
-            rule_template_path = None
-
-            # Determine the locale directory
-            locale_dir = 'ko' if selected_lang == 'ko' else 'en'
-
-            # First try agent-specific file
-            try:
-                if selected_ai == 'claude':
-                    # For Claude, use CLAUDE.md
-                    rule_content = pkg_resources.resource_string('specmix', f'locales/{locale_dir}/agent-rules/CLAUDE.md').decode('utf-8')
-                else:
-                    # For others, try to use generic agent.md
-                    rule_content = pkg_resources.resource_string('specmix', f'locales/{locale_dir}/agent-rules/agent.md').decode('utf-8')
-            except:
-                # Fallback: try to read from local file system
-                try:
-                    module_dir = Path(__file__).parent
-                    if selected_ai == 'claude':
-                        rule_template = module_dir / 'locales' / locale_dir / 'agent-rules' / 'CLAUDE.md'
-                    else:
-                        rule_template = module_dir / 'locales' / locale_dir / 'agent-rules' / 'agent.md'
-
-                    if rule_template.exists():
-                        with open(rule_template, 'r', encoding='utf-8') as f:
-                            rule_content = f.read()
-                    else:
-                        rule_content = None
-                except:
-                    rule_content = None
-
-            # Write the rule file to project root
-            if rule_content:
-                target_rule_file = project_path / rule_filename
-
-                # Check if rule file already exists
-                if target_rule_file.exists():
-                    # Read existing file and check for walkthrough section
-                    with open(target_rule_file, 'r', encoding='utf-8') as f:
-                        existing_content = f.read()
-
-                    # Check if walkthrough section already exists
-                    if 'Walkthrough Memory Loading' not in existing_content and 'walkthrough' not in existing_content.lower():
-                        # Extract just the walkthrough section from template
-                        walkthrough_section = ""
-                        if '## Walkthrough Memory Loading' in rule_content:
-                            # Find the walkthrough section
-                            start_idx = rule_content.find('## Walkthrough Memory Loading')
-                            # Find next section (starts with ##) or end of file
-                            next_section_idx = rule_content.find('\n## ', start_idx + 1)
-                            if next_section_idx == -1:
-                                next_section_idx = rule_content.find('\n# ', start_idx + 1)
-
-                            if next_section_idx != -1:
-                                walkthrough_section = rule_content[start_idx:next_section_idx]
-                            else:
-                                # If no next section found, take everything after walkthrough heading
-                                walkthrough_section = rule_content[start_idx:]
-
-                        if walkthrough_section:
-                            # Append walkthrough section to existing file
-                            updated_content = existing_content.rstrip() + '\n\n' + walkthrough_section.strip() + '\n'
-                            with open(target_rule_file, 'w', encoding='utf-8') as f:
-                                f.write(updated_content)
-                            console.print(f"[green]✓[/green] Updated {rule_filename} with walkthrough memory loading instructions")
-                        else:
-                            console.print(f"[yellow]→[/yellow] {rule_filename} exists, walkthrough section not found in template")
-                    else:
-                        console.print(f"[yellow]→[/yellow] {rule_filename} already contains walkthrough instructions")
-                else:
-                    # Customize content based on AI assistant
-                    if selected_ai != 'claude':
-                        # Replace Claude-specific references
-                        rule_content = rule_content.replace('Claude Code (claude.ai/code)', f'{AGENT_CONFIG[selected_ai]["name"]}')
-                        rule_content = rule_content.replace('.claude/', f'{AGENT_CONFIG[selected_ai]["folder"]}')
-
-                    with open(target_rule_file, 'w', encoding='utf-8') as f:
-                        f.write(rule_content)
-
-                    console.print(f"[green]✓[/green] Created {rule_filename} for {AGENT_CONFIG[selected_ai]['name']}")
-        except Exception as e:
-            # Non-critical error, just warn
-            if debug:
-                console.print(f"[yellow]Could not create agent rule file: {e}[/yellow]")
-
-        # Create .claude/settings.local.json for Claude Code
-        if selected_ai == 'claude':
-            try:
-                claude_dir = project_path / '.claude'
-                claude_dir.mkdir(exist_ok=True)
-
-                settings_file = claude_dir / 'settings.local.json'
-                settings_data = {
-                    "permissions": {
-                        "allow": [
-                            "WebSearch",
-                            "WebFetch"
-                        ],
-                        "deny": [],
-                        "ask": []
-                    }
-                }
-
-                # Merge with existing settings if file exists
-                if settings_file.exists():
-                    try:
-                        with open(settings_file, 'r', encoding='utf-8') as f:
-                            existing = json.load(f)
-                        # Merge allow lists (avoid duplicates)
-                        existing_allow = existing.get('permissions', {}).get('allow', [])
-                        for perm in settings_data['permissions']['allow']:
-                            if perm not in existing_allow:
-                                existing_allow.append(perm)
-                        existing.setdefault('permissions', {})['allow'] = existing_allow
-                        settings_data = existing
-                    except Exception:
-                        pass  # Use default if can't read existing
-
-                with open(settings_file, 'w', encoding='utf-8') as f:
-                    json.dump(settings_data, f, indent=2)
-
-                console.print("[green]✓[/green] Created .claude/settings.local.json with tool permissions")
-            except Exception as e:
-                if debug:
-                    console.print(f"[yellow]Could not create settings.local.json: {e}[/yellow]")
+        # Every selected agent gets its rule file; Claude also gets its settings
+        for agent in selected_ais:
+            install_agent_rule_file(project_path, agent, selected_lang, debug)
+            if agent == 'claude':
+                install_claude_settings(project_path, debug)
 
         # Set active mission
         if HAS_MISSION:
@@ -1679,12 +2191,13 @@ def check():
 
 @app.command()
 def add(
-    agent: str = typer.Argument(None, help="AI agent to add: claude, copilot, gemini, cursor-agent, kiro, windsurf, antigravity, or codex"),
+    agent: str = typer.Argument(None, help="AI agent to add: claude, copilot, gemini, cursor-agent, kiro, windsurf, antigravity, or codex (comma-separated for several)"),
     list_agents: bool = typer.Option(False, "--list", "-l", help="List all available AI agents"),
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing agent files without confirmation"),
     script_type: str = typer.Option(None, "--script", help="Script type to use: sh or ps (default: auto-detect)"),
     debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output"),
     github_token: str = typer.Option(None, "--github-token", help="GitHub token for API requests"),
+    from_cache: bool = typer.Option(False, "--from-cache", help="Use only the local template cache (no network access)"),
 ):
     """
     Add support for an additional AI agent to an existing Spec Mix project.
@@ -1696,8 +2209,10 @@ def add(
         spec-mix add --list              # List available agents
         spec-mix add -l                  # List available agents (short)
         spec-mix add codex               # Add Codex support
+        spec-mix add codex,gemini        # Add several agents at once
         spec-mix add claude --force      # Add Claude with overwrite
         spec-mix add gemini --script sh  # Add Gemini with sh scripts
+        spec-mix add codex --from-cache  # Add Codex offline from the template cache
     """
     show_banner()
 
@@ -1737,12 +2252,12 @@ def add(
         console.print("\n[dim]Example: spec-mix add codex[/dim]")
         raise typer.Exit(1)
 
-    # Add the specified agent
-    _add_agent_impl(agent, force, script_type, debug, github_token)
+    # Add the specified agent(s)
+    _add_agent_impl(parse_agent_list(agent), force, script_type, debug, github_token, from_cache)
 
 
-def _add_agent_impl(agent: str, force: bool, script_type: str, debug: bool, github_token: str):
-    """Internal implementation for adding an agent."""
+def _add_agent_impl(agents: list[str], force: bool, script_type: str, debug: bool, github_token: str, from_cache: bool = False):
+    """Internal implementation for adding one or more agents."""
     # Check if current directory is a Spec Mix project
     project_path = Path.cwd()
     spec_mix_dir = project_path / ".spec-mix"
@@ -1752,44 +2267,24 @@ def _add_agent_impl(agent: str, force: bool, script_type: str, debug: bool, gith
         console.print("\n[dim]Run 'spec-mix init' first to create a project.[/dim]")
         raise typer.Exit(1)
 
-    # Validate agent
-    if agent not in AGENT_CONFIG:
-        console.print(f"[red]Error:[/red] Invalid AI agent '{agent}'")
-        console.print(f"[dim]Available agents: {', '.join(AGENT_CONFIG.keys())}[/dim]")
-        raise typer.Exit(1)
+    # Validate agents
+    for agent in agents:
+        if agent not in AGENT_CONFIG:
+            console.print(f"[red]Error:[/red] Invalid AI agent '{agent}'")
+            console.print(f"[dim]Available agents: {', '.join(AGENT_CONFIG.keys())}[/dim]")
+            raise typer.Exit(1)
 
-    agent_config = AGENT_CONFIG[agent]
-    agent_name = agent_config["name"]
-    agent_folder = agent_config["folder"]
-    agent_path = project_path / agent_folder
-
-    console.print(f"[cyan]Adding {agent_name} support to project...[/cyan]")
-
-    # Check if agent folder already exists
-    if agent_path.exists():
-        if not force:
-            console.print(f"\n[yellow]Warning:[/yellow] Agent folder '{agent_folder}' already exists")
-            console.print("[yellow]Existing files will be overwritten.[/yellow]")
-            response = typer.confirm("Do you want to continue?")
-            if not response:
-                console.print("[yellow]Operation cancelled[/yellow]")
-                raise typer.Exit(0)
-        else:
-            console.print(f"[yellow]--force flag set: overwriting existing '{agent_folder}'[/yellow]")
+    agent_names = ", ".join(AGENT_CONFIG[agent]["name"] for agent in agents)
+    console.print(f"[cyan]Adding {agent_names} support to project...[/cyan]")
 
-    # Read project config for language and mission
-    config_file = spec_mix_dir / "config.json"
-    selected_lang = "en"
-    selected_mission = "software-dev"
+    # Check if agent folders already exist
+    confirm_agent_folders(project_path, agents, force)
 
-    if config_file.exists():
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            selected_lang = config.get('language', 'en')
-            selected_mission = config.get('mission', 'software-dev')
-        except Exception:
-            pass
+    # Read project config for language, mission and script type
+    from .project_config import load_project_settings, save_project_config
+    settings = load_project_settings(project_path)
+    selected_lang = settings.language
+    selected_mission = settings.mission
 
     # Determine script type
     if script_type:
@@ -1799,26 +2294,19 @@ def _add_agent_impl(agent: str, force: bool, script_type: str, debug: bool, gith
         selected_script = script_type
     else:
         # Auto-detect from existing config or OS
-        if config_file.exists():
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                selected_script = config.get('script_type', 'ps' if os.name == 'nt' else 'sh')
-            except Exception:
-                selected_script = 'ps' if os.name == 'nt' else 'sh'
-        else:
-            selected_script = 'ps' if os.name == 'nt' else 'sh'
+        selected_script = settings.get('script_type', 'ps' if os.name == 'nt' else 'sh')
 
     console.print(f"[dim]Language: {selected_lang}, Mission: {selected_mission}, Script: {selected_script}[/dim]")
 
-    # Download template to temp directory
-    tracker = StepTracker(f"Add {agent_name}")
+    # Download templates to temp directory
+    tracker = StepTracker(f"Add {agent_names}")
 
     tracker.add("fetch", "Fetch latest release")
-    tracker.add("extract", "Extract agent files")
-    tracker.add("link", "Link commands")
+    for agent in agents:
+        tracker.add(f"agent-{agent}", f"Install {AGENT_CONFIG[agent]['name']}")
     tracker.add("cleanup", "Cleanup")
 
+    from rich.live import Live
     with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
         tracker.attach_refresh(lambda: live.update(tracker.render()))
 
@@ -1826,126 +2314,33 @@ def _add_agent_impl(agent: str, force: bool, script_type: str, debug: bool, gith
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir)
 
-                # Download template
+                # Download templates (concurrently when there are several)
                 tracker.start("fetch", "contacting GitHub API")
 
                 verify = True
-                local_ssl_context = ssl_context if verify else False
+                import httpx
+                local_ssl_context = get_ssl_context() if verify else False
                 local_client = httpx.Client(verify=local_ssl_context)
 
                 try:
-                    zip_path, meta = download_template_from_github(
-                        agent,
+                    templates = fetch_templates(
+                        agents,
                         temp_path,
                         script_type=selected_script,
-                        verbose=False,
-                        show_progress=False,
                         client=local_client,
                         debug=debug,
-                        github_token=github_token
+                        github_token=github_token,
+                        from_cache=from_cache
                     )
-                    tracker.complete("fetch", f"release {meta['release']}")
+                    meta = next(iter(templates.values()))[1]
+                    cached = " (cached)" if all(m['cache_hit'] for _, m in templates.values()) else ""
+                    tracker.complete("fetch", f"release {meta['release']}{cached}")
                 except Exception as e:
                     tracker.error("fetch", str(e))
                     raise
 
-                # Extract to temp directory
-                tracker.start("extract", "extracting files")
-
-                extract_path = temp_path / "extracted"
-                extract_path.mkdir()
-
-                try:
-                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        zip_ref.extractall(extract_path)
-
-                    # Find the agent folder in extracted content
-                    extracted_items = list(extract_path.iterdir())
-
-                    # Handle nested directory structure
-                    source_dir = extract_path
-                    if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                        source_dir = extracted_items[0]
-
-                    # Find agent folder
-                    source_agent_path = source_dir / agent_folder.rstrip('/')
-
-                    if not source_agent_path.exists():
-                        # Try without trailing slash
-                        source_agent_path = source_dir / agent_folder.rstrip('/').lstrip('.')
-                        if not source_agent_path.exists():
-                            tracker.error("extract", f"Agent folder not found in template")
-                            raise typer.Exit(1)
-
-                    # Copy agent folder to project
-                    if agent_path.exists():
-                        shutil.rmtree(agent_path)
-
-                    shutil.copytree(source_agent_path, agent_path)
-
-                    # Count copied files
-                    file_count = sum(1 for _ in agent_path.rglob('*') if _.is_file())
-                    tracker.complete("extract", f"{file_count} files")
-
-                except Exception as e:
-                    tracker.error("extract", str(e))
-                    raise
-
-                # Link commands to mission
-                tracker.start("link", "linking commands")
-
-                try:
-                    mission_commands_dir = spec_mix_dir / "active-mission" / "commands"
-
-                    # Determine agent commands directory
-                    if agent == "antigravity":
-                        agent_commands_dir = agent_path / "workflows"
-                    else:
-                        agent_commands_dir = agent_path / "commands"
-
-                    # Check if mission commands exist and have files
-                    mission_has_commands = (
-                        mission_commands_dir.exists() and
-                        any(mission_commands_dir.glob("*.md"))
-                    )
-
-                    if mission_has_commands:
-                        # Remove existing and create symlink
-                        if agent_commands_dir.exists() or agent_commands_dir.is_symlink():
-                            if agent_commands_dir.is_symlink():
-                                agent_commands_dir.unlink()
-                            else:
-                                shutil.rmtree(agent_commands_dir)
-
-                        try:
-                            rel_target = os.path.relpath(mission_commands_dir, agent_commands_dir.parent)
-                            agent_commands_dir.symlink_to(rel_target, target_is_directory=True)
-                            cmd_count = len(list(mission_commands_dir.glob("*.md")))
-                            tracker.complete("link", f"symlinked ({cmd_count} commands)")
-                        except (OSError, NotImplementedError) as symlink_err:
-                            if debug:
-                                console.print(f"[yellow]Symlink failed: {symlink_err}, falling back to copy[/yellow]")
-                            # Fallback: copy files
-                            agent_commands_dir.mkdir(parents=True, exist_ok=True)
-                            cmd_count = 0
-                            for cmd_file in mission_commands_dir.glob("*.md"):
-                                shutil.copy2(cmd_file, agent_commands_dir / cmd_file.name)
-                                cmd_count += 1
-                            tracker.complete("link", f"copied {cmd_count} commands")
-                    else:
-                        # No mission commands available - keep downloaded package commands if any
-                        if agent_commands_dir.exists() and any(agent_commands_dir.glob("*")):
-                            cmd_count = len(list(agent_commands_dir.glob("*")))
-                            tracker.complete("link", f"using package commands ({cmd_count} files)")
-                        else:
-                            tracker.skip("link", "no commands available")
-                            if debug:
-                                console.print(f"[yellow]No commands in active-mission or package[/yellow]")
-
-                except Exception as e:
-                    tracker.error("link", str(e))
-                    if debug:
-                        console.print(f"[yellow]Link error: {e}[/yellow]")
+                # Extract agent folders and link their commands
+                install_agents(project_path, templates, tracker=tracker, debug=debug)
 
                 tracker.complete("cleanup", "temp files removed")
 
@@ -1956,32 +2351,28 @@ def _add_agent_impl(agent: str, force: bool, script_type: str, debug: bool, gith
 
     console.print(tracker.render())
 
-    # Update config with new agent (as additional agent)
+    # Update config with new agents (as additional agents)
     try:
-        if config_file.exists():
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-
-            # Add to agents list if not exists
-            agents = config.get('agents', [config.get('ai_assistant', 'claude')])
-            if agent not in agents:
-                agents.append(agent)
-            config['agents'] = agents
-
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+        if settings.exists:
+            config = settings.to_dict()
+            existing = config.get('agents', [config.get('ai_assistant', 'claude')])
+            config['agents'] = existing + [agent for agent in agents if agent not in existing]
+            save_project_config(config, project_path)
     except Exception:
         pass
 
-    console.print(f"\n[bold green]✓ {agent_name} support added successfully![/bold green]")
+    for agent in agents:
+        agent_config = AGENT_CONFIG[agent]
+        agent_name = agent_config["name"]
+        console.print(f"\n[bold green]✓ {agent_name} support added successfully![/bold green]")
 
-    # Show next steps
-    if agent_config["requires_cli"]:
-        install_url = agent_config["install_url"]
-        console.print(f"\n[dim]Make sure {agent_name} CLI is installed:[/dim]")
-        console.print(f"[cyan]{install_url}[/cyan]")
-    else:
-        console.print(f"\n[dim]{agent_name} is IDE-based. Open your project in the IDE to use the commands.[/dim]")
+        # Show next steps
+        if agent_config["requires_cli"]:
+            install_url = agent_config["install_url"]
+            console.print(f"\n[dim]Make sure {agent_name} CLI is installed:[/dim]")
+            console.print(f"[cyan]{install_url}[/cyan]")
+        else:
+            console.print(f"\n[dim]{agent_name} is IDE-based. Open your project in the IDE to use the commands.[/dim]")
 
 
 @app.command()
@@ -2042,10 +2433,20 @@ def migrate(
 
 
 @app.command()
-def mcp():
+def mcp(
+    scan_workers: Optional[int] = typer.Option(None, "--scan-workers", help="Features read in parallel for project context (default: 8, 1 = serial)"),
+    tool_workers: Optional[int] = typer.Option(None, "--tool-workers", help="Tool calls executed concurrently (default: 4)"),
+    tool_timeout: Optional[float] = typer.Option(None, "--tool-timeout", help="Seconds before a tool call is answered with a timeout error (default: 60)"),
+):
     """Run the Spec Mix MCP server."""
     import asyncio
-    from .mcp_server import run
+    from .mcp_server import run, set_tool_limits, DEFAULT_TOOL_WORKERS, DEFAULT_TOOL_TIMEOUT
+    if tool_workers is not None or tool_timeout is not None:
+        set_tool_limits(tool_workers or DEFAULT_TOOL_WORKERS,
+                        tool_timeout if tool_timeout is not None else DEFAULT_TOOL_TIMEOUT)
+    if scan_workers is not None:
+        from .dashboard import set_scan_workers
+        set_scan_workers(scan_workers)
     asyncio.run(run())
 
 
@@ -2177,15 +2578,8 @@ def note(
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # Get agent info if available
-        config_file = spec_mix_dir / "config.json"
-        agent = "unknown"
-        if config_file.exists():
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                agent = config.get('ai_assistant', 'unknown')
-            except Exception:
-                pass
+        from .project_config import load_project_settings
+        agent = load_project_settings(project_path).ai_assistant or 'unknown'
 
         # Create or append to notes file
         note_entry = f"## {timestamp}\n**Agent**: {agent}\n\n{message}\n\n---\n\n"
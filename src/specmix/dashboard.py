@@ -5,20 +5,317 @@ Provides a web-based interface to view features, kanban boards, and artifacts.
 """
 
 import os
+import re
+import gzip
 import json
+import hashlib
 import secrets
+import subprocess
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 from typing import Dict, List, Any, Optional
 import threading
+import time
 import signal
 import sys
 
+# Brotli is optional; gzip is always available
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# msgpack is optional; JSON is always available
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
 # Dashboard configuration
 DEFAULT_PORT = 9237
 MAX_PORT_ATTEMPTS = 100
 
+# Concurrency limits
+DEFAULT_WORKERS = 8            # Worker threads serving requests
+DEFAULT_REQUEST_TIMEOUT = 30   # Socket idle timeout per connection (seconds)
+DEFAULT_MAX_GIT_PROCESSES = 4  # In-flight git subprocesses across all requests
+GIT_TIMEOUT = 20               # Timeout for a single git command, slot wait included (seconds)
+INDEX_POLL_INTERVAL = 1.0      # How often the project index checks for changes (seconds)
+COMMIT_REFS_TTL = 2.0          # Seconds commit lookups reuse the last `git show-ref` result
+DEFAULT_MAX_EVENT_STREAMS = 4  # Concurrent /api/events connections
+EVENT_KEEPALIVE = 15           # Seconds between keepalive comments on idle streams
+EVENT_BACKLOG = 256            # Change events kept for slow stream readers
+DEFAULT_DIFF_MAX_BYTES = 1024 * 1024  # Diff bytes sent per response before paging
+DIFF_CHUNK_SIZE = 64 * 1024    # Bytes read from git at a time
+DEFAULT_SCAN_WORKERS = 8       # Threads reading features during a full scan (1 = serial)
+FILE_CACHE_ENTRIES = 512       # Files kept per parse/index/lane-map cache
+MAX_PAGE_SIZE = 1000           # Largest ?limit= accepted by list endpoints
+
+_git_slots = threading.BoundedSemaphore(DEFAULT_MAX_GIT_PROCESSES)
+
+# Threads used by scan_all_features() and the project index (see set_scan_workers)
+_scan_workers = DEFAULT_SCAN_WORKERS
+_scan_pool: Optional[ThreadPoolExecutor] = None
+_scan_pool_lock = threading.Lock()
+
+# Response compression
+STATIC_DIR = Path(__file__).parent / 'static' / 'dashboard'
+COMPRESS_MIN_SIZE = 1024       # Bodies smaller than this are sent as-is
+CONTENT_TYPES = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.json': 'application/json',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+}
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript', 'image/svg+xml')
+MSGPACK_TYPES = ('application/msgpack', 'application/x-msgpack')
+
+
+def is_compressible(content_type: str) -> bool:
+    """Check whether a content type benefits from compression"""
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def supported_encodings() -> List[str]:
+    """Content encodings the server can produce, most preferred first"""
+    return ['br', 'gzip'] if HAS_BROTLI else ['gzip']
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """Return the ETag of a resource's representation in a content encoding"""
+    return etag[:-1] + f'-{encoding}"' if encoding else etag
+
+
+def compress_body(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """
+    Compress a response body.
+
+    Args:
+        body: Uncompressed bytes
+        encoding: 'gzip' or 'br'
+        best: Use maximum compression (for assets compressed once at startup)
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=11 if best else 5)
+    return gzip.compress(body, compresslevel=9 if best else 6, mtime=0)
+
+
+def json_default(obj: Any) -> Any:
+    """Convert records such as Task to plain JSON types (json.dumps default=)"""
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# API responses are compact; whitespace only costs bytes and encode time
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=json_default)
+
+
+def encode_json(data: Any) -> str:
+    """Serialize API data to compact JSON"""
+    return _json_encoder.encode(data)
+
+
+def load_static_assets(static_dir: Path = STATIC_DIR) -> Dict[str, Dict[str, Any]]:
+    """
+    Read every dashboard static file and pre-compress it once.
+
+    Returns:
+        Dict mapping relative path (e.g. 'dashboard.js') to an asset with
+        'body', 'content_type', 'etag' and 'compressed' ({encoding: bytes})
+    """
+    assets = {}
+    if not static_dir.is_dir():
+        return assets
+
+    for file_path in static_dir.rglob('*'):
+        if not file_path.is_file():
+            continue
+        try:
+            body = file_path.read_bytes()
+        except OSError:
+            continue
+
+        content_type = CONTENT_TYPES.get(file_path.suffix.lower(), 'application/octet-stream')
+        compressed = {}
+        if is_compressible(content_type) and len(body) >= COMPRESS_MIN_SIZE:
+            for encoding in supported_encodings():
+                compressed[encoding] = compress_body(body, encoding, best=True)
+
+        assets[file_path.relative_to(static_dir).as_posix()] = {
+            'body': body,
+            'content_type': content_type,
+            'etag': '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"',
+            'compressed': compressed
+        }
+
+    return assets
+
+
+# Record separator and field separator used in git log formats
+_GIT_RECORD = '\x1e'
+_GIT_FIELD = '\x1f'
+
+
+def set_max_git_processes(limit: int):
+    """Set the cap on concurrently running git subprocesses"""
+    global _git_slots
+    _git_slots = threading.BoundedSemaphore(max(1, limit))
+
+
+def set_scan_workers(limit: int):
+    """Set how many features are read in parallel during a full scan"""
+    global _scan_workers, _scan_pool
+    with _scan_pool_lock:
+        _scan_workers = max(1, limit)
+        if _scan_pool is not None:
+            # Running scans finish on the old pool; the next one starts a new pool
+            _scan_pool.shutdown(wait=False)
+            _scan_pool = None
+
+
+def _get_scan_pool() -> ThreadPoolExecutor:
+    """Return the shared feature-scan pool, creating it on first use"""
+    global _scan_pool
+    with _scan_pool_lock:
+        if _scan_pool is None:
+            _scan_pool = ThreadPoolExecutor(max_workers=_scan_workers,
+                                            thread_name_prefix='feature-scan')
+        return _scan_pool
+
+
+def run_git(args: List[str], timeout: float = GIT_TIMEOUT) -> Optional[subprocess.CompletedProcess]:
+    """
+    Run a git command, waiting for a free subprocess slot first.
+
+    Args:
+        args: Arguments passed to git (without the leading 'git')
+        timeout: Total seconds for waiting on a slot plus running the command
+
+    Returns:
+        The completed process, or None if git is missing or the command timed out
+    """
+    deadline = time.monotonic() + timeout
+    slots = _git_slots
+    if not slots.acquire(timeout=timeout):
+        return None
+
+    try:
+        # The command only gets what is left after waiting for the slot
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return subprocess.run(
+            ['git', *args],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=remaining
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    finally:
+        slots.release()
+
+
+@contextmanager
+def git_stream(args: List[str], text: bool = True):
+    """
+    Run a git command whose output is read incrementally.
+
+    Yields the Popen object (UTF-8 text mode unless ``text`` is False), or
+    None if git is missing or no subprocess slot became free in time. If the
+    caller stops reading early, the process is terminated when the context
+    exits.
+    """
+    slots = _git_slots
+    if not slots.acquire(timeout=GIT_TIMEOUT):
+        yield None
+        return
+
+    proc = None
+    try:
+        try:
+            proc = subprocess.Popen(
+                ['git', *args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=text,
+                encoding='utf-8' if text else None,
+                errors='replace' if text else None
+            )
+        except FileNotFoundError:
+            yield None
+            return
+        yield proc
+    finally:
+        if proc is not None:
+            proc.stdout.close()
+            try:
+                proc.wait(timeout=GIT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        slots.release()
+
+
+def is_git_available() -> bool:
+    """Check whether the current directory is inside a git repository"""
+    result = run_git(['rev-parse', '--git-dir'])
+    return result is not None and result.returncode == 0
+
+
+class DashboardServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server backed by a bounded worker pool.
+
+    Each connection is handled on a pool thread, so a slow git-backed
+    endpoint no longer blocks health checks or the polling loop. Connections
+    beyond the pool size wait in the pool queue instead of spawning threads.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, server_address, handler_class,
+                 workers: int = DEFAULT_WORKERS,
+                 request_timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT,
+                 max_event_streams: int = DEFAULT_MAX_EVENT_STREAMS):
+        super().__init__(server_address, handler_class)
+        self.request_timeout = request_timeout
+        self.index: Optional['ProjectIndex'] = None
+        self.static_assets: Dict[str, Dict[str, Any]] = {}
+        self.diff_max_bytes = DEFAULT_DIFF_MAX_BYTES
+        # Event streams hold a worker for their whole lifetime, so the pool
+        # reserves extra threads for them on top of the request workers
+        self.event_slots = threading.BoundedSemaphore(max(1, max_event_streams))
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers) + max(1, max_event_streams),
+                                        thread_name_prefix='dashboard')
+
+    def process_request(self, request, client_address):
+        """Hand the connection to the worker pool"""
+        if self.request_timeout:
+            request.settimeout(self.request_timeout)
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        if self.index is not None:
+            self.index.stop()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
 
 class DashboardHandler(BaseHTTPRequestHandler):
     """HTTP request handler for dashboard"""
@@ -33,6 +330,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
         """Handle GET requests"""
         parsed_url = urlparse(self.path)
         path = parsed_url.path
+        query = parse_qs(parsed_url.query)
 
         # Route requests
         if path == '/':
@@ -40,10 +338,15 @@ class DashboardHandler(BaseHTTPRequestHandler):
         elif path == '/api/health':
             self.serve_health()
         elif path == '/api/features':
-            self.serve_features()
+            self.serve_features(query)
+        elif path == '/api/events':
+            self.serve_events()
         elif path.startswith('/api/kanban/'):
             feature_id = path.split('/')[-1]
-            self.serve_kanban(feature_id)
+            self.serve_kanban(feature_id, query)
+        elif path.startswith('/api/dependencies/'):
+            feature_id = path.split('/')[-1]
+            self.serve_dependency_graph(feature_id)
         elif path.startswith('/api/artifact/'):
             parts = path.split('/')[3:]  # Skip '', 'api', 'artifact'
             if len(parts) >= 2:
@@ -68,14 +371,14 @@ class DashboardHandler(BaseHTTPRequestHandler):
                         self.serve_task_reviews(feature_id, lane, task_id)
                     elif subpath == 'diff' and len(parts) >= 5:
                         commit_sha = parts[4]
-                        self.serve_commit_diff(commit_sha)
+                        self.serve_commit_diff(commit_sha, query)
                     else:
                         self.send_error(404, "Not found")
                 else:
                     self.serve_task_detail(feature_id, lane, task_id)
         elif path.startswith('/api/diff/'):
             commit_sha = path.split('/')[-1]
-            self.serve_commit_diff(commit_sha)
+            self.serve_commit_diff(commit_sha, query)
         elif path == '/api/untracked-commits':
             self.serve_untracked_commits()
         elif path == '/api/constitution':
@@ -99,15 +402,14 @@ class DashboardHandler(BaseHTTPRequestHandler):
 
     def serve_dashboard_html(self):
         """Serve the main dashboard HTML"""
-        static_dir = Path(__file__).parent / 'static' / 'dashboard'
-        html_file = static_dir / 'index.html'
+        if self.serve_static_asset('index.html'):
+            return
+
+        html_file = STATIC_DIR / 'index.html'
 
         if html_file.exists():
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
             with open(html_file, 'rb') as f:
-                self.wfile.write(f.read())
+                self.send_body(f.read(), 'text/html')
         else:
             # Fallback minimal HTML if file doesn't exist yet
             html = """<!DOCTYPE html>
@@ -125,10 +427,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
     <p>Dashboard is running. Frontend files will be added next.</p>
 </body>
 </html>"""
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            self.wfile.write(html.encode('utf-8'))
+            self.send_body(html.encode('utf-8'), 'text/html')
 
     def serve_health(self):
         """Health check endpoint"""
@@ -139,24 +438,114 @@ class DashboardHandler(BaseHTTPRequestHandler):
         }
         self.send_json(data)
 
-    def serve_features(self):
-        """List all features"""
-        features = scan_all_features()
-        self.send_json(features)
+    def serve_features(self, query: Optional[Dict[str, List[str]]] = None):
+        """
+        List all features.
+
+        With lane/limit/cursor/q/fields query parameters the response is
+        {'features': [...], 'page': {...}} (see query_features).
+        """
+        try:
+            params = parse_list_query(query or {})
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+
+        index = getattr(self.server, 'index', None)
+        if index is None:
+            features = scan_all_features()
+            self.send_json(features if params is None else query_features(features, params))
+            return
+
+        # The index version changes whenever any feature does, so an
+        # unchanged project is answered without serializing anything
+        etag = query_etag(index.etag('features'), params)
+        if self.etag_matches(etag):
+            self.send_not_modified(etag, vary_accept=HAS_MSGPACK)
+            return
+        features = index.features()
+        self.send_json(features if params is None else query_features(features, params), etag=etag)
+
+    def serve_events(self):
+        """
+        Stream project changes as Server-Sent Events.
+
+        Events:
+            ready    - sent on connect; clients resync with a (cheap) refetch
+            features - {'updated': [feature info], 'removed': [feature path]}
+            kanban   - {'feature_id', 'lanes': {lane: [task]}} for changed lanes
+            head     - git HEAD moved; untracked commits may have changed
+        """
+        index = getattr(self.server, 'index', None)
+        slots = getattr(self.server, 'event_slots', None)
+        if index is None or slots is None or not slots.acquire(blocking=False):
+            self.send_error(503, "Event stream unavailable")
+            return
+
+        try:
+            self.send_response(200)
+            self.send_header('Content-type', 'text/event-stream; charset=utf-8')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+
+            seq = index.event_seq
+            self.write_event('ready', {'version': index.version})
+
+            while not index.stopped:
+                events = index.wait_for_events(seq, timeout=EVENT_KEEPALIVE)
+                if events is None:
+                    # Fell behind the backlog; ask the client to resync
+                    seq = index.event_seq
+                    self.write_event('ready', {'version': index.version})
+                elif not events:
+                    self.wfile.write(b': keepalive\n\n')
+                else:
+                    for seq, event in events:
+                        self.write_event(event['type'], event['data'])
+        except (BrokenPipeError, ConnectionResetError, TimeoutError):
+            # Client went away
+            pass
+        finally:
+            slots.release()
+
+    def write_event(self, event_type: str, data: Any):
+        """Write a single Server-Sent Event"""
+        payload = encode_json(data)
+        self.wfile.write(f'event: {event_type}\ndata: {payload}\n\n'.encode('utf-8'))
+
+    def serve_kanban(self, feature_id: str, query: Optional[Dict[str, List[str]]] = None):
+        """
+        Get kanban board for a feature.
+
+        lane/limit/cursor/q/fields query parameters select a page of each
+        lane (see query_kanban); the board itself comes from the index cache.
+        """
+        try:
+            params = parse_list_query(query or {}, allowed_fields=KANBAN_FIELDS)
+        except ValueError as e:
+            self.send_error(400, str(e))
+            return
+
+        index = getattr(self.server, 'index', None)
+        if index is not None:
+            etag = query_etag(index.etag(f'kanban-{feature_id}'), params)
+            if self.etag_matches(etag):
+                self.send_not_modified(etag, vary_accept=HAS_MSGPACK)
+                return
+            kanban_data = index.kanban(feature_id)
+            if kanban_data is not None:
+                self.send_json(kanban_data if params is None else query_kanban(kanban_data, params),
+                               etag=etag)
+                return
 
-    def serve_kanban(self, feature_id: str):
-        """Get kanban board for a feature"""
         kanban_data = scan_feature_kanban(feature_id)
-        self.send_json(kanban_data)
+        self.send_json(kanban_data if params is None else query_kanban(kanban_data, params))
 
     def serve_artifact(self, feature_id: str, artifact_name: str):
         """Serve a specific artifact"""
         content = get_artifact_content(feature_id, artifact_name)
         if content is not None:
-            self.send_response(200)
-            self.send_header('Content-type', 'text/plain; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(content.encode('utf-8'))
+            self.send_body(content.encode('utf-8'), 'text/plain; charset=utf-8')
         else:
             self.send_error(404, f"Artifact not found: {artifact_name}")
 
@@ -168,6 +557,14 @@ class DashboardHandler(BaseHTTPRequestHandler):
         else:
             self.send_error(404, f"Task not found: {task_id}")
 
+    def serve_dependency_graph(self, feature_id: str):
+        """Serve the task dependency graph for a feature"""
+        graph = get_dependency_graph(feature_id)
+        if graph is not None:
+            self.send_json(graph)
+        else:
+            self.send_error(404, f"Feature not found: {feature_id}")
+
     def serve_task_commits(self, feature_id: str, lane: str, task_id: str):
         """Serve git commits for a task"""
         commits = get_task_commits(feature_id, task_id)
@@ -178,16 +575,72 @@ class DashboardHandler(BaseHTTPRequestHandler):
         files = get_task_files(feature_id, task_id)
         self.send_json(files)
 
-    def serve_commit_diff(self, commit_sha: str):
-        """Serve diff for a specific commit"""
-        diff = get_commit_diff(commit_sha)
-        if diff is not None:
-            self.send_response(200)
-            self.send_header('Content-type', 'text/plain; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(diff.encode('utf-8'))
-        else:
-            self.send_error(404, f"Commit not found: {commit_sha}")
+    def serve_commit_diff(self, commit_sha: str, query: Optional[Dict[str, List[str]]] = None):
+        """
+        Serve one page of the diff for a specific commit.
+
+        Output of ``git show`` is read in chunks and only up to the page
+        size, so memory use does not depend on commit size; git is stopped
+        once the page is full.
+
+        Query parameters:
+            file: Only show the diff for this path
+            offset: Skip this many bytes of diff output (for paging)
+
+        At most ``diff_max_bytes`` are sent per response, cut at a line
+        boundary. A truncated diff is answered with ``X-Diff-Truncated: true``
+        and ``X-Next-Offset`` giving the offset of the next page.
+        """
+        query = query or {}
+        file_path = query.get('file', [None])[0]
+        try:
+            offset = max(0, int(query.get('offset', ['0'])[0]))
+        except ValueError:
+            self.send_error(400, "Invalid offset")
+            return
+
+        # Never let the revision be parsed as a git option
+        if not commit_sha or commit_sha.startswith('-'):
+            self.send_error(400, f"Invalid commit: {commit_sha}")
+            return
+
+        max_bytes = getattr(self.server, 'diff_max_bytes', DEFAULT_DIFF_MAX_BYTES)
+        args = ['show', commit_sha]
+        if file_path:
+            args += ['--', file_path]
+
+        with git_stream(args, text=False) as proc:
+            if proc is None:
+                self.send_error(503, "git unavailable")
+                return
+
+            # Skip to the requested page
+            skipped = 0
+            chunk = proc.stdout.read(DIFF_CHUNK_SIZE)
+            while chunk and skipped + len(chunk) <= offset:
+                skipped += len(chunk)
+                chunk = proc.stdout.read(DIFF_CHUNK_SIZE)
+            page = bytearray(chunk[offset - skipped:] if chunk else b'')
+
+            # Read past the page limit so truncation is known before the
+            # headers are sent
+            while chunk and len(page) <= max_bytes:
+                chunk = proc.stdout.read(DIFF_CHUNK_SIZE)
+                page += chunk
+
+            if not page and proc.wait() != 0:
+                # Nothing to send: either past the end or an unknown commit
+                self.send_error(404, f"Commit not found: {commit_sha}")
+                return
+
+        headers = {'X-Diff-Truncated': 'false'}
+        if len(page) > max_bytes:
+            # Cut at the last line boundary that fits
+            cut = page.rfind(b'\n', 0, max_bytes) + 1 or max_bytes
+            del page[cut:]
+            headers = {'X-Diff-Truncated': 'true', 'X-Next-Offset': str(offset + cut)}
+
+        self.send_body(bytes(page), 'text/plain; charset=utf-8', headers=headers)
 
     def serve_task_reviews(self, feature_id: str, lane: str, task_id: str):
         """Serve review history for a task"""
@@ -210,10 +663,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
                         content = f.read()
                     # Add header indicating source
                     source_note = f"<!-- Loaded from: {constitution_path} -->\n\n"
-                    self.send_response(200)
-                    self.send_header('Content-type', 'text/plain; charset=utf-8')
-                    self.end_headers()
-                    self.wfile.write((source_note + content).encode('utf-8'))
+                    self.send_body((source_note + content).encode('utf-8'), 'text/plain; charset=utf-8')
                     return
                 except Exception as e:
                     # Continue to next path if read fails
@@ -242,10 +692,7 @@ Run `/spec-mix.constitution` to create one interactively, or use the template at
 `.spec-mix/active-mission/constitution/constitution-template.md`
 """
 
-        self.send_response(200)
-        self.send_header('Content-type', 'text/plain; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(helpful_msg.encode('utf-8'))
+        self.send_body(helpful_msg.encode('utf-8'), 'text/plain; charset=utf-8')
 
     def serve_i18n(self):
         """Serve i18n strings for dashboard UI"""
@@ -291,9 +738,31 @@ Run `/spec-mix.constitution` to create one interactively, or use the template at
         commits = get_untracked_commits()
         self.send_json(commits)
 
+    def serve_static_asset(self, path: str) -> bool:
+        """
+        Serve a static file from the pre-compressed asset cache.
+
+        Returns:
+            False if the file is not cached
+        """
+        assets = getattr(self.server, 'static_assets', None) or {}
+        asset = assets.get(path)
+        if asset is None:
+            return False
+
+        if self.etag_matches(asset['etag']):
+            self.send_not_modified(asset['etag'], compressible=is_compressible(asset['content_type']))
+        else:
+            self.send_body(asset['body'], asset['content_type'],
+                           etag=asset['etag'], compressed=asset['compressed'])
+        return True
+
     def serve_static(self, path: str):
         """Serve static files"""
-        static_dir = Path(__file__).parent / 'static' / 'dashboard'
+        if self.serve_static_asset(path):
+            return
+
+        static_dir = STATIC_DIR
         file_path = static_dir / path
 
         # Security: prevent directory traversal
@@ -309,25 +778,10 @@ Run `/spec-mix.constitution` to create one interactively, or use the template at
 
         if file_path.exists() and file_path.is_file():
             # Determine content type
-            suffix = file_path.suffix.lower()
-            content_types = {
-                '.html': 'text/html',
-                '.css': 'text/css',
-                '.js': 'application/javascript',
-                '.json': 'application/json',
-                '.png': 'image/png',
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.gif': 'image/gif',
-                '.svg': 'image/svg+xml',
-            }
-            content_type = content_types.get(suffix, 'application/octet-stream')
+            content_type = CONTENT_TYPES.get(file_path.suffix.lower(), 'application/octet-stream')
 
-            self.send_response(200)
-            self.send_header('Content-type', content_type)
-            self.end_headers()
             with open(file_path, 'rb') as f:
-                self.wfile.write(f.read())
+                self.send_body(f.read(), content_type)
         else:
             self.send_error(404, "File not found")
 
@@ -352,14 +806,135 @@ Run `/spec-mix.constitution` to create one interactively, or use the template at
         else:
             self.send_error(403, "Invalid shutdown token")
 
-    def send_json(self, data: Any):
-        """Send JSON response"""
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
+    def etag_matches(self, etag: str) -> bool:
+        """Check whether the request's If-None-Match header matches an ETag"""
+        return self.matching_etag(etag) is not None
+
+    def matching_etag(self, etag: str) -> Optional[str]:
+        """
+        Return the If-None-Match tag matching an ETag, or None.
+
+        Compressed responses carry the ETag with the encoding appended (see
+        encoded_etag), so a tag for any encoding of the resource matches.
+        """
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return None
+        variants = {etag} | {encoded_etag(etag, encoding) for encoding in ('gzip', 'br')}
+        for tag in (tag.strip() for tag in header.split(',')):
+            if tag == '*':
+                return etag
+            if tag.removeprefix('W/') in variants:
+                return tag.removeprefix('W/')
+        return None
+
+    def send_not_modified(self, etag: str, compressible: bool = True, vary_accept: bool = False):
+        """
+        Send 304 Not Modified for an unchanged resource.
+
+        The ETag and Vary headers are the ones the 200 response carries, so
+        caches keep telling the encodings apart.
+        """
+        self.send_response(304)
+        self.send_header('ETag', self.matching_etag(etag) or etag)
         self.send_header('Cache-Control', 'no-cache')
+        self.send_vary(compressible, vary_accept)
         self.end_headers()
-        self.wfile.write(json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
 
+    def send_vary(self, compressible: bool, vary_accept: bool):
+        """Send the Vary header for a response that may be compressed or negotiated"""
+        vary = (['Accept'] if vary_accept else []) + (['Accept-Encoding'] if compressible else [])
+        if vary:
+            self.send_header('Vary', ', '.join(vary))
+
+    def send_json(self, data: Any, etag: Optional[str] = None):
+        """
+        Send JSON response with an ETag.
+
+        Without an explicit etag, the ETag is a hash of the serialized body.
+        Clients revalidating with a matching If-None-Match get 304 Not Modified.
+        Clients that list application/msgpack in Accept get MessagePack
+        when msgpack is installed.
+        """
+        if self.wants_msgpack():
+            content_type = 'application/msgpack'
+            if etag is not None:
+                etag = etag[:-1] + '-mp"'  # Keep representations apart in caches
+            body = msgpack.packb(data, default=json_default, use_bin_type=True)
+        else:
+            content_type = 'application/json'
+            body = encode_json(data).encode('utf-8')
+        if etag is None:
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+        if self.etag_matches(etag):
+            self.send_not_modified(etag, vary_accept=HAS_MSGPACK)
+            return
+
+        self.send_body(body, content_type, etag=etag, vary_accept=HAS_MSGPACK)
+
+    def wants_msgpack(self) -> bool:
+        """Check whether the client asked for MessagePack and it is available"""
+        if not HAS_MSGPACK:
+            return False
+        accept = self.headers.get('Accept', '')
+        return any(t in accept for t in MSGPACK_TYPES)
+
+    def choose_encoding(self, available) -> Optional[str]:
+        """Pick the best content encoding from Accept-Encoding, or None"""
+        header = self.headers.get('Accept-Encoding', '')
+        accepted = set()
+        for item in header.split(','):
+            name, _, params = item.strip().partition(';')
+            params = params.replace(' ', '')
+            if params.startswith('q=') and params[2:] in ('0', '0.0', '0.00', '0.000'):
+                continue
+            accepted.add(name.strip().lower())
+
+        for encoding in supported_encodings():
+            if encoding in available and (encoding in accepted or '*' in accepted):
+                return encoding
+        return None
+
+    def send_body(self, body: bytes, content_type: str, etag: Optional[str] = None,
+                  compressed: Optional[Dict[str, bytes]] = None, vary_accept: bool = False,
+                  headers: Optional[Dict[str, str]] = None):
+        """
+        Send a 200 response, compressed when the client accepts it.
+
+        Args:
+            body: Uncompressed response body
+            content_type: Content-Type header value
+            etag: Optional ETag header value
+            compressed: Pre-compressed variants by encoding; without it,
+                compressible bodies are compressed on the fly
+            vary_accept: The body depends on the Accept header
+            headers: Extra response headers
+        """
+        compressible = is_compressible(content_type)
+        encoding = None
+        if compressed is not None:
+            encoding = self.choose_encoding(compressed.keys())
+            if encoding:
+                body = compressed[encoding]
+        elif compressible and len(body) >= COMPRESS_MIN_SIZE:
+            encoding = self.choose_encoding(supported_encodings())
+            if encoding:
+                body = compress_body(body, encoding)
+
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_vary(compressible, vary_accept)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if etag:
+            self.send_header('ETag', encoded_etag(etag, encoding))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
 
 def get_hotfix_info(hotfix_dir: Path) -> Optional[Dict[str, Any]]:
     """Get information about the hotfix directory"""
@@ -424,25 +999,19 @@ def get_hotfix_info(hotfix_dir: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
-def scan_all_features() -> List[Dict[str, Any]]:
-    """Scan for all features in specs/ and .worktrees/"""
-    features = []
+def iter_feature_dirs():
+    """
+    Yield (feature_dir, worktree) for every feature in specs/ and .worktrees/.
 
+    The hotfix directory is yielded like a feature; callers use
+    get_hotfix_info() for it. Worktree features carry the worktree name.
+    """
     # Scan specs/ directory
     specs_dir = Path('specs')
     if specs_dir.exists():
         for feature_dir in specs_dir.iterdir():
             if feature_dir.is_dir() and not feature_dir.name.startswith('.'):
-                # Skip hotfix directory - handle separately
-                if feature_dir.name == 'hotfix':
-                    # Scan hotfix directory for HOTFIX-*.md files
-                    hotfix_info = get_hotfix_info(feature_dir)
-                    if hotfix_info:
-                        features.append(hotfix_info)
-                    continue
-                feature_info = get_feature_info(feature_dir)
-                if feature_info:
-                    features.append(feature_info)
+                yield feature_dir, None
 
     # Scan .worktrees/*/specs/ directories
     worktrees_dir = Path('.worktrees')
@@ -453,26 +1022,78 @@ def scan_all_features() -> List[Dict[str, Any]]:
                 if worktree_specs.exists():
                     for feature_dir in worktree_specs.iterdir():
                         if feature_dir.is_dir() and not feature_dir.name.startswith('.'):
-                            feature_info = get_feature_info(feature_dir, worktree=worktree_dir.name)
-                            if feature_info:
-                                features.append(feature_info)
+                            yield feature_dir, worktree_dir.name
+
+
+def is_hotfix_dir(feature_dir: Path, worktree: Optional[str] = None) -> bool:
+    """Check if a directory is the specs/hotfix directory"""
+    return worktree is None and feature_dir.name == 'hotfix'
+
+
+def parallel_map(func, items: List[Any], workers: Optional[int] = None) -> List[Any]:
+    """
+    Apply func to every item using up to `workers` threads.
+
+    Results are returned in the order of `items`, so the outcome does not
+    depend on which thread finishes first. Small inputs and workers <= 1
+    run serially in the calling thread. The default worker count uses the
+    shared scan pool, whose threads are kept between calls; any other
+    count gets a pool of its own.
+    """
+    if workers is None:
+        workers = _scan_workers
+    if min(workers, len(items)) <= 1:
+        return [func(item) for item in items]
+
+    if workers == _scan_workers:
+        return list(_get_scan_pool().map(func, items))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='feature-scan') as pool:
+        return list(pool.map(func, items))
+
+
+def read_project_mode() -> str:
+    """Read the project mode from .spec-mix/config.json (default: 'pro')"""
+    from .project_config import load_project_settings
+    return load_project_settings().mode or 'pro'
+
+
+def read_features(feature_dirs: List[tuple], workers: Optional[int] = None) -> List[Optional[Dict[str, Any]]]:
+    """
+    Read feature info for (feature_dir, worktree) pairs, in parallel.
+
+    Returns:
+        One info dict (or None if unreadable) per pair, in input order
+    """
+    project_mode = read_project_mode()
+
+    def read(item):
+        feature_dir, worktree = item
+        if is_hotfix_dir(feature_dir, worktree):
+            # Scan hotfix directory for HOTFIX-*.md files
+            return get_hotfix_info(feature_dir)
+        return get_feature_info(feature_dir, worktree=worktree, project_mode=project_mode)
+
+    return parallel_map(read, feature_dirs, workers)
+
 
-    return features
+def scan_all_features(workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Scan for all features in specs/ and .worktrees/
+
+    Args:
+        workers: Features read in parallel (default: set_scan_workers value)
+    """
+    feature_dirs = list(iter_feature_dirs())
+    return [info for info in read_features(feature_dirs, workers) if info]
 
 
-def get_feature_info(feature_path: Path, worktree: Optional[str] = None) -> Optional[Dict[str, Any]]:
+def get_feature_info(feature_path: Path, worktree: Optional[str] = None,
+                     project_mode: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Get information about a feature"""
     try:
-        # Read project mode from config
-        project_mode = 'pro'  # Default
-        config_file = Path('.spec-mix') / 'config.json'
-        if config_file.exists():
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    project_mode = config.get('mode', 'pro')
-            except:
-                pass
+        if project_mode is None:
+            project_mode = read_project_mode()
 
         info = {
             'id': feature_path.name,
@@ -549,6 +1170,106 @@ def get_feature_info(feature_path: Path, worktree: Optional[str] = None) -> Opti
         return None
 
 
+# tasks.md line patterns, matched one line at a time
+_PHASE_HEADER = re.compile(r'^## Phase (\d+):\s*(.+?)$', re.IGNORECASE)
+_LANE_SECTION = re.compile(r'^## (Planned|Doing|In Progress|For Review|Review|Done|Completed)', re.IGNORECASE)
+_CHECKBOX_TASK = re.compile(r'^- \[([ xX])\] ((?:T|WP-)\d+.*?)$')
+_HEADER_TASK = re.compile(r'^### ([A-Z]+-[\d.]+|T[\d.]+):\s*(.+?)$')
+_CHECKBOX_DONE = re.compile(r'- \[[xX]\]')
+_CHECKBOX_ANY = re.compile(r'- \[[ xX]\]')
+
+@dataclass(slots=True, frozen=True)
+class Task:
+    """
+    A kanban task.
+
+    Boards with thousands of tasks hold one compact record per task instead
+    of a dict; tasks read from the same file share one interned path string.
+    Item access (task['id'], task.get('title')) is kept for callers written
+    against the dict form; like a dict it only exposes the data fields,
+    never methods or other attributes.
+    """
+    id: str
+    title: str
+    path: str
+
+    def __getitem__(self, key: str) -> str:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {'id': self.id, 'title': self.title, 'path': self.path}
+
+
+class FileCache:
+    """
+    Bounded, thread-safe map of values derived from files, keyed by path.
+
+    The least recently used entries are dropped beyond max_entries. Supports
+    the dict operations the caches below use (get, item assignment, pop);
+    the scan pool and MCP tool threads read and fill them concurrently.
+    """
+
+    def __init__(self, max_entries: int = FILE_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._data: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, default)
+            if key in self._data:
+                self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Parsed tasks.md files: path -> (file stamp, result)
+_tasks_cache = FileCache()
+
+
+def _file_stamp(st: os.stat_result) -> tuple:
+    """
+    Change detection key for a stat result.
+
+    The inode and ctime are included with mtime and size: on filesystems
+    with coarse timestamps, two writes within one tick can leave mtime and
+    size unchanged, but an atomic replace always changes the inode.
+    """
+    return (st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_size)
+
+
+def _section_lane(section_name: str) -> str:
+    """Map a lane section heading (## Doing, ## In Progress, ...) to a lane"""
+    section_name = section_name.lower()
+    if 'doing' in section_name or 'progress' in section_name:
+        return 'doing'
+    elif 'review' in section_name:
+        return 'for_review'
+    elif 'done' in section_name or 'completed' in section_name:
+        return 'done'
+    return 'planned'
+
+
 def parse_tasks_markdown(tasks_file: Path) -> Dict[str, Any]:
     """
     Parse a single tasks.md file and extract tasks.
@@ -565,190 +1286,510 @@ def parse_tasks_markdown(tasks_file: Path) -> Dict[str, Any]:
     3. If checkbox is completed (- [x]) -> 'done'
     4. If checkbox is uncompleted (- [ ]) -> 'planned'
     5. Header tasks (###) -> 'planned' by default
+
+    Results are cached by path and file stamp (see _file_stamp); an
+    unchanged file is never parsed twice. The returned structure is shared and must not be mutated.
     """
-    import re
+    key = str(tasks_file)
+    try:
+        st = os.stat(tasks_file)
+    except OSError as e:
+        print(f"Error parsing tasks file {tasks_file}: {e}")
+        return {'lanes': {'planned': [], 'doing': [], 'for_review': [], 'done': []},
+                'mode': 'pro', 'is_phase_mode': False}
+
+    stamp = _file_stamp(st)
+    cached = _tasks_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
 
+    result = _parse_tasks_content(tasks_file)
+    _tasks_cache[key] = (stamp, result)
+    return result
+
+
+def _parse_tasks_content(tasks_file: Path) -> Dict[str, Any]:
+    """
+    Tokenize tasks.md in a single pass over its lines.
+
+    Phase headers, lane sections, checkbox tasks and header tasks are all
+    collected in the same sweep; the layout (phase, section or flat) is
+    decided afterwards from what was seen.
+    """
     lanes = {
         'planned': [],
         'doing': [],
         'for_review': [],
         'done': []
     }
+    path = sys.intern(str(tasks_file))
 
-    # Additional structure for phase-based tasks (Normal mode)
-    phases = {}
-    is_phase_mode = False
+    # Phase-based (Normal mode): [num, name, completed, total] per phase
+    phase_rows = []
+    # Lane sections: [lane, checkbox tasks, header tasks] per section; the
+    # first entry collects tasks that appear before any section heading
+    sections = [[None, [], []]]
 
     try:
         with open(tasks_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # First, detect if this is a phase-based (Normal mode) file
-        phase_pattern = re.compile(r'^## Phase (\d+):\s*(.+?)$', re.MULTILINE | re.IGNORECASE)
-        phase_matches = list(phase_pattern.finditer(content))
-
-        if phase_matches:
-            # This is a Normal mode phase-based file
-            is_phase_mode = True
-
-            for i, phase_match in enumerate(phase_matches):
-                phase_num = phase_match.group(1)
-                phase_name = phase_match.group(2).strip()
-                phase_start = phase_match.end()
-                phase_end = phase_matches[i + 1].start() if i + 1 < len(phase_matches) else len(content)
-                phase_content = content[phase_start:phase_end]
-
-                # Determine phase status based on acceptance criteria checkboxes
-                completed_criteria = len(re.findall(r'- \[[xX]\]', phase_content))
-                total_criteria = len(re.findall(r'- \[[ xX]\]', phase_content))
-
-                if completed_criteria == total_criteria and total_criteria > 0:
-                    status = 'done'
-                elif completed_criteria > 0:
-                    status = 'doing'
-                else:
-                    # Check if previous phases are done
-                    status = 'planned'
+            for line in f:
+                line = line.rstrip('\n')
+                if line.startswith('## '):
+                    match = _PHASE_HEADER.match(line)
+                    if match:
+                        phase_rows.append([match.group(1), match.group(2).strip(), 0, 0])
+                        continue
+                    match = _LANE_SECTION.match(line)
+                    if match:
+                        sections.append([_section_lane(match.group(1)), [], []])
+                        continue
 
-                phase_info = {
-                    'id': f'Phase{phase_num}',
-                    'title': f'Phase {phase_num}: {phase_name}',
-                    'path': str(tasks_file),
-                    'phase_num': int(phase_num),
-                    'status': status,
-                    'progress': f'{completed_criteria}/{total_criteria}' if total_criteria > 0 else '0/0'
-                }
+                # Acceptance criteria checkboxes count toward the current phase
+                if phase_rows and '- [' in line:
+                    phase_rows[-1][2] += len(_CHECKBOX_DONE.findall(line))
+                    phase_rows[-1][3] += len(_CHECKBOX_ANY.findall(line))
 
-                phases[f'phase_{phase_num}'] = phase_info
+                if line.startswith('- ['):
+                    match = _CHECKBOX_TASK.match(line)
+                    if match:
+                        task_text = match.group(2).strip()
+                        parts = task_text.split(' ', 1)
+                        sections[-1][1].append((
+                            match.group(1).lower() == 'x',
+                            Task(
+                                parts[0] if parts else task_text,
+                                parts[1] if len(parts) > 1 else task_text,
+                                path
+                            )
+                        ))
+                elif line.startswith('### '):
+                    match = _HEADER_TASK.match(line)
+                    if match:
+                        sections[-1][2].append(Task(
+                            match.group(1).strip(),
+                            match.group(2).strip(),
+                            path
+                        ))
+    except Exception as e:
+        print(f"Error parsing tasks file {tasks_file}: {e}")
+        return {'lanes': lanes, 'mode': 'pro', 'is_phase_mode': False}
+
+    if phase_rows:
+        # This is a Normal mode phase-based file
+        phases = {}
+        for phase_num, phase_name, completed_criteria, total_criteria in phase_rows:
+            # Determine phase status based on acceptance criteria checkboxes
+            if completed_criteria == total_criteria and total_criteria > 0:
+                status = 'done'
+            elif completed_criteria > 0:
+                status = 'doing'
+            else:
+                status = 'planned'
+
+            phase_info = {
+                'id': f'Phase{phase_num}',
+                'title': f'Phase {phase_num}: {phase_name}',
+                'path': path,
+                'phase_num': int(phase_num),
+                'status': status,
+                'progress': f'{completed_criteria}/{total_criteria}' if total_criteria > 0 else '0/0'
+            }
 
-                # Also add to appropriate lane for kanban compatibility
-                lanes[status].append(phase_info)
+            phases[f'phase_{phase_num}'] = phase_info
 
-            return {
-                'lanes': lanes,
-                'phases': phases,
-                'mode': 'normal',
-                'is_phase_mode': True
-            }
+            # Also add to appropriate lane for kanban compatibility
+            lanes[status].append(phase_info)
 
-        # Detect if file uses section-based organization
-        # Look for ## headings that indicate lanes
-        section_pattern = re.compile(r'^## (Planned|Doing|In Progress|For Review|Review|Done|Completed).*?$', re.MULTILINE | re.IGNORECASE)
-        sections = list(section_pattern.finditer(content))
-
-        if sections:
-            # Section-based parsing
-            current_lane = 'planned'
-
-            # Split content by sections
-            for i, section_match in enumerate(sections):
-                section_name = section_match.group(1).lower()
-                section_start = section_match.end()
-                section_end = sections[i + 1].start() if i + 1 < len(sections) else len(content)
-                section_content = content[section_start:section_end]
-
-                # Map section names to lane names
-                if 'doing' in section_name or 'progress' in section_name:
-                    current_lane = 'doing'
-                elif 'review' in section_name:
-                    current_lane = 'for_review'
-                elif 'done' in section_name or 'completed' in section_name:
-                    current_lane = 'done'
-                else:
-                    current_lane = 'planned'
+        return {
+            'lanes': lanes,
+            'phases': phases,
+            'mode': 'normal',
+            'is_phase_mode': True
+        }
 
-                # Parse tasks in this section
-                # Checkbox tasks
-                checkbox_pattern = re.compile(r'^- \[([ xX])\] ((?:T|WP-)\d+.*?)$', re.MULTILINE)
-                for match in checkbox_pattern.finditer(section_content):
-                    task_text = match.group(2).strip()
-                    parts = task_text.split(' ', 1)
-                    task_id = parts[0] if parts else task_text
-                    task_title = parts[1] if len(parts) > 1 else task_text
-
-                    lanes[current_lane].append({
-                        'id': task_id,
-                        'title': task_title,
-                        'path': str(tasks_file)
-                    })
-
-                # Header tasks (supports T0.1, T1.1, WP-001, etc.)
-                header_pattern = re.compile(r'^### ([A-Z]+-[\d.]+|T[\d.]+):\s*(.+?)$', re.MULTILINE)
-                for match in header_pattern.finditer(section_content):
-                    task_id = match.group(1).strip()
-                    task_title = match.group(2).strip()
-
-                    lanes[current_lane].append({
-                        'id': task_id,
-                        'title': task_title,
-                        'path': str(tasks_file)
-                    })
-        else:
-            # Non-section-based parsing (original behavior)
-            # Pattern 1: Checkbox tasks
-            checkbox_pattern = re.compile(r'^- \[([ xX])\] ((?:T|WP-)\d+.*?)$', re.MULTILINE)
+    if len(sections) > 1:
+        # Section-based: tasks take the lane of their section; anything
+        # before the first section heading is ignored
+        for lane, checkbox_tasks, header_tasks in sections[1:]:
+            lanes[lane].extend(task for _, task in checkbox_tasks)
+            lanes[lane].extend(header_tasks)
+    else:
+        # Flat file: checkbox state decides the lane, header tasks are planned
+        _, checkbox_tasks, header_tasks = sections[0]
+        for is_completed, task in checkbox_tasks:
+            lanes['done' if is_completed else 'planned'].append(task)
+        lanes['planned'].extend(header_tasks)
 
-            for match in checkbox_pattern.finditer(content):
-                is_completed = match.group(1).lower() == 'x'
-                task_text = match.group(2).strip()
+    return {'lanes': lanes, 'mode': 'pro', 'is_phase_mode': False}
 
-                parts = task_text.split(' ', 1)
-                task_id = parts[0] if parts else task_text
-                task_title = parts[1] if len(parts) > 1 else task_text
 
-                task_info = {
-                    'id': task_id,
-                    'title': task_title,
-                    'path': str(tasks_file)
-                }
+# Edits to tasks.md ------------------------------------------------------
 
-                if is_completed:
-                    lanes['done'].append(task_info)
-                else:
-                    lanes['planned'].append(task_info)
+# Headings written for lanes that have no section in tasks.md yet
+LANE_HEADINGS = {'planned': 'Planned', 'doing': 'Doing', 'for_review': 'For Review', 'done': 'Done'}
 
-            # Pattern 2: Header tasks (supports T0.1, T1.1, WP-001, etc.)
-            header_pattern = re.compile(r'^### ([A-Z]+-[\d.]+|T[\d.]+):\s*(.+?)$', re.MULTILINE)
+# Lock file serializing tasks.md rewrites, kept in the feature's state
+# directory under .spec-mix/ (see task_ids.feature_state_dir)
+TASKS_LOCK_FILE = 'tasks.lock'
 
-            for match in header_pattern.finditer(content):
-                task_id = match.group(1).strip()
-                task_title = match.group(2).strip()
 
-                task_info = {
-                    'id': task_id,
-                    'title': task_title,
-                    'path': str(tasks_file)
-                }
+@dataclass(slots=True)
+class TaskSpan:
+    """Byte span of one task in tasks.md"""
+    id: str
+    start: int     # First byte of the task line
+    end: int       # Byte after the task's last line (### body or indented sub-lines)
+    mark: int      # Offset of the checkbox mark in '- [ ]', -1 for ### tasks
+    checked: bool
+    section: int   # Index into TasksIndex.sections, -1 before the first lane section
 
-                lanes['planned'].append(task_info)
 
-    except Exception as e:
-        print(f"Error parsing tasks file {tasks_file}: {e}")
+@dataclass(slots=True)
+class SectionSpan:
+    """Byte span of a lane section (## Planned, ## Doing, ...) in tasks.md"""
+    lane: str
+    start: int     # First byte of the heading line
+    body_end: int  # Next '## ' heading of any kind, or end of file
+    end: int       # Next lane heading, or end of file
 
-    return {'lanes': lanes, 'mode': 'pro', 'is_phase_mode': False}
 
+class TasksIndex:
+    """
+    Positional index of a tasks.md file.
+
+    Records the byte span of every task, lane section and checkbox, using
+    the same line rules as parse_tasks_markdown. Edits are spliced from
+    these spans: moves, inserts and checkbox toggles copy the untouched
+    bytes around them in one pass instead of re-tokenizing the document.
+    Indexes are cached per file and reused while its file stamp is
+    unchanged.
+    """
 
-def scan_feature_kanban(feature_id: str) -> Dict[str, Any]:
-    """Scan kanban board for a feature"""
-    # Try to find feature in specs/ or .worktrees/
-    feature_path = None
+    def __init__(self, stamp: tuple, tasks: Dict[str, TaskSpan],
+                 sections: List[SectionSpan], is_phase_mode: bool):
+        self.stamp = stamp
+        self.tasks = tasks
+        self.sections = sections
+        self.is_phase_mode = is_phase_mode
+
+    @classmethod
+    def build(cls, data: bytes, stamp: tuple) -> 'TasksIndex':
+        tasks: Dict[str, TaskSpan] = {}
+        sections: List[SectionSpan] = []
+        is_phase_mode = False
+        current = None       # Task whose block is still being extended
+        current_header = False
+        offset = 0
+
+        for raw in data.splitlines(keepends=True):
+            start = offset
+            offset += len(raw)
+            line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+
+            if line.startswith('#'):
+                current = None
+                if line.startswith('## '):
+                    # Only the last section can still be open
+                    if sections and sections[-1].body_end == len(data):
+                        sections[-1].body_end = start
+                    if _PHASE_HEADER.match(line):
+                        is_phase_mode = True
+                        continue
+                    match = _LANE_SECTION.match(line)
+                    if match:
+                        if sections:
+                            sections[-1].end = start
+                        sections.append(SectionSpan(_section_lane(match.group(1)), start, len(data), len(data)))
+                        continue
 
-    specs_path = Path('specs') / feature_id
-    if specs_path.exists():
-        feature_path = specs_path
+            if line.startswith('- ['):
+                match = _CHECKBOX_TASK.match(line)
+                if match:
+                    task_text = match.group(2).strip()
+                    span = TaskSpan(task_text.split(' ', 1)[0], start, offset, start + 3,
+                                    match.group(1).lower() == 'x', len(sections) - 1)
+                    tasks.setdefault(span.id, span)
+                    current, current_header = span, False
+                    continue
+            elif line.startswith('### '):
+                match = _HEADER_TASK.match(line)
+                if match:
+                    span = TaskSpan(match.group(1).strip(), start, offset, -1, False, len(sections) - 1)
+                    tasks.setdefault(span.id, span)
+                    current, current_header = span, True
+                    continue
+
+            # ### tasks own every line up to the next heading or task;
+            # checkbox tasks own their indented sub-lines
+            if current is not None:
+                if current_header or (line[:1] in (' ', '\t') and line.strip()):
+                    current.end = offset
+                else:
+                    current = None
+
+        return cls(stamp, tasks, sections, is_phase_mode)
+
+    def lane_of(self, span: TaskSpan) -> str:
+        """Return the lane a task is shown in"""
+        if self.sections:
+            return self.sections[span.section].lane if span.section >= 0 else 'planned'
+        return 'done' if span.checked else 'planned'
+
+    def section_for(self, lane: str) -> Optional[SectionSpan]:
+        """Return the first section of a lane, or None"""
+        for section in self.sections:
+            if section.lane == lane:
+                return section
+        return None
+
+
+# tasks.md indexes: path -> TasksIndex
+_tasks_index_cache = FileCache()
+
+
+def load_tasks_index(tasks_file: Path, data: Optional[bytes] = None) -> TasksIndex:
+    """Return the index of a tasks.md file, rebuilding it only if the file changed"""
+    key = str(tasks_file)
+    stamp = _file_stamp(os.stat(tasks_file))
+    index = _tasks_index_cache.get(key)
+    if index is None or index.stamp != stamp:
+        if data is None:
+            with open(tasks_file, 'rb') as f:
+                data = f.read()
+        index = TasksIndex.build(data, stamp)
+        _tasks_index_cache[key] = index
+    return index
+
+
+@contextmanager
+def _tasks_file_lock(tasks_file: Path):
+    """Serialize tasks.md edits across threads and processes"""
+    from .task_ids import exclusive_lock, feature_state_dir
+    with open(feature_state_dir(tasks_file.parent) / TASKS_LOCK_FILE, 'a+') as f:
+        with exclusive_lock(f):
+            yield
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Replace a file's content without readers ever seeing a partial write"""
+    import tempfile
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        try:
+            os.chmod(tmp, path.stat().st_mode & 0o777)
+        except OSError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _forget_tasks_file(tasks_file: Path):
+    """Drop everything cached from a tasks.md that was just rewritten"""
+    _tasks_cache.pop(str(tasks_file), None)
+    _tasks_index_cache.pop(str(tasks_file), None)
+    _lane_map_cache.pop(str(tasks_file.parent), None)
+
+
+def _insert_point(data: bytes, section: SectionSpan, removed: List[tuple]) -> int:
+    """Offset just after the last non-blank line of a section that is kept"""
+    pos = section.body_end
+    while True:
+        while pos > section.start and data[pos - 1:pos] in (b'\n', b'\r', b' ', b'\t'):
+            pos -= 1
+        cut = next(((start, end) for start, end in removed if start < pos <= end), None)
+        if cut is None:
+            break
+        pos = cut[0]
+    newline = data.find(b'\n', pos)
+    return len(data) if newline < 0 else newline + 1
+
+
+def _splice(data: bytes, removed: List[tuple], inserts: List[tuple], marks: Dict[int, bytes]) -> bytes:
+    """
+    Build new file content from byte edits in original coordinates.
+
+    Args:
+        removed: (start, end) ranges to drop
+        inserts: (offset, bytes) to add; inserts at one offset keep their order
+        marks: Offset -> single byte replacing a checkbox mark
+    """
+    events = sorted(
+        [(start, 1, i, ('cut', end)) for i, (start, end) in enumerate(removed)] +
+        [(offset, 0, i, ('add', piece)) for i, (offset, piece) in enumerate(inserts)]
+    )
+    out = []
+    pos = 0
+
+    def copy_until(limit):
+        nonlocal pos
+        chunk = bytearray(data[pos:limit])
+        for offset, mark in marks.items():
+            if pos <= offset < limit:
+                chunk[offset - pos] = mark[0]
+        out.append(bytes(chunk))
+        pos = limit
+
+    for offset, _, _, (kind, value) in events:
+        if offset > pos:
+            copy_until(offset)
+        if kind == 'add':
+            out.append(value)
+        else:
+            pos = max(pos, value)
+    copy_until(len(data))
+    return b''.join(out)
+
+
+def _task_block(data: bytes, span: TaskSpan, lane: str) -> bytes:
+    """Text of a task to insert into a lane, with its checkbox set to match"""
+    block = data[span.start:span.end].rstrip(b' \t\r\n') + b'\n'
+    if span.mark >= 0:
+        mark = b'x' if lane == 'done' else b' '
+        block = block[:3] + mark + block[4:]
     else:
-        # Search in worktrees
-        worktrees_dir = Path('.worktrees')
-        if worktrees_dir.exists():
-            for worktree_dir in worktrees_dir.iterdir():
-                worktree_specs = worktree_dir / 'specs' / feature_id
-                if worktree_specs.exists():
-                    feature_path = worktree_specs
-                    break
+        block = b'\n' + block
+    return block
+
+
+def _lane_pieces(data: bytes, index: TasksIndex, lane: str, blocks: List[bytes],
+                 removed: List[tuple], inserts: List[tuple]):
+    """Queue blocks for the end of a lane's section, creating the section if needed"""
+    section = index.section_for(lane)
+    if section is not None:
+        offset = _insert_point(data, section, removed)
+        inserts.extend((offset, block) for block in blocks)
+        return
+
+    if any(offset == len(data) for offset, _ in inserts):
+        lead = b'\n'  # Follows another new section
+    elif not data or data.endswith(b'\n\n'):
+        lead = b''
+    else:
+        lead = b'\n' if data.endswith(b'\n') else b'\n\n'
+    heading = lead + f'## {LANE_HEADINGS[lane]}\n'.encode('utf-8')
+    inserts.append((len(data), heading + b''.join(blocks)))
+
+
+def move_tasks_in_file(tasks_file: Path, moves: List[Dict[str, Any]]) -> tuple:
+    """
+    Move tasks between lanes inside tasks.md.
+
+    With lane sections, each task block is cut from its section and added
+    at the end of the target lane's section (created at the end of the
+    file if missing), and its checkbox is set to match. Without sections a
+    checkbox task can only be planned or done, which toggles its mark.
+    All moves are applied in one atomic rewrite under a lock.
+
+    Returns:
+        ([(task_id, lane), ...] moved, [error message, ...])
+    """
+    moved = []
+    errors = []
+
+    with _tasks_file_lock(tasks_file):
+        with open(tasks_file, 'rb') as f:
+            data = f.read()
+        index = load_tasks_index(tasks_file, data)
+        if index.is_phase_mode:
+            return [], ["tasks.md uses phases; phase status follows its acceptance checkboxes."]
+
+        removed = []
+        targets: Dict[str, List[bytes]] = {}
+        marks: Dict[int, bytes] = {}
+        seen = set()
+
+        for move in moves:
+            task_id = move.get('task_id') if isinstance(move, dict) else None
+            lane = move.get('lane') if isinstance(move, dict) else None
+            if lane not in LANE_HEADINGS:
+                errors.append(f"Invalid lane '{lane}' for task {task_id}.")
+                continue
+            span = index.tasks.get(task_id)
+            if span is None:
+                errors.append(f"Task {task_id} not found.")
+                continue
+            if task_id in seen:
+                errors.append(f"Task {task_id} is moved more than once.")
+                continue
+            seen.add(task_id)
+
+            if not index.sections:
+                if span.mark < 0 or lane not in ('planned', 'done'):
+                    errors.append(f"Task {task_id} cannot be moved to {lane}: tasks.md has no lane sections.")
+                    continue
+                marks[span.mark] = b'x' if lane == 'done' else b' '
+            elif index.lane_of(span) == lane and span.section >= 0:
+                if span.mark >= 0:
+                    marks[span.mark] = b'x' if lane == 'done' else b' '
+            else:
+                removed.append((span.start, span.end))
+                targets.setdefault(lane, []).append(_task_block(data, span, lane))
+            moved.append((task_id, lane))
+
+        marks = {offset: mark for offset, mark in marks.items() if data[offset:offset + 1] != mark}
+        if not removed and not targets and not marks:
+            return moved, errors
 
+        inserts = []
+        for lane, blocks in targets.items():
+            _lane_pieces(data, index, lane, blocks, removed, inserts)
+        _write_atomic(tasks_file, _splice(data, removed, inserts, marks))
+        _forget_tasks_file(tasks_file)
+
+    return moved, errors
+
+
+def add_tasks_to_file(tasks_file: Path, blocks: List[str], lane: str = 'planned'):
+    """
+    Add task blocks (e.g. '### T007: Title\\nDescription\\n') to a lane of tasks.md.
+
+    Blocks go to the end of the lane's section, which is created if the
+    file has sections but not this lane; files without sections get the
+    blocks appended. Missing files are created with all four lanes.
+    """
+    with _tasks_file_lock(tasks_file):
+        if not tasks_file.exists():
+            entries = ''.join(f'\n\n{block.rstrip()}\n' for block in blocks)
+            sections = ''.join(
+                f'## {heading}{entries if key == lane else ""}\n\n' for key, heading in LANE_HEADINGS.items()
+            )
+            _write_atomic(tasks_file, f'# Tasks\n\n{sections}'.rstrip('\n').encode('utf-8') + b'\n')
+            _forget_tasks_file(tasks_file)
+            return
+
+        with open(tasks_file, 'rb') as f:
+            data = f.read()
+        index = load_tasks_index(tasks_file, data)
+        pieces = [('\n' + block.rstrip() + '\n').encode('utf-8') for block in blocks]
+
+        if not index.sections:
+            lead = b'' if not data or data.endswith(b'\n') else b'\n'
+            _write_atomic(tasks_file, data + lead + b''.join(pieces))
+        else:
+            inserts = []
+            _lane_pieces(data, index, lane, pieces, [], inserts)
+            _write_atomic(tasks_file, _splice(data, [], inserts, {}))
+        _forget_tasks_file(tasks_file)
+
+
+def scan_feature_kanban(feature_id: str) -> Dict[str, Any]:
+    """Scan kanban board for a feature"""
+    feature_path = find_feature_path(feature_id)
     if not feature_path:
         return {'error': 'Feature not found', 'lanes': {}}
 
+    return load_feature_kanban(feature_path)
+
+
+def load_feature_kanban(feature_path: Path) -> Dict[str, Any]:
+    """Build the kanban board for a feature directory"""
     # First try: Check for directory-based kanban structure (tasks/{lane}/*.md)
     tasks_dir = feature_path / 'tasks'
     if tasks_dir.exists() and tasks_dir.is_dir():
@@ -763,11 +1804,7 @@ def scan_feature_kanban(feature_id: str) -> Dict[str, Any]:
 
                 if lane_dir.exists():
                     for task_file in sorted(lane_dir.glob('*.md')):
-                        task_info = {
-                            'id': task_file.stem,
-                            'title': task_file.stem,
-                            'path': str(task_file)
-                        }
+                        title = task_file.stem
 
                         # Try to extract title from file
                         try:
@@ -775,12 +1812,12 @@ def scan_feature_kanban(feature_id: str) -> Dict[str, Any]:
                                 lines = f.readlines()
                                 for line in lines:
                                     if line.startswith('# '):
-                                        task_info['title'] = line.strip('# \n')
+                                        title = line.strip('# \n')
                                         break
                         except:
                             pass
 
-                        lanes[lane].append(task_info)
+                        lanes[lane].append(Task(task_file.stem, title, str(task_file)))
 
             return {'lanes': lanes}
 
@@ -793,23 +1830,462 @@ def scan_feature_kanban(feature_id: str) -> Dict[str, Any]:
     return {'lanes': {'planned': [], 'doing': [], 'for_review': [], 'done': []}}
 
 
-def get_artifact_content(feature_id: str, artifact_name: str) -> Optional[str]:
-    """Get content of an artifact"""
-    # Try to find feature
-    feature_path = None
+LIST_QUERY_PARAMS = ('lane', 'limit', 'cursor', 'q', 'fields')
 
-    specs_path = Path('specs') / feature_id
-    if specs_path.exists():
-        feature_path = specs_path
-    else:
-        worktrees_dir = Path('.worktrees')
-        if worktrees_dir.exists():
-            for worktree_dir in worktrees_dir.iterdir():
-                worktree_specs = worktree_dir / 'specs' / feature_id
-                if worktree_specs.exists():
-                    feature_path = worktree_specs
-                    break
+# Lanes a lane= filter may name
+KANBAN_LANES = ('planned', 'doing', 'for_review', 'done')
+
+# Fields a kanban fields= projection may name: Task fields plus the extra
+# keys of phase entries on phase-mode boards
+KANBAN_FIELDS = Task.__slots__ + ('phase_num', 'status', 'progress')
+
+
+def parse_list_query(query: Dict[str, List[str]],
+                     allowed_fields: Optional[tuple] = None) -> Optional[Dict[str, Any]]:
+    """
+    Read list parameters from a parsed query string.
+
+    lane and fields take comma-separated names (or repeat the parameter),
+    limit and cursor are integers and q is a case-insensitive title search.
+
+    Args:
+        query: Parsed query string (parse_qs)
+        allowed_fields: Field names accepted by fields= (default: any)
+
+    Returns:
+        The parameters, or None if the query has none of them
+
+    Raises:
+        ValueError: If limit or cursor is not a valid number, or lane or
+            fields names an unknown lane or field
+    """
+    if not any(name in query for name in LIST_QUERY_PARAMS):
+        return None
+
+    def names(param):
+        values = [v.strip() for value in query.get(param, []) for v in value.split(',')]
+        return [v for v in values if v] or None
+
+    limit = None
+    if query.get('limit'):
+        try:
+            limit = int(query['limit'][0])
+        except ValueError:
+            raise ValueError("Invalid limit") from None
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    cursor = 0
+    if query.get('cursor'):
+        try:
+            cursor = int(query['cursor'][0])
+        except ValueError:
+            raise ValueError("Invalid cursor") from None
+        if cursor < 0:
+            raise ValueError("Invalid cursor")
+
+    lanes = names('lane')
+    if lanes:
+        unknown = [lane for lane in lanes if lane not in KANBAN_LANES]
+        if unknown:
+            raise ValueError(f"Unknown lane: {', '.join(unknown)}")
+
+    fields = names('fields')
+    if fields and allowed_fields is not None:
+        unknown = [field for field in fields if field not in allowed_fields]
+        if unknown:
+            raise ValueError(f"Unknown field: {', '.join(unknown)}")
+
+    q = query.get('q', [''])[0].strip().lower()
+    return {
+        'lanes': lanes,
+        'limit': limit,
+        'cursor': cursor,
+        'q': q or None,
+        'fields': fields,
+    }
+
+
+def query_etag(etag: str, params: Optional[Dict[str, Any]]) -> str:
+    """Derive the ETag of a filtered view from the ETag of the full resource"""
+    if params is None:
+        return etag
+    digest = hashlib.blake2b(repr(sorted(params.items())).encode('utf-8'), digest_size=6).hexdigest()
+    return f'{etag[:-1]}-{digest}"'
+
+
+def _project(item: Any, fields: Optional[List[str]]) -> Any:
+    """Keep only the requested fields of a task or feature"""
+    if fields is None:
+        return item
+    missing = object()
+    projected = {}
+    for field in fields:
+        value = item.get(field, missing)
+        if value is not missing:
+            projected[field] = value
+    return projected
+
+
+def _page(items: List[Any], params: Dict[str, Any], title_key: str):
+    """Filter items by title and cut one page; returns (page, total, next_cursor)"""
+    if params['q']:
+        q = params['q']
+        items = [item for item in items if q in (item.get(title_key) or '').lower()]
+    cursor, limit = params['cursor'], params['limit']
+    end = cursor + limit if limit else len(items)
+    page = [_project(item, params['fields']) for item in items[cursor:end]]
+    return page, len(items), end if end < len(items) else None
+
+
+def query_kanban(kanban: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Select lanes, filter by title and page a kanban board.
+
+    Every selected lane is paged with the same cursor and limit. The result
+    keeps the board's other keys and adds 'page' with the cursor, limit,
+    per-lane totals after filtering and the cursor of the next page (None
+    when no lane has more tasks).
+    """
+    lanes = {}
+    totals = {}
+    next_cursor = None
+    for lane, tasks in kanban.get('lanes', {}).items():
+        if params['lanes'] and lane not in params['lanes']:
+            continue
+        lanes[lane], totals[lane], lane_next = _page(tasks, params, 'title')
+        if lane_next is not None:
+            next_cursor = lane_next
+
+    result = {key: value for key, value in kanban.items() if key != 'lanes'}
+    result['lanes'] = lanes
+    result['page'] = {
+        'cursor': params['cursor'],
+        'limit': params['limit'],
+        'totals': totals,
+        'next_cursor': next_cursor,
+    }
+    return result
+
+
+def query_features(features: List[Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Filter and page the feature list.
+
+    lane keeps features with tasks in any of the given lanes and q matches
+    the feature name. Returns {'features': [...], 'page': {...}}.
+    """
+    if params['lanes']:
+        features = [
+            feature for feature in features
+            if any(feature.get('kanban_stats', {}).get(lane) for lane in params['lanes'])
+        ]
+    page, total, next_cursor = _page(features, params, 'name')
+    return {
+        'features': page,
+        'page': {
+            'cursor': params['cursor'],
+            'limit': params['limit'],
+            'total': total,
+            'next_cursor': next_cursor,
+        },
+    }
+
+
+def _stat_key(path: Path) -> Optional[tuple]:
+    """Return the file stamp of a path (see _file_stamp), or None if it does not exist"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return _file_stamp(st)
+
+
+def _dir_stat_keys(directory: Path, pattern: str = '*.md') -> tuple:
+    """Return sorted (name, *file stamp) entries for files matching pattern"""
+    try:
+        return tuple(sorted(
+            (path.name,) + (_stat_key(path) or ())
+            for path in directory.glob(pattern)
+        ))
+    except OSError:
+        return ()
+
+
+def feature_signature(feature_dir: Path, hotfix: bool = False) -> tuple:
+    """
+    Cheap fingerprint of everything a feature's info and kanban are derived from.
+
+    Directory mtimes change when entries are added, removed or renamed, so
+    artifact existence, fixes and walkthroughs are covered by the feature
+    directory itself. Task files are stat'ed individually because their
+    titles come from file content.
+    """
+    if hotfix:
+        return (_stat_key(feature_dir), _dir_stat_keys(feature_dir, 'HOTFIX-*.md'))
+
+    tasks_dir = feature_dir / 'tasks'
+    return (
+        _stat_key(feature_dir),
+        _stat_key(feature_dir / 'tasks.md'),
+        _stat_key(tasks_dir),
+        _stat_key(feature_dir / 'fixes'),
+        tuple(
+            (_stat_key(tasks_dir / lane), _dir_stat_keys(tasks_dir / lane))
+            for lane in ['planned', 'doing', 'for_review', 'done']
+        ),
+    )
+
+
+class ProjectIndex:
+    """
+    Persistent in-memory index of features, lanes and tasks.
 
+    The index is built once and then kept current by a background thread
+    that polls the modification times of the files and directories each
+    feature is derived from (see feature_signature). Only features whose
+    fingerprint changed are re-read, so serving a request when nothing
+    changed is a dictionary lookup instead of a walk over every feature.
+    """
+
+    def __init__(self, poll_interval: float = INDEX_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self.version = 0
+        self._instance = secrets.token_hex(4)  # Keeps ETags unique across restarts
+        self._entries: Dict[str, Dict[str, Any]] = {}  # feature dir -> entry
+        self._order: List[str] = []
+        self._by_id: Dict[str, str] = {}  # feature id -> feature dir
+        self._config_key = None
+        self._head_key = None
+        self._git_paths: Optional[tuple] = None
+        self._events: deque = deque(maxlen=EVENT_BACKLOG)
+        self.event_seq = 0
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()  # One refresh at a time
+        self._changed = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Build the index and start watching for changes"""
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name='dashboard-index', daemon=True)
+        self._thread.start()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def stop(self):
+        """Stop the watcher thread and release waiting event streams"""
+        self._stop.set()
+        with self._changed:
+            self._changed.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval * 2)
+            self._thread = None
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error refreshing project index: {e}")
+
+    def refresh(self) -> bool:
+        """
+        Re-read features whose fingerprint changed and publish change events.
+
+        Safe to call from any thread; concurrent calls (the watcher and a
+        writer wanting its change visible) run one after the other, so
+        each diff is taken against the previous refresh's result.
+
+        Returns:
+            True if any feature changed since the previous refresh
+        """
+        with self._refresh_lock:
+            return self._refresh()
+
+    def _refresh(self) -> bool:
+        # Project mode is embedded in every feature, so a config change
+        # invalidates all entries
+        config_key = _stat_key(Path('.spec-mix') / 'config.json')
+        entries = self._entries if config_key == self._config_key else {}
+
+        new_entries = {}
+        order = []
+        by_id = {}
+        updated = []
+        vanished = []  # Features whose info could no longer be read
+        reread = False
+        kanban_changes = []
+
+        # Fingerprint every feature (stat calls only, so done inline to keep
+        # the idle poll cheap), then re-read the stale ones on the scan threads
+        feature_dirs = list(iter_feature_dirs())
+        signatures = [
+            feature_signature(feature_dir, hotfix=is_hotfix_dir(feature_dir, worktree))
+            for feature_dir, worktree in feature_dirs
+        ]
+        stale = [
+            item for item, signature in zip(feature_dirs, signatures)
+            if entries.get(str(item[0]), {}).get('signature') != signature
+        ]
+        infos = dict(zip((str(item[0]) for item in stale), read_features(stale)))
+
+        for (feature_dir, worktree), signature in zip(feature_dirs, signatures):
+            key = str(feature_dir)
+            hotfix = is_hotfix_dir(feature_dir, worktree)
+
+            entry = entries.get(key)
+            if entry is None or entry['signature'] != signature:
+                info = infos[key]
+
+                # Boards someone has looked at are rebuilt eagerly so
+                # their lane changes can be pushed to event streams
+                old_kanban = self._entries.get(key, {}).get('kanban')
+                kanban = None
+                if old_kanban is not None:
+                    kanban = load_feature_kanban(feature_dir)
+                    lanes = {
+                        lane: tasks for lane, tasks in kanban.get('lanes', {}).items()
+                        if old_kanban.get('lanes', {}).get(lane) != tasks
+                    }
+                    if lanes or kanban.get('phases') != old_kanban.get('phases'):
+                        change = {'feature_id': feature_dir.name, 'lanes': lanes}
+                        if kanban.get('is_phase_mode'):
+                            change['is_phase_mode'] = True
+                            change['phases'] = kanban.get('phases', {})
+                        kanban_changes.append(change)
+
+                # Unreadable features (e.g. half-created) are stored too, with
+                # no info, so they are not re-read until they change again
+                entry = {
+                    'signature': signature,
+                    'path': feature_dir,
+                    'info': info,
+                    'kanban': kanban,
+                }
+                reread = True
+                if info:
+                    updated.append(info)
+                elif self._entries.get(key, {}).get('info'):
+                    vanished.append(key)
+
+            new_entries[key] = entry
+            order.append(key)
+            if not hotfix:
+                by_id.setdefault(feature_dir.name, key)
+
+        removed = [key for key in self._entries if key not in new_entries] + vanished
+        changed = bool(updated or removed) or order != self._order
+        head_key = self._git_head_key()
+
+        with self._lock:
+            first_build = self.version == 0
+            self._config_key = config_key
+            if changed or reread:
+                self._entries = new_entries
+                self._order = order
+                self._by_id = by_id
+            if changed:
+                self.version += 1
+
+            if not first_build:
+                if updated or removed:
+                    self._publish('features', {'updated': updated, 'removed': removed})
+                for change in kanban_changes:
+                    self._publish('kanban', change)
+                if head_key != self._head_key:
+                    self._publish('head', {})
+            self._head_key = head_key
+
+        return changed
+
+    def _git_head_key(self) -> Optional[tuple]:
+        """Fingerprint git HEAD and the branch it points to"""
+        if self._git_paths is None:
+            result = run_git(['rev-parse', '--git-dir', '--git-common-dir'])
+            if result is not None and result.returncode == 0:
+                self._git_paths = tuple(Path(line) for line in result.stdout.split('\n')[:2])
+            else:
+                self._git_paths = ()
+        if len(self._git_paths) != 2:
+            return None
+
+        git_dir, common_dir = self._git_paths
+        try:
+            head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+        if head.startswith('ref: '):
+            return (head, _stat_key(common_dir / head[5:]), _stat_key(common_dir / 'packed-refs'))
+        return (head,)
+
+    def _publish(self, event_type: str, data: Dict[str, Any]):
+        """Record a change event and wake up event streams (lock held)"""
+        self.event_seq += 1
+        self._events.append((self.event_seq, {'type': event_type, 'data': data}))
+        self._changed.notify_all()
+
+    def wait_for_events(self, after: int, timeout: float) -> Optional[List[tuple]]:
+        """
+        Wait for change events newer than sequence number ``after``.
+
+        Returns:
+            List of (seq, event) tuples (empty on timeout), or None if
+            events were dropped from the backlog and the caller must resync
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self.event_seq > after or self.stopped, timeout)
+            events = [(seq, event) for seq, event in self._events if seq > after]
+            if events and events[0][0] != after + 1:
+                return None
+            return events
+
+    def etag(self, resource: str) -> str:
+        """Return an ETag for a resource derived from the index version"""
+        return f'"{resource}-{self._instance}-{self.version}"'
+
+    def features(self) -> List[Dict[str, Any]]:
+        """Return feature infos in scan order"""
+        with self._lock:
+            return [self._entries[key]['info'] for key in self._order
+                    if self._entries[key]['info']]
+
+    def kanban(self, feature_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the kanban board for a feature, or None if it is not indexed.
+
+        Boards are built lazily and cached until the feature changes. The
+        board is read from disk outside the lock, so a cold board does not
+        hold up other readers or refresh().
+        """
+        with self._lock:
+            key = self._by_id.get(feature_id)
+            if key is None:
+                return None
+            entry = self._entries[key]
+            if entry['kanban'] is not None:
+                return entry['kanban']
+            path, signature = entry['path'], entry['signature']
+
+        kanban = load_feature_kanban(path)
+
+        with self._lock:
+            # Keep the board only if the feature did not change while it was read
+            entry = self._entries.get(key)
+            if entry is not None and entry['signature'] == signature:
+                if entry['kanban'] is None:
+                    entry['kanban'] = kanban
+                return entry['kanban']
+        return kanban
+
+
+def get_artifact_content(feature_id: str, artifact_name: str) -> Optional[str]:
+    """Get content of an artifact"""
+    feature_path = find_feature_path(feature_id)
     if not feature_path:
         return None
 
@@ -824,26 +2300,277 @@ def get_artifact_content(feature_id: str, artifact_name: str) -> Optional[str]:
     return None
 
 
-def get_task_detail(feature_id: str, lane: str, task_id: str) -> Optional[Dict[str, Any]]:
-    """Get detailed information about a specific task"""
-    import re
+# Dependency declarations in work package files and tasks.md sections
+_DEPENDENCY_LIST = re.compile(r'(?:Dependencies|Depends on|Requires):\s*(.+?)(?:\n\n|\Z)', re.IGNORECASE | re.DOTALL)
+_DEPENDENCY_ID = re.compile(r'\b([A-Z]+-?\d+)\b')
+_DEPENDENCY_SPLIT = re.compile(r'[,\s]+')
+
+# A header task and its body in tasks.md, up to the next ### or ## heading
+_HEADER_SECTION = re.compile(
+    r'^### ([A-Z]+-[\d.]+|T[\d.]+):?\s*(.+?)$\n(.*?)(?=^### |^## |\Z)',
+    re.MULTILINE | re.DOTALL
+)
+
+
+class FeatureResolver:
+    """
+    Cached map of feature IDs to feature directories.
+
+    Features live in specs/<id> or .worktrees/<name>/specs/<id>; specs/ wins
+    when both exist. The map is rebuilt in one pass when specs/ or .worktrees/
+    changes (a feature or worktree added or removed). An ID that is unknown,
+    or whose cached directory vanished, is probed directly in specs/ and each
+    known worktree, which picks up features created inside an existing
+    worktree. Known IDs cost two stat calls instead of a walk over every
+    worktree.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stamp: Optional[tuple] = None
+        self._paths: Dict[str, Path] = {}
+        self._worktree_specs: List[Path] = []
+
+    @staticmethod
+    def _read_stamp() -> tuple:
+        """Return the (cwd, specs/ mtime, .worktrees/ mtime) the map depends on"""
+        stamp = [os.getcwd()]
+        for name in ('specs', '.worktrees'):
+            try:
+                stamp.append(os.stat(name).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    @staticmethod
+    def _feature_dirs(specs_dir: Path):
+        try:
+            with os.scandir(specs_dir) as entries:
+                return [(entry.name, Path(entry.path)) for entry in entries if entry.is_dir()]
+        except OSError:
+            return []
+
+    def _refresh(self):
+        stamp = self._read_stamp()
+        if stamp == self._stamp:
+            return
+
+        try:
+            with os.scandir('.worktrees') as worktrees:
+                self._worktree_specs = [Path(entry.path) / 'specs' for entry in worktrees]
+        except OSError:
+            self._worktree_specs = []
+
+        paths: Dict[str, Path] = {}
+        for specs_dir in self._worktree_specs:
+            for name, path in self._feature_dirs(specs_dir):
+                paths.setdefault(name, path)
+
+        # specs/ takes precedence over worktrees
+        for name, path in self._feature_dirs(Path('specs')):
+            paths[name] = path
+
+        self._paths = paths
+        self._stamp = stamp
+
+    def _probe(self, feature_id: str) -> Optional[Path]:
+        """Look for one feature directly, without rescanning everything"""
+        if feature_id in ('.', '..') or os.sep in feature_id or '/' in feature_id:
+            return None
+        for specs_dir in [Path('specs'), *self._worktree_specs]:
+            path = specs_dir / feature_id
+            if path.is_dir():
+                return path
+        return None
+
+    def resolve_many(self, feature_ids: List[str]) -> Dict[str, Optional[Path]]:
+        """Resolve several feature IDs at once; unknown IDs map to None"""
+        with self._lock:
+            self._refresh()
+            result = {}
+            for feature_id in feature_ids:
+                path = self._paths.get(feature_id)
+                if path is None or not path.is_dir():
+                    path = self._probe(feature_id)
+                    if path is not None:
+                        self._paths[feature_id] = path
+                    else:
+                        self._paths.pop(feature_id, None)
+                result[feature_id] = path
+            return result
+
+    def resolve(self, feature_id: str) -> Optional[Path]:
+        """Resolve one feature ID to its directory, or None"""
+        if not feature_id:
+            return None
+        return self.resolve_many([feature_id])[feature_id]
+
+    def feature_ids(self) -> List[str]:
+        """Return every known feature ID"""
+        with self._lock:
+            self._refresh()
+            return sorted(self._paths)
+
+    def invalidate(self):
+        """Force a rescan on the next lookup"""
+        with self._lock:
+            self._stamp = None
+
+
+_feature_resolver = FeatureResolver()
+
+
+def find_feature_path(feature_id: str) -> Optional[Path]:
+    """Find a feature directory in specs/ or .worktrees/*/specs/"""
+    return _feature_resolver.resolve(feature_id)
+
+
+def find_feature_paths(feature_ids: List[str]) -> Dict[str, Optional[Path]]:
+    """Find several feature directories at once (see FeatureResolver)"""
+    return _feature_resolver.resolve_many(feature_ids)
+
+
+def parse_dependency_text(content: str) -> List[str]:
+    """Extract task IDs from a Dependencies:/Depends on:/Requires: declaration"""
+    match = _DEPENDENCY_LIST.search(content)
+    if not match:
+        return []
+    # Extract task IDs (WP-XX, TXXXX, etc.)
+    return _DEPENDENCY_ID.findall(match.group(1).strip())
+
+
+def parse_work_package(content: str, task_id: str) -> tuple:
+    """
+    Extract title and dependencies from a work package file.
+
+    The title comes from frontmatter, falling back to the first markdown
+    heading. Dependencies come from frontmatter, falling back to a
+    Dependencies:/Depends on:/Requires: line in the body.
+
+    Returns:
+        Tuple of (title, dependencies)
+    """
     import yaml
 
-    # Try to find feature
-    feature_path = None
+    title = task_id
+    dependencies = []
+    lines = content.split('\n')
+
+    # Try to extract from frontmatter
+    if lines and lines[0].strip() == '---':
+        frontmatter_lines = []
+        for line in lines[1:]:
+            if line.strip() == '---':
+                break
+            frontmatter_lines.append(line)
+
+        if frontmatter_lines:
+            try:
+                frontmatter = yaml.safe_load('\n'.join(frontmatter_lines))
+                if frontmatter:
+                    if 'title' in frontmatter:
+                        title = str(frontmatter['title'])
+                    if 'dependencies' in frontmatter:
+                        deps = frontmatter['dependencies']
+                        if isinstance(deps, list):
+                            dependencies = deps
+                        elif isinstance(deps, str):
+                            # Parse comma-separated or space-separated
+                            dependencies = [d.strip() for d in _DEPENDENCY_SPLIT.split(deps) if d.strip()]
+            except:
+                pass
+
+    # If no frontmatter title, try first markdown heading
+    if title == task_id:
+        for line in lines:
+            if line.startswith('# '):
+                title = line.strip('# \n')
+                break
+
+    # Extract dependencies from content if not in frontmatter
+    if not dependencies:
+        dependencies = parse_dependency_text(content)
+
+    return title, dependencies
+
+
+# Task ID -> lane maps per feature: feature path -> (stat key, lane map)
+_lane_map_cache = FileCache()
+
+
+def board_stamp(feature_path: Path) -> tuple:
+    """
+    Fingerprint of where a feature's tasks live: tasks.md and the lane directories.
+
+    Adding, removing or moving a task file changes its lane directory's
+    stamp, and any tasks.md edit changes the file's, so an unchanged stamp
+    means the set of task IDs is unchanged.
+    """
+    tasks_dir = feature_path / 'tasks'
+    return (_stat_key(feature_path / 'tasks.md'),) + tuple(
+        _stat_key(tasks_dir / lane) for lane in ['planned', 'doing', 'for_review', 'done']
+    )
+
+
+def get_task_lane_map(feature_path: Path) -> Dict[str, str]:
+    """
+    Map every task ID in a feature to its lane.
+
+    Work package files in tasks/<lane>/ take precedence over tasks.md
+    entries. The map is cached until tasks.md or a lane directory changes,
+    so resolving any number of task IDs costs a handful of stats.
+    """
+    tasks_dir = feature_path / 'tasks'
+    tasks_file = feature_path / 'tasks.md'
+    lanes = ['planned', 'doing', 'for_review', 'done']
+
+    stat_key = board_stamp(feature_path)
+    cached = _lane_map_cache.get(str(feature_path))
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+
+    lane_map: Dict[str, str] = {}
+
+    # Directory-based structure
+    if tasks_dir.is_dir():
+        for lane in lanes:
+            lane_dir = tasks_dir / lane
+            if lane_dir.is_dir():
+                for task_file in lane_dir.glob('*.md'):
+                    lane_map.setdefault(task_file.stem, lane)
+
+    # tasks.md file
+    if stat_key[0] is not None:
+        try:
+            kanban_data = parse_tasks_markdown(tasks_file)
+            for lane, tasks in kanban_data['lanes'].items():
+                for task in tasks:
+                    lane_map.setdefault(task['id'], lane)
+        except:
+            pass
+
+    _lane_map_cache[str(feature_path)] = (stat_key, lane_map)
+    return lane_map
 
-    specs_path = Path('specs') / feature_id
-    if specs_path.exists():
-        feature_path = specs_path
-    else:
-        worktrees_dir = Path('.worktrees')
-        if worktrees_dir.exists():
-            for worktree_dir in worktrees_dir.iterdir():
-                worktree_specs = worktree_dir / 'specs' / feature_id
-                if worktree_specs.exists():
-                    feature_path = worktree_specs
-                    break
 
+def find_task_lanes(feature_path: Path, task_ids: List[str]) -> Dict[str, Optional[str]]:
+    """Find the lane of each task ID (None if not found)"""
+    lane_map = get_task_lane_map(feature_path)
+    return {task_id: lane_map.get(task_id) for task_id in task_ids}
+
+
+def _dependencies_with_lane(feature_path: Path, dependencies: List[str]) -> List[Dict[str, str]]:
+    """Attach the current lane to each dependency ID"""
+    lanes = find_task_lanes(feature_path, [str(dep_id) for dep_id in dependencies])
+    return [
+        {'id': dep_id, 'lane': lanes[str(dep_id)] or 'planned'}
+        for dep_id in dependencies
+    ]
+
+
+def get_task_detail(feature_id: str, lane: str, task_id: str) -> Optional[Dict[str, Any]]:
+    """Get detailed information about a specific task"""
+    feature_path = find_feature_path(feature_id)
     if not feature_path:
         return None
 
@@ -856,70 +2583,14 @@ def get_task_detail(feature_id: str, lane: str, task_id: str) -> Optional[Dict[s
                 with open(task_file, 'r', encoding='utf-8') as f:
                     content = f.read()
 
-                # Extract title and dependencies from frontmatter
-                title = task_id
-                dependencies = []
-                lines = content.split('\n')
-
-                # Try to extract from frontmatter
-                if lines and lines[0].strip() == '---':
-                    frontmatter_lines = []
-                    end_index = 0
-                    for i, line in enumerate(lines[1:], 1):
-                        if line.strip() == '---':
-                            end_index = i
-                            break
-                        frontmatter_lines.append(line)
-
-                    if frontmatter_lines:
-                        try:
-                            frontmatter = yaml.safe_load('\n'.join(frontmatter_lines))
-                            if frontmatter:
-                                if 'title' in frontmatter:
-                                    title = str(frontmatter['title'])
-                                if 'dependencies' in frontmatter:
-                                    deps = frontmatter['dependencies']
-                                    if isinstance(deps, list):
-                                        dependencies = deps
-                                    elif isinstance(deps, str):
-                                        # Parse comma-separated or space-separated
-                                        dependencies = [d.strip() for d in re.split(r'[,\s]+', deps) if d.strip()]
-                        except:
-                            pass
-
-                # If no frontmatter title, try first markdown heading
-                if title == task_id:
-                    for line in lines:
-                        if line.startswith('# '):
-                            title = line.strip('# \n')
-                            break
-
-                # Extract dependencies from content if not in frontmatter
-                if not dependencies:
-                    # Look for "Dependencies:", "Depends on:", "Requires:" sections
-                    dep_pattern = re.compile(r'(?:Dependencies|Depends on|Requires):\s*(.+?)(?:\n\n|\Z)', re.IGNORECASE | re.DOTALL)
-                    match = dep_pattern.search(content)
-                    if match:
-                        dep_text = match.group(1).strip()
-                        # Extract task IDs (WP-XX, TXXXX, etc.)
-                        task_id_pattern = re.compile(r'\b([A-Z]+-?\d+)\b')
-                        dependencies = task_id_pattern.findall(dep_text)
-
-                # Find lane for each dependency
-                dependencies_with_lane = []
-                for dep_id in dependencies:
-                    dep_lane = find_task_lane(feature_path, dep_id)
-                    dependencies_with_lane.append({
-                        'id': dep_id,
-                        'lane': dep_lane or 'planned'
-                    })
+                title, dependencies = parse_work_package(content, task_id)
 
                 return {
                     'id': task_id,
                     'title': title,
                     'lane': lane,
                     'content': content,
-                    'dependencies': dependencies_with_lane,
+                    'dependencies': _dependencies_with_lane(feature_path, dependencies),
                     'path': str(task_file),
                     'type': 'work_package'
                 }
@@ -934,8 +2605,6 @@ def get_task_detail(feature_id: str, lane: str, task_id: str) -> Optional[Dict[s
             with open(tasks_file, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            dependencies = []
-
             # Find task section (### TASK_ID: or - [ ] TASK_ID)
             # Pattern 1: Header format (### WP-01: Task Title)
             header_pattern = re.compile(
@@ -950,28 +2619,14 @@ def get_task_detail(feature_id: str, lane: str, task_id: str) -> Optional[Dict[s
                 task_content = f"# {task_id}: {title}\n\n{task_section}"
 
                 # Extract dependencies from task section
-                dep_pattern = re.compile(r'(?:Dependencies|Depends on|Requires):\s*(.+?)(?:\n\n|\Z)', re.IGNORECASE | re.DOTALL)
-                dep_match = dep_pattern.search(task_section)
-                if dep_match:
-                    dep_text = dep_match.group(1).strip()
-                    task_id_pattern = re.compile(r'\b([A-Z]+-?\d+)\b')
-                    dependencies = task_id_pattern.findall(dep_text)
-
-                # Find lane for each dependency
-                dependencies_with_lane = []
-                for dep_id in dependencies:
-                    dep_lane = find_task_lane(feature_path, dep_id)
-                    dependencies_with_lane.append({
-                        'id': dep_id,
-                        'lane': dep_lane or 'planned'
-                    })
+                dependencies = parse_dependency_text(task_section)
 
                 return {
                     'id': task_id,
                     'title': title,
                     'lane': lane,
                     'content': task_content,
-                    'dependencies': dependencies_with_lane,
+                    'dependencies': _dependencies_with_lane(feature_path, dependencies),
                     'path': str(tasks_file),
                     'type': 'tasks_md'
                 }
@@ -1007,36 +2662,296 @@ def get_task_detail(feature_id: str, lane: str, task_id: str) -> Optional[Dict[s
 
 def find_task_lane(feature_path: Path, task_id: str) -> Optional[str]:
     """Find which lane a task is in"""
-    tasks_dir = feature_path / 'tasks'
+    return get_task_lane_map(feature_path).get(task_id)
 
-    if tasks_dir.exists() and tasks_dir.is_dir():
-        # Check directory-based structure
+
+def get_dependency_graph(feature_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Build the task dependency graph for a feature.
+
+    Every work package file and tasks.md entry is read once, so the graph
+    is computed in O(tasks).
+
+    Returns:
+        Dict with 'nodes' (id, title, lane, dependencies, blocked) and
+        'edges' ({'from': dependency, 'to': dependent}), or None if the
+        feature does not exist
+    """
+    feature_path = find_feature_path(feature_id)
+    if not feature_path:
+        return None
+
+    nodes: Dict[str, Dict[str, Any]] = {}
+
+    # Work package files
+    tasks_dir = feature_path / 'tasks'
+    if tasks_dir.is_dir():
         for lane in ['planned', 'doing', 'for_review', 'done']:
             lane_dir = tasks_dir / lane
-            if lane_dir.exists():
-                task_file = lane_dir / f'{task_id}.md'
-                if task_file.exists():
-                    return lane
+            if not lane_dir.is_dir():
+                continue
+            for task_file in sorted(lane_dir.glob('*.md')):
+                if task_file.stem in nodes:
+                    continue
+                try:
+                    with open(task_file, 'r', encoding='utf-8') as f:
+                        title, dependencies = parse_work_package(f.read(), task_file.stem)
+                except Exception as e:
+                    print(f"Error reading task file {task_file}: {e}")
+                    continue
+                nodes[task_file.stem] = {
+                    'id': task_file.stem,
+                    'title': title,
+                    'lane': lane,
+                    'dependencies': [str(dep) for dep in dependencies]
+                }
 
-    # Check tasks.md file
+    # tasks.md entries; only header tasks can declare dependencies
     tasks_file = feature_path / 'tasks.md'
     if tasks_file.exists():
+        section_dependencies = {}
         try:
-            kanban_data = parse_tasks_markdown(tasks_file)
-            for lane, tasks in kanban_data['lanes'].items():
-                for task in tasks:
-                    if task['id'] == task_id:
-                        return lane
-        except:
-            pass
+            with open(tasks_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+            for match in _HEADER_SECTION.finditer(content):
+                section_dependencies.setdefault(match.group(1), parse_dependency_text(match.group(3).strip()))
+        except Exception as e:
+            print(f"Error parsing tasks file {tasks_file}: {e}")
 
-    return None
+        for lane, tasks in parse_tasks_markdown(tasks_file)['lanes'].items():
+            for task in tasks:
+                if task['id'] not in nodes:
+                    nodes[task['id']] = {
+                        'id': task['id'],
+                        'title': task['title'],
+                        'lane': lane,
+                        'dependencies': section_dependencies.get(task['id'], [])
+                    }
+
+    edges = []
+    for node in nodes.values():
+        blocked = False
+        for dep_id in node['dependencies']:
+            edges.append({'from': dep_id, 'to': node['id']})
+            dep = nodes.get(dep_id)
+            if dep is None or dep['lane'] != 'done':
+                blocked = True
+        node['blocked'] = blocked and node['lane'] != 'done'
+
+    return {
+        'feature_id': feature_id,
+        'nodes': list(nodes.values()),
+        'edges': edges
+    }
+
+
+# Tokens shaped like a task ID in commit messages: WP04, WP04.3, WP-001, T5,
+# T005, T0.1, TASK-1. Only tokens that are task IDs on some board are kept
+# (see CommitIndex), so UTF-8, HTTP2 or CVE-2024 never count as tasks.
+_COMMIT_TASK_ID = re.compile(r'\b([A-Z]+-?\d+(?:\.\d+)*)\b')
+
+
+def _commit_task_tokens(message: str, known_ids) -> set:
+    """
+    Extract the task IDs a commit message mentions.
+
+    Dotted IDs also yield their parents, so a commit for WP04.3 is listed
+    under WP04 as well. Tokens not in known_ids are dropped.
+    """
+    tokens = set()
+    for token in _COMMIT_TASK_ID.findall(message):
+        while True:
+            if token in known_ids:
+                tokens.add(token)
+            if '.' not in token:
+                break
+            token = token.rsplit('.', 1)[0]
+    return tokens
+
+
+def project_task_ids() -> set:
+    """Return every task ID on any feature's board, worktrees included"""
+    task_ids = set()
+    for feature_dir, worktree in iter_feature_dirs():
+        if not is_hotfix_dir(feature_dir, worktree):
+            task_ids.update(get_task_lane_map(feature_dir))
+    return task_ids
+
+
+class CommitIndex:
+    """
+    Index of commits by the task IDs their messages mention.
+
+    Built with a single streaming pass over ``git log --all --name-status``
+    and extended incrementally: when refs move forward, only commits between
+    the previously indexed tips and the new ones are read. A deleted or
+    rewritten ref triggers a full rebuild. Only commits that mention a task
+    ID currently on a board are kept, so memory scales with tracked work
+    rather than history size; when new task IDs appear, history is read
+    again so older commits that mention them are found.
+    """
+
+    def __init__(self, task_ids=None):
+        self._task_ids = task_ids or project_task_ids  # Returns the known task IDs
+        self._known: frozenset = frozenset()  # Task IDs the index was built for
+        self._lock = threading.Lock()
+        self._refs: Optional[Dict[str, str]] = None  # ref name -> sha
+        self._commits: Dict[str, Dict[str, Any]] = {}  # sha -> commit
+        self._by_task: Dict[str, List[str]] = {}  # task ID -> shas, newest first
+        self._refs_read_at: Optional[float] = None  # monotonic time of the last show-ref
+
+    def _read_refs(self) -> Optional[Dict[str, str]]:
+        """Return {ref name: sha} for HEAD and every ref, or None without git"""
+        result = run_git(['show-ref', '--head'])
+        if result is None or result.returncode not in (0, 1):
+            return None
+        refs = {}
+        for line in result.stdout.splitlines():
+            sha, _, name = line.partition(' ')
+            if name:
+                refs[name] = sha
+        return refs
+
+    def _is_fast_forward(self, old_refs: Dict[str, str], new_refs: Dict[str, str]) -> bool:
+        """Check that every previously indexed ref still exists and only moved forward"""
+        for name, old_sha in old_refs.items():
+            new_sha = new_refs.get(name)
+            if new_sha is None:
+                return False
+            if new_sha != old_sha and name != 'HEAD':
+                result = run_git(['merge-base', '--is-ancestor', old_sha, new_sha])
+                if result is None or result.returncode != 0:
+                    return False
+        return True
+
+    def _scan(self, revisions: List[str], known_ids: frozenset) -> Optional[tuple]:
+        """
+        Stream commits for the given revision arguments.
+
+        Returns:
+            (commits, by_task) for commits mentioning a task ID, newest first,
+            or None if git failed
+        """
+        commits: Dict[str, Dict[str, Any]] = {}
+        by_task: Dict[str, List[str]] = {}
+
+        def add(record: str):
+            header, _, name_status = record.partition('\x1d')
+            parts = header.split(_GIT_FIELD, 4)
+            if len(parts) < 5:
+                return
+            sha, subject, date, author, body = parts
+            tokens = _commit_task_tokens(body, known_ids)
+            if not tokens:
+                return
+
+            files = []
+            for line in name_status.split('\n'):
+                status, sep, path = line.partition('\t')
+                if sep:
+                    files.append((status, path))
+
+            commits[sha] = {
+                'sha': sha,
+                'short_sha': sha[:7],
+                'message': subject,
+                'date': date,
+                'author': author,
+                'files': files
+            }
+            for token in tokens:
+                by_task.setdefault(token, []).append(sha)
+
+        log_format = _GIT_RECORD + _GIT_FIELD.join(['%H', '%s', '%cd', '%an', '%B']) + '%x1d'
+        with git_stream(['log', *revisions, '--name-status',
+                         f'--format={log_format}', '--date=iso-strict']) as proc:
+            if proc is None:
+                return None
+
+            pending = ''
+            while True:
+                chunk = proc.stdout.read(65536)
+                if not chunk:
+                    break
+                records = (pending + chunk).split(_GIT_RECORD)
+                pending = records.pop()
+                for record in records:
+                    if record:
+                        add(record)
+            if pending:
+                add(pending)
+
+        if proc.returncode != 0:
+            return None
+        return commits, by_task
+
+    def refresh(self) -> bool:
+        """
+        Bring the index up to date with the repository's refs and the
+        task IDs on the boards.
+
+        Returns:
+            False if git is unavailable, True otherwise
+        """
+        with self._lock:
+            refs = self._read_refs()
+            if refs is None:
+                return False
+            known = frozenset(self._task_ids())
+            new_ids = not known <= self._known
+            if refs == self._refs and not new_ids:
+                self._refs_read_at = time.monotonic()
+                return True
+
+            old_refs = self._refs
+            if not new_ids and old_refs is not None and self._is_fast_forward(old_refs, refs):
+                new_tips = sorted(set(refs.values()) - set(old_refs.values()))
+                if new_tips:
+                    scanned = self._scan(new_tips + ['--not'] + sorted(set(old_refs.values())), self._known)
+                    if scanned is None:
+                        return False
+                    commits, by_task = scanned
+                    self._commits.update(commits)
+                    for task_id, shas in by_task.items():
+                        self._by_task[task_id] = shas + self._by_task.get(task_id, [])
+            else:
+                scanned = self._scan(['--all'], known) if refs else ({}, {})
+                if scanned is None:
+                    return False
+                self._commits, self._by_task = scanned
+                self._known = known
+
+            self._refs = refs
+            self._refs_read_at = time.monotonic()
+            return True
+
+    def commits_for(self, task_id: str) -> List[Dict[str, Any]]:
+        """
+        Return commits mentioning a task ID, newest first.
+
+        Refs are re-read at most every COMMIT_REFS_TTL seconds, so opening
+        several tasks in a row costs one `git show-ref`.
+        """
+        read_at = self._refs_read_at
+        if read_at is None or time.monotonic() - read_at >= COMMIT_REFS_TTL:
+            if not self.refresh():
+                return []
+        with self._lock:
+            return [self._commits[sha] for sha in self._by_task.get(task_id, [])]
+
+
+_commit_index = CommitIndex()
 
 
 def get_task_commits(feature_id: str, task_id: str) -> List[Dict[str, Any]]:
     """
     Get git commits associated with a task.
 
+    Supports multiple message formats:
+    - [WP04.3] Description (bracketed)
+    - feat: WP04.3 Description (conventional commits)
+    - WP04.3: Description (plain)
+
     Args:
         feature_id: Feature ID (e.g., '001-feature-name')
         task_id: Task ID (e.g., 'WP01', 'WP01.1', 'T005')
@@ -1044,51 +2959,11 @@ def get_task_commits(feature_id: str, task_id: str) -> List[Dict[str, Any]]:
     Returns:
         List of commits with sha, message, date, author
     """
-    import subprocess
-
-    # Check if git is available
     try:
-        subprocess.run(['git', 'rev-parse', '--git-dir'],
-                      capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return []
-
-    try:
-        # Get commits that mention this task ID
-        # Supports multiple formats:
-        # - [WP04.3] Description (bracketed)
-        # - feat: WP04.3 Description (conventional commits)
-        # - WP04.3: Description (plain)
-        import re
-        escaped_task_id = re.escape(task_id)
-        result = subprocess.run(
-            ['git', 'log', '--all', f'--grep={escaped_task_id}',
-             '--format=%H|%s|%cd|%an', '--date=iso-strict'],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if result.returncode != 0:
-            return []
-
-        commits = []
-        for line in result.stdout.strip().split('\n'):
-            if not line:
-                continue
-
-            parts = line.split('|', 3)
-            if len(parts) >= 4:
-                sha, message, date, author = parts
-                commits.append({
-                    'sha': sha,
-                    'short_sha': sha[:7],
-                    'message': message,
-                    'date': date,
-                    'author': author
-                })
-
-        return commits
+        return [
+            {key: commit[key] for key in ('sha', 'short_sha', 'message', 'date', 'author')}
+            for commit in _commit_index.commits_for(task_id)
+        ]
     except Exception as e:
         print(f"Error getting commits for task {task_id}: {e}")
         return []
@@ -1105,78 +2980,27 @@ def get_task_files(feature_id: str, task_id: str) -> List[Dict[str, Any]]:
     Returns:
         List of file changes with commit, path, action, timestamp
     """
-    import subprocess
-
-    commits = get_task_commits(feature_id, task_id)
-    if not commits:
+    try:
+        commits = _commit_index.commits_for(task_id)
+    except Exception as e:
+        print(f"Error getting files for task {task_id}: {e}")
         return []
 
     file_changes = []
-
     for commit in commits:
-        try:
-            # Get files changed in this commit
-            result = subprocess.run(
-                ['git', 'show', '--name-status', '--format=', commit['sha']],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-
-            if result.returncode != 0:
-                continue
-
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                parts = line.split('\t', 1)
-                if len(parts) >= 2:
-                    status, path = parts
-                    file_changes.append({
-                        'commit': commit['short_sha'],
-                        'commit_sha': commit['sha'],
-                        'path': path,
-                        'action': status,  # A=added, M=modified, D=deleted
-                        'timestamp': commit['date'],
-                        'message': commit['message']
-                    })
-        except Exception as e:
-            print(f"Error getting files for commit {commit['sha']}: {e}")
-            continue
+        for status, path in commit['files']:
+            file_changes.append({
+                'commit': commit['short_sha'],
+                'commit_sha': commit['sha'],
+                'path': path,
+                'action': status,  # A=added, M=modified, D=deleted
+                'timestamp': commit['date'],
+                'message': commit['message']
+            })
 
     return file_changes
 
 
-def get_commit_diff(commit_sha: str) -> Optional[str]:
-    """
-    Get the diff for a specific commit.
-
-    Args:
-        commit_sha: Full or short commit SHA
-
-    Returns:
-        Diff output as string, or None if error
-    """
-    import subprocess
-
-    try:
-        result = subprocess.run(
-            ['git', 'show', commit_sha],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if result.returncode != 0:
-            return None
-
-        return result.stdout
-    except Exception as e:
-        print(f"Error getting diff for commit {commit_sha}: {e}")
-        return None
-
-
 def get_task_reviews(feature_id: str, task_id: str) -> List[Dict[str, Any]]:
     """
     Parse review history from a task's Activity Log.
@@ -1188,15 +3012,13 @@ def get_task_reviews(feature_id: str, task_id: str) -> List[Dict[str, Any]]:
     Returns:
         List of review entries with timestamp, decision, reviewer, issues, and notes
     """
-    # Find the task file
-    specs_dir = Path('specs')
-    feature_path = None
-
-    # Try to find feature directory
-    for spec_dir in specs_dir.glob('*'):
-        if spec_dir.is_dir() and feature_id in spec_dir.name:
-            feature_path = spec_dir
-            break
+    # Find the feature directory; partial IDs match the first feature containing them
+    feature_path = find_feature_path(feature_id)
+    if not feature_path:
+        for known_id in _feature_resolver.feature_ids():
+            if feature_id in known_id:
+                feature_path = find_feature_path(known_id)
+                break
 
     if not feature_path:
         return []
@@ -1315,10 +3137,27 @@ def find_free_port(start_port: int = DEFAULT_PORT) -> int:
     raise RuntimeError(f"Could not find free port in range {start_port}-{start_port + MAX_PORT_ATTEMPTS}")
 
 
-def start_dashboard(port: Optional[int] = None, open_browser: bool = False) -> tuple[HTTPServer, int, str]:
+def start_dashboard(port: Optional[int] = None, open_browser: bool = False,
+                    workers: int = DEFAULT_WORKERS,
+                    request_timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT,
+                    max_git_processes: int = DEFAULT_MAX_GIT_PROCESSES,
+                    max_event_streams: int = DEFAULT_MAX_EVENT_STREAMS,
+                    diff_max_bytes: int = DEFAULT_DIFF_MAX_BYTES,
+                    scan_workers: int = DEFAULT_SCAN_WORKERS) -> tuple[DashboardServer, int, str]:
     """
     Start the dashboard server.
 
+    Args:
+        port: Port to listen on (default: first free port from DEFAULT_PORT)
+        open_browser: Open the dashboard in a browser
+        workers: Number of worker threads serving requests concurrently
+        request_timeout: Socket idle timeout in seconds; a connection is
+            closed once a read or write waits this long
+        max_git_processes: Cap on git subprocesses running at the same time
+        max_event_streams: Cap on concurrent /api/events connections
+        diff_max_bytes: Diff bytes sent per response before paging
+        scan_workers: Threads reading features in parallel when scanning
+
     Returns:
         Tuple of (server, port, shutdown_token)
     """
@@ -1328,9 +3167,22 @@ def start_dashboard(port: Optional[int] = None, open_browser: bool = False) -> t
     # Generate shutdown token
     shutdown_token = secrets.token_urlsafe(32)
 
+    set_max_git_processes(max_git_processes)
+    set_scan_workers(scan_workers)
+
     # Create server
-    server = HTTPServer(('localhost', port), DashboardHandler)
+    server = DashboardServer(('localhost', port), DashboardHandler,
+                             workers=workers, request_timeout=request_timeout,
+                             max_event_streams=max_event_streams)
     server.shutdown_token = shutdown_token
+    server.diff_max_bytes = max(1, diff_max_bytes)
+
+    # Read and pre-compress static assets once
+    server.static_assets = load_static_assets()
+
+    # Build the project index once; it keeps itself current from here on
+    server.index = ProjectIndex()
+    server.index.start()
 
     # Save server info to .spec-mix/
     specify_dir = Path('.spec-mix')
@@ -1389,26 +3241,70 @@ def stop_dashboard(port: Optional[int] = None):
                 file.unlink()
 
 
-def get_untracked_commits(branch: str = 'HEAD', limit: int = 100) -> List[Dict[str, Any]]:
+# Untracked-commit candidates per (branch, limit), keyed by the resolved
+# HEAD sha so an unchanged repository costs a single rev-parse
+_untracked_cache: Dict[tuple, tuple] = {}
+_untracked_lock = threading.Lock()
+
+def load_migrated_commits() -> set:
     """
-    Get commits that don't have Work Package IDs.
+    Collect commit SHAs recorded in specs/*/.migration-info files.
 
-    Args:
-        branch: Git branch to analyze (default: HEAD)
-        limit: Maximum number of commits to check
+    Both full and 7-character short SHAs are included, lowercased.
+    """
+    migrated_commits = set()
+    specs_dir = Path.cwd() / 'specs'
+    if not specs_dir.exists():
+        return migrated_commits
 
-    Returns:
-        List of commits without WP IDs, including sha, message, date, author, files, stats
+    for migration_file in specs_dir.glob('*/.migration-info'):
+        try:
+            with open(migration_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+                # Try to parse as JSON first
+                try:
+                    data = json.loads(content)
+                    if 'migrated_commits' in data:
+                        for sha in data['migrated_commits']:
+                            migrated_commits.add(sha.lower()[:7])  # Short SHA
+                            migrated_commits.add(sha.lower())  # Full SHA
+                except json.JSONDecodeError:
+                    # Fallback: parse text format
+                    in_commits_section = False
+                    for line in content.split('\n'):
+                        line = line.strip()
+                        # Check for "Commits:" section header
+                        if line.lower() == 'commits:':
+                            in_commits_section = True
+                            continue
+                        # Parse commit list: "- abc1234: message"
+                        if in_commits_section and line.startswith('- '):
+                            parts = line[2:].split(':', 1)
+                            if parts:
+                                sha = parts[0].strip()
+                                if sha and len(sha) >= 7:
+                                    migrated_commits.add(sha.lower()[:7])
+                                    migrated_commits.add(sha.lower())
+                        # Also check for single commit format: "Migrated from commit: abc1234"
+                        elif 'migrated from commit' in line.lower() and ':' in line:
+                            sha = line.split(':')[-1].strip()
+                            if sha:
+                                migrated_commits.add(sha.lower()[:7])
+                                migrated_commits.add(sha.lower())
+        except Exception:
+            pass
+
+    return migrated_commits
+
+
+def _scan_untracked_candidates(head_sha: str, limit: int) -> Optional[List[Dict[str, Any]]]:
     """
-    import subprocess
-    import re
+    Read recent commits and their file stats in a single git log pass.
 
-    # Check if git is available
-    try:
-        subprocess.run(['git', 'rev-parse', '--git-dir'],
-                      capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return []
+    Returns commits whose message has no WP ID and that are not merges or
+    automated commits, or None if git failed.
+    """
+    import re
 
     # WP ID patterns to match
     # - WP04.3, WP04
@@ -1416,123 +3312,106 @@ def get_untracked_commits(branch: str = 'HEAD', limit: int = 100) -> List[Dict[s
     # - feat: WP04.3, fix: WP04
     wp_pattern = re.compile(r'\b(?:\[)?WP\d+(?:\.\d+)?(?:\])?', re.IGNORECASE)
 
-    # Load migrated commits from .migration-info files
-    migrated_commits = set()
-    specs_dir = Path.cwd() / 'specs'
-    if specs_dir.exists():
-        for migration_file in specs_dir.glob('*/.migration-info'):
-            try:
-                with open(migration_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Try to parse as JSON first
-                    try:
-                        data = json.loads(content)
-                        if 'migrated_commits' in data:
-                            for sha in data['migrated_commits']:
-                                migrated_commits.add(sha.lower()[:7])  # Short SHA
-                                migrated_commits.add(sha.lower())  # Full SHA
-                    except json.JSONDecodeError:
-                        # Fallback: parse text format
-                        in_commits_section = False
-                        for line in content.split('\n'):
-                            line = line.strip()
-                            # Check for "Commits:" section header
-                            if line.lower() == 'commits:':
-                                in_commits_section = True
-                                continue
-                            # Parse commit list: "- abc1234: message"
-                            if in_commits_section and line.startswith('- '):
-                                parts = line[2:].split(':', 1)
-                                if parts:
-                                    sha = parts[0].strip()
-                                    if sha and len(sha) >= 7:
-                                        migrated_commits.add(sha.lower()[:7])
-                                        migrated_commits.add(sha.lower())
-                            # Also check for single commit format: "Migrated from commit: abc1234"
-                            elif 'migrated from commit' in line.lower() and ':' in line:
-                                sha = line.split(':')[-1].strip()
-                                if sha:
-                                    migrated_commits.add(sha.lower()[:7])
-                                    migrated_commits.add(sha.lower())
-            except Exception:
-                pass
+    candidates = []
+    current = None
 
-    try:
-        # Get recent commits
-        result = subprocess.run(
-            ['git', 'log', branch, f'-{limit}',
-             '--format=%H|%s|%cd|%an', '--date=iso-strict'],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if result.returncode != 0:
-            return []
-
-        untracked = []
-        for line in result.stdout.strip().split('\n'):
-            if not line:
-                continue
+    def finish(commit):
+        if commit is None:
+            return
+        message = commit['message']
+        # Skip if message contains WP ID
+        if wp_pattern.search(message):
+            return
+        # Skip merge commits and automated commits
+        if message.startswith('Merge') or '[skip ci]' in message:
+            return
+        commit['stats']['files_changed'] = len(commit['files'])
+        candidates.append(commit)
 
-            parts = line.split('|', 3)
-            if len(parts) < 4:
-                continue
+    log_format = _GIT_RECORD + _GIT_FIELD.join(['%H', '%s', '%cd', '%an'])
+    with git_stream(['log', head_sha, f'-{limit}', '--numstat',
+                     f'--format={log_format}', '--date=iso-strict']) as proc:
+        if proc is None:
+            return None
 
-            sha, message, date, author = parts
+        for line in proc.stdout:
+            line = line.rstrip('\n')
+            if line.startswith(_GIT_RECORD):
+                finish(current)
+                parts = line[1:].split(_GIT_FIELD, 3)
+                if len(parts) < 4:
+                    current = None
+                    continue
+                sha, message, date, author = parts
+                current = {
+                    'sha': sha,
+                    'message': message,
+                    'date': date,
+                    'author': author,
+                    'files': [],
+                    'stats': {
+                        'insertions': 0,
+                        'deletions': 0,
+                        'files_changed': 0
+                    }
+                }
+            elif current is not None and line:
+                # numstat line: "<added>\t<deleted>\t<path>" ("-" for binary)
+                parts = line.split('\t', 2)
+                if len(parts) == 3:
+                    added, deleted, path = parts
+                    current['files'].append(path)
+                    if added.isdigit():
+                        current['stats']['insertions'] += int(added)
+                    if deleted.isdigit():
+                        current['stats']['deletions'] += int(deleted)
+        finish(current)
+
+    if proc.returncode != 0:
+        return None
+    return candidates
 
-            # Skip if message contains WP ID
-            if wp_pattern.search(message):
-                continue
 
-            # Skip merge commits and automated commits
-            if message.startswith('Merge') or '[skip ci]' in message:
-                continue
+def get_untracked_commits(branch: str = 'HEAD', limit: int = 100) -> List[Dict[str, Any]]:
+    """
+    Get commits that don't have Work Package IDs.
 
-            # Skip if commit was already migrated
-            if sha.lower() in migrated_commits or sha.lower()[:7] in migrated_commits:
-                continue
+    Commits and their file stats are read with a single ``git log --numstat``
+    pass and cached by the resolved sha of ``branch``, so repeated calls on an
+    unchanged repository only run ``git rev-parse``.
 
-            # Get commit stats and files
-            stat_result = subprocess.run(
-                ['git', 'show', '--stat', '--format=', sha],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+    Args:
+        branch: Git branch to analyze (default: HEAD)
+        limit: Maximum number of commits to check
 
-            files_changed = []
-            insertions = 0
-            deletions = 0
-
-            if stat_result.returncode == 0:
-                for stat_line in stat_result.stdout.strip().split('\n'):
-                    if '|' in stat_line:
-                        # Parse file changes
-                        file_part = stat_line.split('|')[0].strip()
-                        if file_part:
-                            files_changed.append(file_part)
-                    elif 'file' in stat_line and 'changed' in stat_line:
-                        # Parse summary line: "X files changed, Y insertions(+), Z deletions(-)"
-                        matches = re.findall(r'(\d+)', stat_line)
-                        if len(matches) >= 2:
-                            insertions = int(matches[1]) if len(matches) > 1 else 0
-                            deletions = int(matches[2]) if len(matches) > 2 else 0
-
-            untracked.append({
-                'sha': sha,
-                'message': message,
-                'date': date,
-                'author': author,
-                'files': files_changed,
-                'stats': {
-                    'insertions': insertions,
-                    'deletions': deletions,
-                    'files_changed': len(files_changed)
-                }
-            })
+    Returns:
+        List of commits without WP IDs, including sha, message, date, author, files, stats
+    """
+    try:
+        result = run_git(['rev-parse', '--verify', '--quiet', branch])
+        if result is None or result.returncode != 0:
+            return []
+        head_sha = result.stdout.strip()
 
-        return untracked
+        key = (branch, limit)
+        with _untracked_lock:
+            cached = _untracked_cache.get(key)
+        if cached is not None and cached[0] == head_sha:
+            candidates = cached[1]
+        else:
+            candidates = _scan_untracked_candidates(head_sha, limit)
+            if candidates is None:
+                return []
+            with _untracked_lock:
+                _untracked_cache[key] = (head_sha, candidates)
+
+        # Migration records change independently of HEAD, so filter on every call
+        migrated_commits = load_migrated_commits()
+        return [
+            commit for commit in candidates
+            if commit['sha'].lower() not in migrated_commits
+            and commit['sha'].lower()[:7] not in migrated_commits
+        ]
 
     except Exception as e:
         print(f"Error getting untracked commits: {e}")
@@ -8,7 +8,17 @@ from rich.console import Console
 from pathlib import Path
 from typing import Optional
 
-from .dashboard import start_dashboard, stop_dashboard, DEFAULT_PORT
+from .dashboard import (
+    start_dashboard,
+    stop_dashboard,
+    DEFAULT_PORT,
+    DEFAULT_WORKERS,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_MAX_GIT_PROCESSES,
+    DEFAULT_MAX_EVENT_STREAMS,
+    DEFAULT_DIFF_MAX_BYTES,
+    DEFAULT_SCAN_WORKERS,
+)
 
 console = Console()
 
@@ -22,14 +32,29 @@ dashboard_app = typer.Typer(
 def start(
     port: Optional[int] = typer.Option(None, "--port", "-p", help=f"Port to run dashboard on (default: {DEFAULT_PORT})"),
     open_browser: bool = typer.Option(False, "--open", "-o", help="Open dashboard in browser"),
-    detach: bool = typer.Option(False, "--detach", "-d", help="Run dashboard in background")
+    detach: bool = typer.Option(False, "--detach", "-d", help="Run dashboard in background"),
+    workers: int = typer.Option(DEFAULT_WORKERS, "--workers", "-w", help="Number of requests served concurrently"),
+    request_timeout: float = typer.Option(DEFAULT_REQUEST_TIMEOUT, "--request-timeout", help="Socket idle timeout in seconds"),
+    max_git: int = typer.Option(DEFAULT_MAX_GIT_PROCESSES, "--max-git", help="Maximum git subprocesses running at once"),
+    max_event_streams: int = typer.Option(DEFAULT_MAX_EVENT_STREAMS, "--max-event-streams", help="Maximum live-update (/api/events) streams open at once"),
+    diff_max_bytes: int = typer.Option(DEFAULT_DIFF_MAX_BYTES, "--diff-max-bytes", help="Commit diff bytes sent per page"),
+    scan_workers: int = typer.Option(DEFAULT_SCAN_WORKERS, "--scan-workers", help="Features read in parallel when scanning (1 = serial)")
 ):
     """Start the dashboard server."""
     try:
         if detach:
             console.print("[yellow]Background mode not yet implemented. Running in foreground...[/yellow]")
 
-        server, actual_port, token = start_dashboard(port=port, open_browser=open_browser)
+        server, actual_port, token = start_dashboard(
+            port=port,
+            open_browser=open_browser,
+            workers=workers,
+            request_timeout=request_timeout,
+            max_git_processes=max_git,
+            max_event_streams=max_event_streams,
+            diff_max_bytes=diff_max_bytes,
+            scan_workers=scan_workers
+        )
 
         console.print(f"[green]✓[/green] Dashboard started successfully!")
         console.print(f"\n[cyan]URL:[/cyan] http://localhost:{actual_port}")
@@ -94,7 +119,17 @@ def main(ctx: typer.Context):
     """
     if ctx.invoked_subcommand is None:
         # Default action: start dashboard
-        start(port=None, open_browser=True, detach=False)
+        start(
+            port=None,
+            open_browser=True,
+            detach=False,
+            workers=DEFAULT_WORKERS,
+            request_timeout=DEFAULT_REQUEST_TIMEOUT,
+            max_git=DEFAULT_MAX_GIT_PROCESSES,
+            max_event_streams=DEFAULT_MAX_EVENT_STREAMS,
+            diff_max_bytes=DEFAULT_DIFF_MAX_BYTES,
+            scan_workers=DEFAULT_SCAN_WORKERS
+        )
 
 
 if __name__ == "__main__":
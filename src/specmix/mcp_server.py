@@ -1,7 +1,9 @@
 
 import os
-import json
 import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -11,16 +13,88 @@ from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
 
 from .dashboard import (
-    scan_all_features,
+    ProjectIndex,
     get_feature_info,
     get_artifact_content,
     scan_feature_kanban,
-    get_task_detail
+    get_task_detail,
+    find_feature_path,
+    encode_json,
+    add_tasks_to_file,
+    move_tasks_in_file,
+    parse_tasks_markdown,
+    board_stamp
 )
+from .task_ids import reserve_task_ids, highest_task_number
 
 # Initialize server
 server = Server("spec-mix-mcp")
 
+# Tool bodies do blocking file I/O and git calls, so they run on a thread
+# pool instead of the event loop; concurrent calls overlap up to this limit
+DEFAULT_TOOL_WORKERS = 4
+DEFAULT_TOOL_TIMEOUT = 60.0  # Seconds before a tool call is answered with an error
+
+_tool_pool = ThreadPoolExecutor(max_workers=DEFAULT_TOOL_WORKERS, thread_name_prefix='mcp-tool')
+_tool_timeout = DEFAULT_TOOL_TIMEOUT
+
+# Tools that modify files run one at a time so they never hand out the same
+# task ID or interleave writes to one tasks.md
+WRITE_TOOLS = {"update_plan", "create_task", "create_tasks", "update_task_status", "move_tasks"}
+_write_lock = threading.Lock()
+_write_started_at: Optional[float] = None  # When the running write tool started
+WRITE_LOCK_POLL = 0.1  # Seconds between checks on a write that holds the lock
+
+
+def set_tool_limits(workers: int = DEFAULT_TOOL_WORKERS, timeout: float = DEFAULT_TOOL_TIMEOUT):
+    """Set how many tool calls run at once and how long each may take."""
+    global _tool_pool, _tool_timeout
+    old_pool = _tool_pool
+    _tool_pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='mcp-tool')
+    _tool_timeout = timeout
+    old_pool.shutdown(wait=False)
+
+# Warm project model shared by every tool call. There is no watcher thread:
+# a tool call checks for outside changes when the last check is older than
+# INDEX_MAX_AGE, and tools that write refresh it so the next call sees them.
+INDEX_MAX_AGE = 1.0  # Seconds a tool call may use the index without re-checking
+
+_project_index: Optional[ProjectIndex] = None
+_index_checked_at: Optional[float] = None
+_project_index_lock = threading.Lock()
+
+
+def get_project_index() -> ProjectIndex:
+    """Return the project index, building it on first use and refreshing it when stale."""
+    global _project_index, _index_checked_at
+    with _project_index_lock:
+        if _project_index is None:
+            _project_index = ProjectIndex()
+            _index_checked_at = None
+        index = _project_index
+        checked_at = _index_checked_at
+
+    if checked_at is None or time.monotonic() - checked_at >= INDEX_MAX_AGE:
+        # Only stats unchanged features; concurrent refreshes are serialized
+        index.refresh()
+        with _project_index_lock:
+            _index_checked_at = time.monotonic()
+    return index
+
+
+def _project_changed():
+    """Bring the project index up to date after a tool wrote to disk."""
+    if _project_index is not None:
+        _project_index.refresh()
+
+
+def _get_kanban(feature_id: str) -> Dict[str, Any]:
+    """Return a feature's board from the index, scanning only if it is not indexed."""
+    kanban = get_project_index().kanban(feature_id)
+    if kanban is None:
+        kanban = scan_feature_kanban(feature_id)
+    return kanban
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available tools."""
@@ -99,6 +173,32 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["title", "description"],
             },
         ),
+        types.Tool(
+            name="create_tasks",
+            description="Create several tasks in the 'Planned' lane in one call. Returns the assigned IDs.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tasks": {
+                        "type": "array",
+                        "description": "Tasks to create, in order.",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string", "description": "Title of the task."},
+                                "description": {"type": "string", "description": "Detailed description of the task."},
+                            },
+                            "required": ["title"],
+                        },
+                    },
+                    "feature_id": {
+                        "type": "string",
+                        "description": "ID of the feature. If omitted, tries to find the active feature.",
+                    },
+                },
+                "required": ["tasks"],
+            },
+        ),
         types.Tool(
             name="update_task_status",
             description="Move a task to a different lane (planned, doing, for_review, done).",
@@ -122,6 +222,36 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["task_id", "lane"],
             },
         ),
+        types.Tool(
+            name="move_tasks",
+            description="Move several tasks to other lanes in one call.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "moves": {
+                        "type": "array",
+                        "description": "Task moves to apply, in order.",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "task_id": {"type": "string", "description": "ID of the task to move."},
+                                "lane": {
+                                    "type": "string",
+                                    "enum": ["planned", "doing", "for_review", "done"],
+                                    "description": "Target lane.",
+                                },
+                            },
+                            "required": ["task_id", "lane"],
+                        },
+                    },
+                    "feature_id": {
+                        "type": "string",
+                        "description": "ID of the feature. If omitted, tries to find the active feature.",
+                    },
+                },
+                "required": ["moves"],
+            },
+        ),
     ]
 
 def _get_active_feature_id() -> Optional[str]:
@@ -135,7 +265,7 @@ def _get_active_feature_id() -> Optional[str]:
     if (cwd / "specs").exists():
         # We are at root, maybe check .spec-mix/active-mission/context.json if it exists?
         # For now, return the first feature found if any
-        features = scan_all_features()
+        features = get_project_index().features()
         if features:
             return features[0]['id']
             
@@ -148,33 +278,216 @@ def _resolve_feature_path(feature_id: Optional[str]) -> Optional[Path]:
     
     if not feature_id:
         return None
-        
-    # Check specs/
-    specs_path = Path('specs') / feature_id
-    if specs_path.exists():
-        return specs_path
-        
-    # Check worktrees
-    worktrees_dir = Path('.worktrees')
-    if worktrees_dir.exists():
-        for worktree_dir in worktrees_dir.iterdir():
-            worktree_specs = worktree_dir / 'specs' / feature_id
-            if worktree_specs.exists():
-                return worktree_specs
-                
-    return None
+
+    return find_feature_path(feature_id)
+
+
+LANES = ["planned", "doing", "for_review", "done"]
+
+
+def _is_directory_kanban(path: Path) -> bool:
+    """Check whether a feature keeps tasks as files under tasks/<lane>/."""
+    tasks_dir = path / "tasks"
+    return tasks_dir.exists() and tasks_dir.is_dir()
+
+
+def _reserve_task_ids(path: Path, count: int):
+    """
+    Reserve the next `count` task IDs from the feature's ID sequence.
+
+    Used as a context manager around writing the tasks; the board is only
+    scanned when it changed outside the sequence since its last use.
+    """
+    return reserve_task_ids(path, count,
+                            board_stamp=lambda: repr(board_stamp(path)),
+                            floor=lambda: _highest_board_task(path))
+
+
+def _highest_board_task(path: Path) -> int:
+    """
+    Return the highest task number currently on a feature's board.
+
+    Read from disk rather than the project index, which may not have seen a
+    tasks.md written moments ago. Task files are only listed, not opened;
+    tasks.md goes through the parse cache.
+    """
+    if _is_directory_kanban(path):
+        ids = []
+        for lane in ['planned', 'doing', 'for_review', 'done']:
+            try:
+                ids.extend(os.path.splitext(name)[0] for name in os.listdir(path / "tasks" / lane))
+            except OSError:
+                continue
+        return highest_task_number(ids)
+
+    tasks_file = path / "tasks.md"
+    if not tasks_file.exists():
+        return 0
+    lanes = parse_tasks_markdown(tasks_file)['lanes'].values()
+    return highest_task_number(task['id'] for tasks in lanes for task in tasks)
+
+
+def _create_tasks(path: Path, tasks: List[Dict[str, Any]]) -> List[tuple]:
+    """
+    Add tasks to a feature's 'Planned' lane in one pass.
+
+    IDs are allocated once for the whole batch; tasks.md gets all of them
+    in a single rewrite.
+
+    Returns:
+        (task_id, title) for each created task
+    """
+    with _reserve_task_ids(path, len(tasks)) as task_ids:
+        if _is_directory_kanban(path):
+            # Directory based
+            planned_dir = path / "tasks" / "planned"
+            planned_dir.mkdir(exist_ok=True)
+
+            for task_id, task in zip(task_ids, tasks):
+                title = task.get("title")
+                content = f"---\ntitle: {title}\nstatus: planned\n---\n\n# {task_id}: {title}\n\n{task.get('description', '')}"
+                with open(planned_dir / f"{task_id}.md", "w", encoding="utf-8") as f:
+                    f.write(content)
+        else:
+            # File based (tasks.md): insert into the Planned section, or create it if missing
+            add_tasks_to_file(path / "tasks.md", [
+                f"### {task_id}: {task.get('title')}\n{task.get('description', '')}"
+                for task_id, task in zip(task_ids, tasks)
+            ])
+
+    created = [(task_id, task.get("title")) for task_id, task in zip(task_ids, tasks)]
+
+    _project_changed()
+    return created
+
+
+def _move_tasks(path: Path, moves: List[Dict[str, Any]]) -> tuple:
+    """
+    Move tasks between lanes.
+
+    Task files are located with one listing of the lane directories for the
+    whole batch; tasks.md is edited in place (see move_tasks_in_file).
+
+    Returns:
+        ([(task_id, lane), ...] moved, [error message, ...])
+    """
+    if not _is_directory_kanban(path):
+        tasks_file = path / "tasks.md"
+        if not tasks_file.exists():
+            return [], ["Feature has no tasks."]
+        moved, errors = move_tasks_in_file(tasks_file, moves)
+        if moved:
+            _project_changed()
+        return moved, errors
+
+    tasks_dir = path / "tasks"
+    locations = {}
+    for lane in LANES:
+        lane_dir = tasks_dir / lane
+        if lane_dir.is_dir():
+            for task_file in lane_dir.glob("*.md"):
+                locations.setdefault(task_file.stem, task_file)
+
+    moved = []
+    errors = []
+    for move in moves:
+        task_id = move.get("task_id") if isinstance(move, dict) else None
+        lane = move.get("lane") if isinstance(move, dict) else None
+        if lane not in LANES:
+            errors.append(f"Invalid lane '{lane}' for task {task_id}.")
+            continue
+        found_file = locations.get(task_id)
+        if found_file is None:
+            errors.append(f"Task {task_id} not found.")
+            continue
+
+        target_dir = tasks_dir / lane
+        target_dir.mkdir(exist_ok=True)
+        target_file = target_dir / f"{task_id}.md"
+        found_file.rename(target_file)
+        locations[task_id] = target_file
+        moved.append((task_id, lane))
+
+    if moved:
+        _project_changed()
+    return moved, errors
 
 @server.call_tool()
 async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """Handle tool execution."""
-    if not arguments:
-        arguments = {}
+    """
+    Handle tool execution.
+
+    The tool runs on the tool thread pool so the event loop keeps serving
+    other requests. The timeout counts from the moment the tool starts
+    running: time a write tool spends waiting for an earlier write is not
+    included (that wait has its own bound, see _run_tool). A call that
+    exceeds the timeout, or is cancelled by the client, is answered (or
+    dropped) right away; a tool that already started finishes in the
+    background, since threads cannot be interrupted, while one still queued
+    never runs.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.create_future()
 
+    def mark_started():
+        loop.call_soon_threadsafe(lambda: started.done() or started.set_result(None))
+
+    future = loop.run_in_executor(_tool_pool, _run_tool, name, arguments or {}, mark_started)
+    await asyncio.wait({started, future}, return_when=asyncio.FIRST_COMPLETED)
+    try:
+        return await asyncio.wait_for(future, timeout=_tool_timeout)
+    except asyncio.TimeoutError:
+        if name in WRITE_TOOLS:
+            text = (f"Error: {name} did not finish within {_tool_timeout:g} seconds. "
+                    "It is still running, so its changes may still be applied; "
+                    "check the current state before retrying.")
+        else:
+            text = f"Error: {name} did not finish within {_tool_timeout:g} seconds."
+        return [types.TextContent(type="text", text=text)]
+
+
+def _run_tool(
+    name: str, arguments: dict, mark_started=None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Run a tool on a worker thread, serializing tools that write.
+
+    A write tool queues behind earlier writes for as long as they keep
+    within the tool timeout; if the write holding the lock has overrun it
+    (it timed out and is stuck), the call fails without touching anything.
+    mark_started is called once the tool actually begins.
+    """
+    global _write_started_at
+    if name in WRITE_TOOLS:
+        while not _write_lock.acquire(timeout=WRITE_LOCK_POLL):
+            started_at = _write_started_at
+            if started_at is not None and time.monotonic() - started_at > _tool_timeout:
+                return [types.TextContent(type="text", text=(
+                    f"Error: {name} was not run: an earlier write tool has been running for over "
+                    f"{_tool_timeout:g} seconds. Nothing was changed."))]
+        _write_started_at = time.monotonic()
+        try:
+            if mark_started is not None:
+                mark_started()
+            return _call_tool(name, arguments)
+        finally:
+            _write_started_at = None
+            _write_lock.release()
+
+    if mark_started is not None:
+        mark_started()
+    return _call_tool(name, arguments)
+
+
+def _call_tool(
+    name: str, arguments: dict
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """Execute a tool synchronously."""
     if name == "get_project_context":
-        features = scan_all_features()
-        return [types.TextContent(type="text", text=json.dumps(features, indent=2))]
+        features = get_project_index().features()
+        return [types.TextContent(type="text", text=encode_json(features))]
 
     elif name == "read_plan":
         feature_id = arguments.get("feature_id")
@@ -202,6 +515,7 @@ async def handle_call_tool(
         try:
             with open(plan_path, "w", encoding="utf-8") as f:
                 f.write(content)
+            _project_changed()
             return [types.TextContent(type="text", text=f"Successfully updated plan.md for {path.name}")]
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error updating plan: {str(e)}")]
@@ -214,8 +528,8 @@ async def handle_call_tool(
         if not feature_id:
             return [types.TextContent(type="text", text="Error: No active feature found and no feature_id provided.")]
             
-        kanban = scan_feature_kanban(feature_id)
-        return [types.TextContent(type="text", text=json.dumps(kanban, indent=2))]
+        kanban = _get_kanban(feature_id)
+        return [types.TextContent(type="text", text=encode_json(kanban))]
 
     elif name == "create_task":
         feature_id = arguments.get("feature_id")
@@ -225,51 +539,27 @@ async def handle_call_tool(
         path = _resolve_feature_path(feature_id)
         if not path:
              return [types.TextContent(type="text", text=f"Error: Feature {feature_id} not found.")]
-             
-        # Determine task ID (simple auto-increment for now, or random)
-        # Ideally we should scan existing tasks to find max ID
-        # For simplicity, let's use a timestamp or random ID if we can't easily determine next ID
-        # Or better, check existing tasks count
-        kanban = scan_feature_kanban(path.name)
-        total_tasks = 0
-        for lane in kanban.get('lanes', {}).values():
-            total_tasks += len(lane)
-        
-        # Simple ID generation: T{total_tasks + 1}
-        task_id = f"T{total_tasks + 1:03d}"
-        
-        # Check if directory based or file based
-        tasks_dir = path / "tasks"
-        if tasks_dir.exists() and tasks_dir.is_dir():
-            # Directory based
-            planned_dir = tasks_dir / "planned"
-            planned_dir.mkdir(exist_ok=True)
-            
-            task_file = planned_dir / f"{task_id}.md"
-            content = f"---\ntitle: {title}\nstatus: planned\n---\n\n# {task_id}: {title}\n\n{description}"
-            
-            with open(task_file, "w", encoding="utf-8") as f:
-                f.write(content)
-                
-        else:
-            # File based (tasks.md)
-            tasks_file = path / "tasks.md"
-            # Append to tasks.md
-            # We need to read it, find "## Planned" section and insert
-            # Or just append if simple format
-            # For safety, let's just append to the end or create if not exists
-            
-            task_entry = f"\n\n### {task_id}: {title}\n{description}\n"
-            
-            if tasks_file.exists():
-                with open(tasks_file, "a", encoding="utf-8") as f:
-                    f.write(task_entry)
-            else:
-                with open(tasks_file, "w", encoding="utf-8") as f:
-                    f.write(f"# Tasks\n\n## Planned{task_entry}\n\n## Doing\n\n## For Review\n\n## Done\n")
-                    
+
+        task_id, _ = _create_tasks(path, [{"title": title, "description": description}])[0]
         return [types.TextContent(type="text", text=f"Created task {task_id}: {title}")]
 
+    elif name == "create_tasks":
+        feature_id = arguments.get("feature_id")
+        tasks = arguments.get("tasks") or []
+
+        path = _resolve_feature_path(feature_id)
+        if not path:
+             return [types.TextContent(type="text", text=f"Error: Feature {feature_id} not found.")]
+
+        invalid = [i for i, task in enumerate(tasks) if not isinstance(task, dict) or not task.get("title")]
+        if not tasks or invalid:
+            return [types.TextContent(type="text", text=f"Error: Every task needs a title (invalid entries: {invalid}).")]
+
+        created = _create_tasks(path, tasks)
+        lines = [f"Created {len(created)} tasks in {path.name}:"]
+        lines.extend(f"- {task_id}: {title}" for task_id, title in created)
+        return [types.TextContent(type="text", text="\n".join(lines))]
+
     elif name == "update_task_status":
         task_id = arguments.get("task_id")
         lane = arguments.get("lane")
@@ -278,30 +568,25 @@ async def handle_call_tool(
         path = _resolve_feature_path(feature_id)
         if not path:
              return [types.TextContent(type="text", text=f"Error: Feature {feature_id} not found.")]
-             
-        # Check if directory based
-        tasks_dir = path / "tasks"
-        if tasks_dir.exists() and tasks_dir.is_dir():
-            # Move file
-            found_file = None
-            for l in ["planned", "doing", "for_review", "done"]:
-                l_dir = tasks_dir / l
-                if (l_dir / f"{task_id}.md").exists():
-                    found_file = l_dir / f"{task_id}.md"
-                    break
-            
-            if found_file:
-                target_dir = tasks_dir / lane
-                target_dir.mkdir(exist_ok=True)
-                target_file = target_dir / f"{task_id}.md"
-                found_file.rename(target_file)
-                return [types.TextContent(type="text", text=f"Moved task {task_id} to {lane}")]
-            else:
-                 return [types.TextContent(type="text", text=f"Error: Task {task_id} not found.")]
-        else:
-            # File based - complex to update safely without parsing
-            # For now, return error for file-based update as it requires robust parsing/rewriting
-            return [types.TextContent(type="text", text="Error: Updating task status in tasks.md file is not yet supported via MCP. Please use directory-based tasks.")]
+
+        moved, errors = _move_tasks(path, [{"task_id": task_id, "lane": lane}])
+        if moved:
+            return [types.TextContent(type="text", text=f"Moved task {task_id} to {lane}")]
+        return [types.TextContent(type="text", text=f"Error: {errors[0]}")]
+
+    elif name == "move_tasks":
+        feature_id = arguments.get("feature_id")
+        moves = arguments.get("moves") or []
+
+        path = _resolve_feature_path(feature_id)
+        if not path:
+             return [types.TextContent(type="text", text=f"Error: Feature {feature_id} not found.")]
+
+        moved, errors = _move_tasks(path, moves)
+        lines = [f"Moved {len(moved)} of {len(moves)} tasks in {path.name}:"]
+        lines.extend(f"- {task_id} -> {lane}" for task_id, lane in moved)
+        lines.extend(f"- Error: {error}" for error in errors)
+        return [types.TextContent(type="text", text="\n".join(lines))]
 
     raise ValueError(f"Unknown tool: {name}")
 
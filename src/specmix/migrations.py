@@ -232,17 +232,10 @@ def get_project_version(project_path: Path) -> str:
             pass
 
     # Fallback: check config.json
-    config_file = project_path / ".spec-mix" / "config.json"
-    if config_file.exists():
-        try:
-            import json
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                ver = config.get('spec_mix_version')
-                if ver:  # Only return if not None or empty
-                    return ver
-        except Exception:
-            pass
+    from .project_config import load_project_settings
+    ver = load_project_settings(project_path).get('spec_mix_version')
+    if ver:  # Only return if not None or empty
+        return ver
 
     # Default to oldest version if not found
     return "0.0.1-alpha.1"
@@ -264,19 +257,15 @@ def set_project_version(project_path: Path, new_version: str):
         f.write(new_version)
 
     # Also update config.json if it exists
-    config_file = spec_mix_dir / "config.json"
-    if config_file.exists():
-        try:
-            import json
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-
+    from .project_config import ProjectConfigError, load_project_settings, save_project_config
+    try:
+        settings = load_project_settings(project_path, strict=True)
+        if settings.exists:
+            config = settings.to_dict()
             config['spec_mix_version'] = new_version
-
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Warning: Could not update config.json: {e}")
+            save_project_config(config, project_path)
+    except (ProjectConfigError, OSError) as e:
+        print(f"Warning: Could not update config.json: {e}")
 
 
 def run_migrations(
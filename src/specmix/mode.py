@@ -6,11 +6,17 @@ Modes determine the interface complexity and available commands:
 - pro: Full-featured interface with all advanced commands
 """
 
-import json
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
+from .project_config import (
+    ProjectConfigError,
+    config_path,
+    load_project_settings,
+    save_project_config,
+)
+
 
 class ModeError(Exception):
     """Base exception for mode-related errors."""
@@ -65,27 +71,20 @@ class ModeManager:
             project_dir: Path to project directory (default: current directory)
         """
         self.project_dir = project_dir or Path.cwd()
-        self.config_dir = self.project_dir / '.spec-mix'
-        self.config_file = self.config_dir / 'config.json'
+        self.config_file = config_path(self.project_dir)
+        self.config_dir = self.config_file.parent
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from config.json."""
-        if not self.config_file.exists():
-            return {}
-
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            return load_project_settings(self.project_dir, strict=True).to_dict()
+        except ProjectConfigError as e:
             raise ModeConfigError(f"Failed to load config: {e}")
 
     def _save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to config.json."""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            save_project_config(config, self.project_dir)
         except IOError as e:
             raise ModeConfigError(f"Failed to save config: {e}")
 
@@ -96,8 +95,11 @@ class ModeManager:
         Returns:
             Current mode key (defaults to 'pro')
         """
-        config = self._load_config()
-        return config.get('mode', DEFAULT_MODE)
+        try:
+            settings = load_project_settings(self.project_dir, strict=True)
+        except ProjectConfigError as e:
+            raise ModeConfigError(f"Failed to load config: {e}")
+        return settings.get('mode', DEFAULT_MODE)
 
     def set_mode(self, mode_key: str) -> None:
         """
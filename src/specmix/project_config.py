@@ -0,0 +1,146 @@
+"""
+Project settings stored in .spec-mix/config.json.
+
+The file is small but read from many places (every feature in a dashboard
+scan, notes, agent installation, mode and version lookups). Parsed settings
+are cached per file and reused until the file's modification time or size
+changes, so repeated lookups cost one stat call.
+"""
+
+import copy
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+CONFIG_DIR = ".spec-mix"
+CONFIG_FILE = "config.json"
+
+
+class ProjectConfigError(Exception):
+    """Raised when config.json exists but cannot be read or parsed."""
+    pass
+
+
+class ProjectSettings:
+    """
+    Read-only view of a project's config.json.
+
+    Use get() for keys without a dedicated property, and to_dict() for a
+    copy that can be modified and passed to save_project_config().
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, exists: bool = False):
+        self._data = data or {}
+        self.exists = exists
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return copy.deepcopy(self._data)
+
+    @property
+    def mode(self) -> Optional[str]:
+        return self._data.get('mode')
+
+    @property
+    def language(self) -> str:
+        return self._data.get('language', 'en')
+
+    @property
+    def mission(self) -> str:
+        return self._data.get('mission', 'software-dev')
+
+    @property
+    def ai_assistant(self) -> Optional[str]:
+        return self._data.get('ai_assistant')
+
+
+# Parsed config files: absolute path -> (stat key, settings, error)
+_settings_cache: Dict[str, tuple] = {}
+_settings_lock = threading.Lock()
+
+
+def config_path(project_dir: Optional[Path] = None) -> Path:
+    """Return the config.json path for a project (default: current directory)"""
+    return (Path(project_dir) if project_dir is not None else Path('.')) / CONFIG_DIR / CONFIG_FILE
+
+
+def load_project_settings(project_dir: Optional[Path] = None, strict: bool = False) -> ProjectSettings:
+    """
+    Return the settings of a project, parsing config.json only when it changed.
+
+    Args:
+        project_dir: Project directory (default: current directory)
+        strict: Raise ProjectConfigError for an unreadable file instead of
+            returning empty settings
+
+    Returns:
+        ProjectSettings (empty if config.json does not exist)
+    """
+    path = os.path.abspath(config_path(project_dir))
+    try:
+        st = os.stat(path)
+    except OSError:
+        with _settings_lock:
+            _settings_cache.pop(path, None)
+        return ProjectSettings()
+
+    key = (st.st_mtime_ns, st.st_size)
+    with _settings_lock:
+        cached = _settings_cache.get(path)
+    if cached is None or cached[0] != key:
+        error = None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            settings = ProjectSettings(data, exists=True)
+        except (OSError, ValueError) as e:
+            settings = ProjectSettings(exists=True)
+            error = ProjectConfigError(f"Failed to load {path}: {e}")
+        cached = (key, settings, error)
+        with _settings_lock:
+            _settings_cache[path] = cached
+
+    _, settings, error = cached
+    if error is not None and strict:
+        raise error
+    return settings
+
+
+def save_project_config(data: Dict[str, Any], project_dir: Optional[Path] = None):
+    """
+    Write config.json atomically and drop its cached settings.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path = config_path(project_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        # mkstemp creates the file private; keep the permissions a plain write would have
+        try:
+            mode = path.stat().st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    finally:
+        with _settings_lock:
+            _settings_cache.pop(os.path.abspath(path), None)
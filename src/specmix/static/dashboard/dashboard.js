@@ -5,6 +5,39 @@ let currentFeature = null;
 let currentArtifact = null;
 let currentWalkthroughFiles = [];
 let refreshInterval = null;
+let eventSource = null;
+let featureList = [];
+
+// ETag-aware JSON cache: url -> { etag, data }
+const jsonCache = new Map();
+
+// Tasks loaded per lane before a "Load more" button is shown
+const KANBAN_PAGE_SIZE = 200;
+
+// URL of the first page of a feature's board
+function kanbanUrl(featureId) {
+    return `/api/kanban/${featureId}?limit=${KANBAN_PAGE_SIZE}`;
+}
+
+// Fetch JSON, revalidating cached responses with If-None-Match.
+// Returns { data, etag }; on 304 Not Modified the cached data is returned.
+// Callers compare etag with the one they last rendered to skip re-rendering.
+async function fetchJSON(url) {
+    const cached = jsonCache.get(url);
+    const headers = cached ? { 'If-None-Match': cached.etag } : {};
+    const response = await fetch(url, { headers });
+
+    if (response.status === 304 && cached) {
+        return cached;
+    }
+
+    const data = await response.json();
+    const etag = response.headers.get('ETag');
+    if (response.ok && etag) {
+        jsonCache.set(url, { etag, data });
+    }
+    return { data, etag };
+}
 
 // Get history state from URL hash
 function getCurrentStateFromHash() {
@@ -114,10 +147,10 @@ function setupEventListeners() {
     // Refresh button
     document.getElementById('refresh-btn').addEventListener('click', async () => {
         await loadFeatures();
-        if (document.getElementById('constitution-view').classList.contains('active')) {
+        if (isViewVisible('constitution-view')) {
             await loadConstitution();
         }
-        if (document.getElementById('untracked-view').classList.contains('active')) {
+        if (isViewVisible('untracked-view')) {
             await loadUntrackedCommits();
         }
     });
@@ -217,65 +250,86 @@ function showView(viewId) {
     document.getElementById(viewId).style.display = 'block';
 }
 
+// Check whether a tab view is currently shown
+function isViewVisible(viewId) {
+    return window.getComputedStyle(document.getElementById(viewId)).display !== 'none';
+}
+
 // Load features
 async function loadFeatures() {
     const container = document.getElementById('features-list');
-    container.innerHTML = '<p class="loading">Loading features...</p>';
+    if (!container.dataset.etag) {
+        container.innerHTML = '<p class="loading">Loading features...</p>';
+    }
 
     try {
-        const response = await fetch('/api/features');
-        const features = await response.json();
+        const { data: features, etag } = await fetchJSON('/api/features');
 
         updateLastUpdate();
 
-        if (features.length === 0) {
-            container.innerHTML = `
-                <div class="empty-state">
-                    <h3>${i18n.no_features || 'No features found'}</h3>
-                    <p>Create a feature using <code>/speckit.specify</code></p>
-                </div>
-            `;
-            document.getElementById('features-stats').textContent = '';
+        // Nothing changed since the last render
+        if (etag && container.dataset.etag === etag) {
             return;
         }
+        container.dataset.etag = etag || '';
 
-        // Update stats
-        const totalTasks = features.reduce((sum, f) => sum + (f.total_tasks || 0), 0);
-        document.getElementById('features-stats').textContent =
-            `${features.length} feature${features.length !== 1 ? 's' : ''} • ${totalTasks} task${totalTasks !== 1 ? 's' : ''}`;
+        featureList = features;
+        renderFeatures(features);
 
-        // Sort features by number descending (e.g., 003 > 002 > 001)
-        const sortedFeatures = [...features].sort((a, b) => {
-            const numA = parseInt((a.id || '').match(/^(\d+)/)?.[1] || '0', 10);
-            const numB = parseInt((b.id || '').match(/^(\d+)/)?.[1] || '0', 10);
-            return numB - numA;
-        });
+    } catch (error) {
+        console.error('Failed to load features:', error);
+        container.dataset.etag = '';
+        container.innerHTML = '<p class="error">Failed to load features</p>';
+    }
+}
 
-        // Render features
-        container.innerHTML = sortedFeatures.map(feature => renderFeatureCard(feature)).join('');
+// Render features list
+function renderFeatures(features) {
+    const container = document.getElementById('features-list');
 
-        // Add click handlers
-        document.querySelectorAll('.feature-card').forEach(card => {
-            card.addEventListener('click', () => {
-                const featureId = card.dataset.featureId;
-                showKanban(featureId);
-            });
-        });
+    if (features.length === 0) {
+        container.innerHTML = `
+            <div class="empty-state">
+                <h3>${i18n.no_features || 'No features found'}</h3>
+                <p>Create a feature using <code>/speckit.specify</code></p>
+            </div>
+        `;
+        document.getElementById('features-stats').textContent = '';
+        return;
+    }
 
-        // Add artifact click handlers
-        document.querySelectorAll('.artifact-badge.available').forEach(badge => {
-            badge.addEventListener('click', (e) => {
-                e.stopPropagation();
-                const featureId = badge.dataset.featureId;
-                const artifactName = badge.dataset.artifact;
-                showArtifact(featureId, artifactName);
-            });
+    // Update stats
+    const totalTasks = features.reduce((sum, f) => sum + (f.total_tasks || 0), 0);
+    document.getElementById('features-stats').textContent =
+        `${features.length} feature${features.length !== 1 ? 's' : ''} • ${totalTasks} task${totalTasks !== 1 ? 's' : ''}`;
+
+    // Sort features by number descending (e.g., 003 > 002 > 001)
+    const sortedFeatures = [...features].sort((a, b) => {
+        const numA = parseInt((a.id || '').match(/^(\d+)/)?.[1] || '0', 10);
+        const numB = parseInt((b.id || '').match(/^(\d+)/)?.[1] || '0', 10);
+        return numB - numA;
+    });
+
+    // Render features
+    container.innerHTML = sortedFeatures.map(feature => renderFeatureCard(feature)).join('');
+
+    // Add click handlers
+    document.querySelectorAll('.feature-card').forEach(card => {
+        card.addEventListener('click', () => {
+            const featureId = card.dataset.featureId;
+            showKanban(featureId);
         });
+    });
 
-    } catch (error) {
-        console.error('Failed to load features:', error);
-        container.innerHTML = '<p class="error">Failed to load features</p>';
-    }
+    // Add artifact click handlers
+    document.querySelectorAll('.artifact-badge.available').forEach(badge => {
+        badge.addEventListener('click', (e) => {
+            e.stopPropagation();
+            const featureId = badge.dataset.featureId;
+            const artifactName = badge.dataset.artifact;
+            showArtifact(featureId, artifactName);
+        });
+    });
 }
 
 // Render feature card
@@ -384,14 +438,11 @@ async function showKanban(featureId, pushState = true) {
 
     try {
         // Fetch both kanban data and feature info for walkthrough files
-        const [kanbanResponse, featuresResponse] = await Promise.all([
-            fetch(`/api/kanban/${featureId}`),
-            fetch('/api/features')
+        const [{ data }, { data: features }] = await Promise.all([
+            fetchJSON(kanbanUrl(featureId)),
+            fetchJSON('/api/features')
         ]);
 
-        const data = await kanbanResponse.json();
-        const features = await featuresResponse.json();
-
         // Find current feature to get walkthrough files
         const feature = features.find(f => f.id === featureId);
         if (feature) {
@@ -434,29 +485,57 @@ function renderKanbanBoard(featureId, data) {
 
     // Render lanes
     Object.entries(data.lanes).forEach(([lane, tasks]) => {
-        const containerId = `lane-${lane === 'for_review' ? 'for-review' : lane}-content`;
-        const container = document.getElementById(containerId);
-
-        if (tasks.length === 0) {
-            container.innerHTML = '<p class="empty-state">No tasks</p>';
-        } else {
-            container.innerHTML = tasks.map(task => `
-                <div class="task-card" data-task-id="${task.id}" data-lane="${lane}">
-                    <strong>${task.id}</strong>
-                    <div>${task.title}</div>
-                </div>
-            `).join('');
-        }
+        const total = data.page?.totals?.[lane] ?? tasks.length;
+        renderKanbanLane(featureId, lane, tasks, total);
     });
+}
+
+// Render one lane, with a "Load more" button while the server has more tasks
+function renderKanbanLane(featureId, lane, tasks, total) {
+    const containerId = `lane-${lane === 'for_review' ? 'for-review' : lane}-content`;
+    const container = document.getElementById(containerId);
+
+    if (tasks.length === 0) {
+        container.innerHTML = '<p class="empty-state">No tasks</p>';
+        return;
+    }
+
+    const more = total > tasks.length
+        ? `<button class="btn btn-secondary lane-load-more">Load more (${total - tasks.length})</button>`
+        : '';
+    container.innerHTML = tasks.map(task => `
+        <div class="task-card" data-task-id="${task.id}" data-lane="${lane}">
+            <strong>${task.id}</strong>
+            <div>${task.title}</div>
+        </div>
+    `).join('') + more;
 
     // Add click handlers to task cards
-    document.querySelectorAll('.task-card').forEach(card => {
+    container.querySelectorAll('.task-card').forEach(card => {
         card.addEventListener('click', () => {
             const taskId = card.dataset.taskId;
             const lane = card.dataset.lane;
             openTaskModal(featureId, lane, taskId);
         });
     });
+
+    const button = container.querySelector('.lane-load-more');
+    if (button) {
+        button.addEventListener('click', async () => {
+            button.disabled = true;
+            try {
+                const response = await fetch(
+                    `/api/kanban/${featureId}?lane=${lane}&cursor=${tasks.length}&limit=${KANBAN_PAGE_SIZE}`
+                );
+                const page = await response.json();
+                const loaded = tasks.concat(page.lanes[lane] || []);
+                renderKanbanLane(featureId, lane, loaded, page.page.totals[lane] ?? loaded.length);
+            } catch (error) {
+                console.error('Failed to load tasks:', error);
+                button.disabled = false;
+            }
+        });
+    }
 }
 
 // Render phase-based board (Normal mode)
@@ -707,22 +786,134 @@ async function loadConstitution() {
     }
 }
 
-// Auto-refresh
+// Live updates: prefer the server's event stream, fall back to polling
 function startAutoRefresh() {
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+
+    eventSource = new EventSource('/api/events');
+
+    // Sent on (re)connect: resync anything missed while disconnected
+    eventSource.addEventListener('ready', async () => {
+        stopPolling();
+        if (isViewVisible('features-view')) {
+            await loadFeatures();
+        }
+        await updateUntrackedBadge();
+    });
+
+    eventSource.addEventListener('features', (event) => {
+        applyFeatureChanges(JSON.parse(event.data));
+    });
+
+    eventSource.addEventListener('kanban', (event) => {
+        applyKanbanChanges(JSON.parse(event.data));
+    });
+
+    eventSource.addEventListener('head', async () => {
+        if (isViewVisible('untracked-view')) {
+            await loadUntrackedCommits();
+        }
+        await updateUntrackedBadge();
+    });
+
+    eventSource.onerror = () => {
+        // The browser reconnects on its own unless the server refused the stream
+        if (eventSource.readyState === EventSource.CLOSED) {
+            eventSource = null;
+            startPolling();
+        }
+    };
+}
+
+// Poll for changes while the page is visible
+function startPolling() {
+    if (refreshInterval) return;
     refreshInterval = setInterval(async () => {
+        if (document.hidden) return;
+
         // Auto-refresh features view
-        if (document.getElementById('features-view').classList.contains('active')) {
+        if (isViewVisible('features-view')) {
             await loadFeatures();
         }
         // Auto-refresh untracked commits view
-        if (document.getElementById('untracked-view').classList.contains('active')) {
+        if (isViewVisible('untracked-view')) {
             await loadUntrackedCommits();
         }
-        // Always refresh badge count even if not on the tab
         await updateUntrackedBadge();
     }, 2000); // 2 seconds
 }
 
+function stopPolling() {
+    if (refreshInterval) {
+        clearInterval(refreshInterval);
+        refreshInterval = null;
+    }
+}
+
+// Apply a features delta pushed by the server
+function applyFeatureChanges(delta) {
+    const removed = new Set(delta.removed || []);
+    const updated = new Map((delta.updated || []).map(f => [f.path, f]));
+
+    featureList = featureList
+        .filter(f => !removed.has(f.path))
+        .map(f => {
+            const next = updated.get(f.path);
+            updated.delete(f.path);
+            return next || f;
+        })
+        .concat([...updated.values()]);
+
+    updateLastUpdate();
+
+    // The rendered list no longer matches any server ETag
+    const container = document.getElementById('features-list');
+    container.dataset.etag = '';
+    if (isViewVisible('features-view')) {
+        renderFeatures(featureList);
+    }
+}
+
+// Apply lane changes for the board currently on screen
+function applyKanbanChanges(delta) {
+    if (delta.feature_id !== currentFeature || !isViewVisible('kanban-view')) {
+        return;
+    }
+
+    const url = kanbanUrl(delta.feature_id);
+    const cached = jsonCache.get(url);
+    if (!cached) return;
+
+    // Changed lanes arrive in full; keep the first page of each
+    const lanes = { ...cached.data.lanes };
+    const totals = { ...(cached.data.page?.totals || {}) };
+    Object.entries(delta.lanes).forEach(([lane, tasks]) => {
+        lanes[lane] = tasks.slice(0, KANBAN_PAGE_SIZE);
+        totals[lane] = tasks.length;
+    });
+    const data = {
+        ...cached.data,
+        lanes,
+        page: { ...cached.data.page, totals }
+    };
+    if (delta.is_phase_mode) {
+        data.is_phase_mode = true;
+        data.phases = delta.phases;
+    }
+    // Keep the patched board, but force revalidation on the next fetch
+    jsonCache.set(url, { etag: '', data });
+
+    updateLastUpdate();
+    if (data.is_phase_mode && data.phases) {
+        renderPhaseBoard(delta.feature_id, data);
+    } else {
+        renderKanbanBoard(delta.feature_id, data);
+    }
+}
+
 // Update last update time
 function updateLastUpdate() {
     const now = new Date();
@@ -973,22 +1164,30 @@ async function loadTaskFiles(featureId, taskId, lane, container) {
     }
 }
 
-// Load commit diff
-async function loadCommitDiff(commitSha, container) {
-    try {
-        const response = await fetch(`/api/diff/${commitSha}`);
+// Fetch one page of a commit diff; returns { text, nextOffset }
+// The server cuts large diffs at a per-page byte limit and reports the
+// offset of the next page in the X-Next-Offset header
+async function fetchDiffPage(commitSha, offset = 0) {
+    const query = offset ? `?offset=${offset}` : '';
+    const response = await fetch(`/api/diff/${commitSha}${query}`);
 
-        if (!response.ok) {
-            throw new Error('Failed to fetch diff');
-        }
+    if (!response.ok) {
+        throw new Error('Failed to fetch diff');
+    }
 
-        const diffText = await response.text();
+    const text = await response.text();
+    if (response.headers.get('X-Diff-Truncated') === 'true') {
+        return { text, nextOffset: parseInt(response.headers.get('X-Next-Offset'), 10) };
+    }
+    return { text, nextOffset: null };
+}
 
-        if (!diffText || diffText.trim() === '') {
-            container.innerHTML = '<p class="empty-state">No diff available</p>';
-            return;
-        }
+// Render a commit diff into container, paging in large diffs on demand
+async function renderCommitDiff(commitSha, container) {
+    let diffText = '';
+    let nextOffset = 0;
 
+    const render = () => {
         // Parse diff by file
         const fileDiffs = parseDiffByFile(diffText);
 
@@ -1011,7 +1210,39 @@ async function loadCommitDiff(commitSha, container) {
             `;
         }).join('');
 
-        container.innerHTML = html;
+        const more = nextOffset !== null
+            ? '<button class="btn btn-secondary diff-load-more">Load more</button>'
+            : '';
+        container.innerHTML = html + more;
+
+        const button = container.querySelector('.diff-load-more');
+        if (button) {
+            button.addEventListener('click', async () => {
+                button.disabled = true;
+                try {
+                    await loadPage();
+                } catch (error) {
+                    console.error('Failed to load diff:', error);
+                    button.disabled = false;
+                }
+            });
+        }
+    };
+
+    const loadPage = async () => {
+        const page = await fetchDiffPage(commitSha, nextOffset);
+        diffText += page.text;
+        nextOffset = page.nextOffset;
+        render();
+    };
+
+    await loadPage();
+}
+
+// Load commit diff
+async function loadCommitDiff(commitSha, container) {
+    try {
+        await renderCommitDiff(commitSha, container);
     } catch (error) {
         console.error('Failed to load diff:', error);
         container.innerHTML = '<p class="error">Failed to load diff</p>';
@@ -1189,8 +1420,7 @@ function closeTaskModal() {
 // Update untracked badge count
 async function updateUntrackedBadge() {
     try {
-        const response = await fetch('/api/untracked-commits');
-        const commits = await response.json();
+        const { data: commits } = await fetchJSON('/api/untracked-commits');
         const badge = document.getElementById('untracked-badge');
 
         if (commits.length === 0) {
@@ -1208,11 +1438,18 @@ async function updateUntrackedBadge() {
 async function loadUntrackedCommits() {
     const container = document.getElementById('untracked-list');
     const badge = document.getElementById('untracked-badge');
-    container.innerHTML = '<p class="loading">Loading untracked commits...</p>';
+    if (!container.dataset.etag) {
+        container.innerHTML = '<p class="loading">Loading untracked commits...</p>';
+    }
 
     try {
-        const response = await fetch('/api/untracked-commits');
-        const commits = await response.json();
+        const { data: commits, etag } = await fetchJSON('/api/untracked-commits');
+
+        // Nothing changed since the last render
+        if (etag && container.dataset.etag === etag) {
+            return;
+        }
+        container.dataset.etag = etag || '';
 
         if (commits.length === 0) {
             container.innerHTML = `
@@ -1271,6 +1508,7 @@ async function loadUntrackedCommits() {
 
     } catch (error) {
         console.error('Failed to load untracked commits:', error);
+        container.dataset.etag = '';
         container.innerHTML = '<p class="error">Failed to load untracked commits</p>';
         badge.style.display = 'none';
     }
@@ -1287,8 +1525,7 @@ async function generateSpecFromCommit(sha) {
 
     // Find commit data from untracked list
     try {
-        const response = await fetch('/api/untracked-commits');
-        const commits = await response.json();
+        const { data: commits } = await fetchJSON('/api/untracked-commits');
         const commit = commits.find(c => c.sha === sha);
 
         if (commit) {
@@ -1343,42 +1580,7 @@ async function loadMigrateDiff(sha) {
     const container = document.getElementById('migrate-diff');
 
     try {
-        const response = await fetch(`/api/diff/${sha}`);
-
-        if (!response.ok) {
-            throw new Error('Failed to load diff');
-        }
-
-        const diffText = await response.text();
-
-        if (!diffText || diffText.trim() === '') {
-            container.innerHTML = '<p class="empty-state">No diff available</p>';
-            return;
-        }
-
-        // Parse and highlight diff
-        const fileDiffs = parseDiffByFile(diffText);
-
-        if (fileDiffs.length === 0) {
-            container.innerHTML = '<p class="empty-state">No diff available</p>';
-            return;
-        }
-
-        const html = fileDiffs.map(({fileName, diffContent}) => {
-            const highlightedDiff = highlightDiff(diffContent);
-            return `
-                <details class="file-diff-section" open>
-                    <summary class="file-diff-header">
-                        <span class="file-diff-icon">📄</span>
-                        <span class="file-diff-name">${escapeHtml(fileName)}</span>
-                    </summary>
-                    <pre class="diff-code">${highlightedDiff}</pre>
-                </details>
-            `;
-        }).join('');
-
-        container.innerHTML = html;
-
+        await renderCommitDiff(sha, container);
     } catch (error) {
         console.error('Failed to load diff:', error);
         container.innerHTML = '<p class="error">Failed to load diff</p>';
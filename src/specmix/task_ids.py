@@ -0,0 +1,149 @@
+"""
+Per-feature task ID sequence.
+
+Task IDs (T001, T002, ...) are allocated from a counter kept in
+.spec-mix/state/<feature>/task-seq instead of being derived from the number
+of tasks on the board, so IDs are never handed out twice after tasks are
+deleted or renumbered. The state directory ignores itself in git.
+
+Tasks can also be written without the allocator (e.g. /spec-mix.tasks
+writes T001... straight into tasks.md). The sequence file therefore records
+a stamp of the board next to the counter, taken after the allocator's own
+write. While the stamp still matches, the counter is trusted and allocation
+costs a few stat calls; if the board changed behind its back, or the file is
+new, the counter is raised to the highest task number on the board first.
+
+create-new-feature.sh/.ps1 create the sequence file (counter 0, no stamp)
+for new features. Allocation holds an exclusive lock on the sequence file,
+so the MCP server, scripts and any other process can allocate for the same
+feature safely.
+"""
+
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+STATE_DIR = Path(".spec-mix") / "state"
+SEQ_FILE = "task-seq"
+
+_TASK_NUMBER = re.compile(r'^T(\d+)')
+
+
+@contextmanager
+def exclusive_lock(f):
+    """Hold an exclusive lock on an open file."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def feature_state_dir(feature_dir: Path) -> Path:
+    """
+    Return (and create) the directory holding a feature's sequence and lock files.
+
+    State lives in the .spec-mix/ directory of the checkout the feature
+    belongs to (specs/<feature> or .worktrees/<name>/specs/<feature>), not
+    in the user-visible spec directory.
+    """
+    feature_dir = Path(feature_dir)
+    state_root = feature_dir.parent.parent / STATE_DIR
+    state_dir = state_root / feature_dir.name
+    state_dir.mkdir(parents=True, exist_ok=True)
+
+    ignore_file = state_root / ".gitignore"
+    if not ignore_file.exists():
+        ignore_file.write_text("*\n", encoding="utf-8")
+    return state_dir
+
+
+def highest_task_number(task_ids: Iterable[str]) -> int:
+    """Return the highest N among T<N> task IDs (0 if there are none)."""
+    highest = 0
+    for task_id in task_ids:
+        match = _TASK_NUMBER.match(task_id or '')
+        if match:
+            highest = max(highest, int(match.group(1)))
+    return highest
+
+
+@contextmanager
+def reserve_task_ids(feature_dir: Path, count: int,
+                     board_stamp: Optional[Callable[[], str]] = None,
+                     floor: Optional[Callable[[], int]] = None) -> Iterator[List[str]]:
+    """
+    Reserve the next task IDs for a feature and keep the sequence locked
+    while the caller writes the tasks.
+
+    Args:
+        feature_dir: Feature directory
+        count: Number of IDs to reserve
+        board_stamp: Returns a cheap fingerprint of the board (stat data of
+            tasks.md and the lane directories)
+        floor: Returns the highest task number on the board; only called
+            when the sequence file is new or the board stamp changed
+
+    Yields:
+        The reserved IDs, in order (e.g. ['T007', 'T008'])
+    """
+    with open(feature_state_dir(feature_dir) / SEQ_FILE, 'a+', encoding='utf-8') as f:
+        with exclusive_lock(f):
+            f.seek(0)
+            lines = f.read().split('\n')
+            text = lines[0].strip()
+            last = int(text) if text.isdigit() else None
+            recorded = lines[1] if len(lines) > 1 else ''
+
+            stamp = board_stamp() if board_stamp is not None else ''
+            if floor is not None and (last is None or not recorded or recorded != stamp):
+                last = max(last or 0, floor())
+            last = last or 0
+            count = max(count, 0)
+
+            # Without a stamp the next allocation re-checks the board, so a
+            # caller that fails halfway cannot leave a stale stamp behind
+            _write_sequence(f, last + count, '')
+            yield [f"T{number:03d}" for number in range(last + 1, last + count + 1)]
+
+            if board_stamp is not None:
+                _write_sequence(f, last + count, board_stamp())
+
+
+def _write_sequence(f, last: int, stamp: str):
+    f.seek(0)
+    f.truncate()
+    f.write(f"{last}\n{stamp}\n" if stamp else f"{last}\n")
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def allocate_task_ids(feature_dir: Path, count: int = 1,
+                      board_stamp: Optional[Callable[[], str]] = None,
+                      floor: Optional[Callable[[], int]] = None) -> List[str]:
+    """
+    Reserve the next task IDs for a feature (see reserve_task_ids).
+
+    Use reserve_task_ids instead when the tasks are written right away, so
+    the board stamp recorded afterwards includes the caller's own write.
+    """
+    with reserve_task_ids(feature_dir, count, board_stamp, floor) as task_ids:
+        return task_ids
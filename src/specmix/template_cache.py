@@ -0,0 +1,235 @@
+"""
+Local cache for release templates.
+
+Template archives downloaded by `spec-mix init` and `spec-mix add` are kept
+under the user cache directory so repeated scaffolding does not hit GitHub.
+Archives are stored content-addressed (by SHA-256) and indexed by release
+tag and asset name; release metadata is stored with its ETag so it can be
+revalidated with a conditional request.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+# Set to relocate the cache (e.g. a pre-seeded directory in CI)
+CACHE_DIR_ENV = "SPEC_MIX_CACHE_DIR"
+
+# Cached archives kept before least recently used ones are evicted
+DEFAULT_MAX_ENTRIES = 20
+
+# Interrupted downloads older than this are discarded instead of resumed
+PARTIAL_MAX_AGE = 7 * 24 * 3600
+
+INDEX_FILE = "index.json"
+BLOBS_DIR = "blobs"
+
+
+def default_cache_dir() -> Path:
+    """Return the template cache directory (SPEC_MIX_CACHE_DIR or the user cache)."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+
+    from platformdirs import user_cache_dir
+    return Path(user_cache_dir("spec-mix")) / "templates"
+
+
+class TemplateCache:
+    """
+    Content-addressed store of release template archives.
+
+    Layout::
+
+        <root>/index.json       releases (ETag + JSON) and asset entries
+        <root>/blobs/<sha>.zip  archive contents, shared between entries
+
+    One instance may be shared by concurrent downloads; index updates are
+    serialized by an internal lock.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_entries = max(1, max_entries)
+        self._index: Optional[Dict[str, Any]] = None
+        self._lock = threading.RLock()
+
+    # Index ---------------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, Any]:
+        if self._index is None:
+            try:
+                with open(self.root / INDEX_FILE, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+            self._index.setdefault("releases", {})
+            self._index.setdefault("assets", {})
+        return self._index
+
+    def _save_index(self):
+        index = self._load_index()
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees half a file
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".index-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2)
+            os.replace(tmp, self.root / INDEX_FILE)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _asset_key(tag: str, name: str) -> str:
+        return f"{tag}/{name}"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / BLOBS_DIR / f"{digest}.zip"
+
+    # Releases ------------------------------------------------------------
+
+    def get_release(self, url: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (etag, release data) cached for a releases API URL."""
+        entry = self._load_index()["releases"].get(url)
+        if not entry:
+            return None, None
+        return entry.get("etag"), entry.get("data")
+
+    def put_release(self, url: str, etag: Optional[str], data: Dict[str, Any]):
+        """Remember release data for a releases API URL."""
+        with self._lock:
+            self._load_index()["releases"][url] = {
+                "etag": etag,
+                "data": data,
+                "fetched": time.time(),
+            }
+            self._save_index()
+
+    # Assets --------------------------------------------------------------
+
+    def lookup(self, tag: str, name: str) -> Optional[Path]:
+        """Return the cached archive for a release asset, or None."""
+        with self._lock:
+            entry = self._load_index()["assets"].get(self._asset_key(tag, name))
+            if not entry:
+                return None
+
+            path = self._blob_path(entry["sha256"])
+            try:
+                if path.stat().st_size != entry.get("size"):
+                    return None
+            except OSError:
+                return None
+
+            entry["last_used"] = time.time()
+            try:
+                self._save_index()
+            except OSError:
+                pass  # A read-only (seeded) cache is still usable
+            return path
+
+    def find_latest(self, patterns: Iterable[str]) -> Optional[Tuple[str, str, Path]]:
+        """
+        Return (tag, name, path) of the most recently used cached archive
+        whose name contains every pattern, for offline use without release data.
+        """
+        patterns = list(patterns)
+        candidates = []
+        for key, entry in self._load_index()["assets"].items():
+            tag, _, name = key.partition('/')
+            if all(p in name for p in patterns):
+                candidates.append((entry.get("last_used", 0), tag, name))
+
+        for _, tag, name in sorted(candidates, reverse=True):
+            path = self.lookup(tag, name)
+            if path is not None:
+                return tag, name, path
+        return None
+
+    def partial_path(self, tag: str, name: str) -> Path:
+        """
+        Return the file a download of this asset is written to.
+
+        The path is stable across runs, so an interrupted download can be
+        resumed from what is already on disk.
+        """
+        blobs = self.root / BLOBS_DIR
+        blobs.mkdir(parents=True, exist_ok=True)
+        key = hashlib.sha256(self._asset_key(tag, name).encode('utf-8')).hexdigest()[:16]
+        return blobs / f".partial-{key}"
+
+    def store(self, tag: str, name: str, tmp_path: Path, digest: Optional[str] = None) -> Path:
+        """
+        Move a downloaded archive into the store and index it.
+
+        Args:
+            tag: Release tag the asset belongs to
+            name: Asset file name
+            tmp_path: Downloaded file (e.g. from partial_path)
+            digest: SHA-256 hex digest if already computed while downloading
+
+        Returns:
+            Path of the stored archive
+        """
+        if digest is None:
+            h = hashlib.sha256()
+            with open(tmp_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    h.update(block)
+            digest = h.hexdigest()
+
+        with self._lock:
+            path = self._blob_path(digest)
+            if path.exists():
+                tmp_path.unlink()
+            else:
+                os.replace(tmp_path, path)
+
+            # Re-read so entries added by other processes are not evicted
+            self._index = None
+            self._load_index()["assets"][self._asset_key(tag, name)] = {
+                "sha256": digest,
+                "size": path.stat().st_size,
+                "last_used": time.time(),
+            }
+            self.evict()
+            self._save_index()
+            return path
+
+    def evict(self):
+        """Drop least recently used entries beyond max_entries, unreferenced archives and stale partial downloads."""
+        with self._lock:
+            assets = self._load_index()["assets"]
+            if len(assets) > self.max_entries:
+                by_age = sorted(assets, key=lambda k: assets[k].get("last_used", 0))
+                for key in by_age[:len(assets) - self.max_entries]:
+                    del assets[key]
+
+            referenced = {entry["sha256"] for entry in assets.values()}
+            blobs = self.root / BLOBS_DIR
+            if not blobs.is_dir():
+                return
+            for blob in blobs.glob("*.zip"):
+                if blob.stem not in referenced:
+                    try:
+                        blob.unlink()
+                    except OSError:
+                        pass
+
+            cutoff = time.time() - PARTIAL_MAX_AGE
+            for partial in blobs.glob(".partial-*"):
+                try:
+                    if partial.stat().st_mtime < cutoff:
+                        partial.unlink()
+                except OSError:
+                    pass
@@ -0,0 +1,50 @@
+"""Shared fixtures for the dashboard HTTP tests."""
+
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from specmix.dashboard import start_dashboard
+
+
+TASKS_MD = """# Tasks
+
+- [ ] T001 Write the parser
+- [ ] T002 Add parser tests
+- [x] T003 Sketch the data model
+- [ ] T004 Document the API
+"""
+
+
+@pytest.fixture
+def dashboard_project(tmp_path, monkeypatch):
+    for name in ['001-alpha', '002-beta']:
+        feature_dir = tmp_path / 'specs' / name
+        feature_dir.mkdir(parents=True)
+        (feature_dir / 'spec.md').write_text('# Spec\n', encoding='utf-8')
+        (feature_dir / 'tasks.md').write_text(TASKS_MD, encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def dashboard_server(dashboard_project):
+    server, port, _ = start_dashboard()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    server.base_url = f'http://localhost:{port}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def http_get(url, headers=None, timeout=5):
+    """GET a URL; returns (status, headers, body) without raising on 4xx/304"""
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
@@ -0,0 +1,66 @@
+"""Paged /api/diff responses."""
+
+import gzip
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import http_get
+
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git not installed')
+
+
+@pytest.fixture
+def commit(dashboard_project):
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=dashboard_project, check=True,
+                              capture_output=True, text=True).stdout.strip()
+
+    git('init', '-q')
+    git('config', 'user.email', 'dev@example.com')
+    git('config', 'user.name', 'Dev')
+    (dashboard_project / 'big.txt').write_text(''.join(f'line {n}\n' for n in range(2000)),
+                                               encoding='utf-8')
+    git('add', 'big.txt')
+    git('commit', '-q', '-m', 'Add big file')
+    return git('rev-parse', 'HEAD'), git('show', 'HEAD')
+
+
+def test_diff_pages_join_up_to_the_full_diff(dashboard_server, commit):
+    sha, full_diff = commit
+    dashboard_server.diff_max_bytes = 4096
+
+    text, offset, pages = '', 0, 0
+    while offset is not None:
+        status, headers, body = http_get(f'{dashboard_server.base_url}/api/diff/{sha}?offset={offset}')
+        assert status == 200
+        page = body.decode('utf-8')
+        assert len(body) <= 4096
+        assert page.endswith('\n')
+        text += page
+        pages += 1
+        if headers['X-Diff-Truncated'] == 'true':
+            offset = int(headers['X-Next-Offset'])
+        else:
+            assert 'X-Next-Offset' not in headers
+            offset = None
+
+    assert pages > 1
+    assert text.rstrip('\n') == full_diff
+
+
+def test_diff_is_compressed_for_gzip_clients(dashboard_server, commit):
+    sha, full_diff = commit
+    status, headers, body = http_get(f'{dashboard_server.base_url}/api/diff/{sha}',
+                                     {'Accept-Encoding': 'gzip'})
+    assert status == 200
+    assert headers['Content-Encoding'] == 'gzip'
+    assert headers['X-Diff-Truncated'] == 'false'
+    assert gzip.decompress(body).decode('utf-8').rstrip('\n') == full_diff
+
+
+def test_unknown_commit_is_not_found(dashboard_server, commit):
+    status, _, _ = http_get(f'{dashboard_server.base_url}/api/diff/0123456789abcdef')
+    assert status == 404
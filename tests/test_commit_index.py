@@ -0,0 +1,90 @@
+"""CommitIndex: commits are linked only to task IDs that exist on a board."""
+
+import subprocess
+
+import pytest
+
+from specmix import dashboard
+from specmix.dashboard import CommitIndex
+
+TASKS = """\
+# Tasks
+
+- [ ] T1 Short ID task
+- [ ] T005 Regular task
+
+### TASK-1: Header task
+"""
+
+
+def git(repo, *args):
+    subprocess.run(['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com', *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+def commit(repo, message):
+    git(repo, 'commit', '--allow-empty', '-q', '-m', message)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    feature_dir = tmp_path / 'specs' / '001-feature'
+    feature_dir.mkdir(parents=True)
+    (feature_dir / 'tasks.md').write_text(TASKS, encoding='utf-8')
+    lane_dir = tmp_path / 'specs' / '002-packages' / 'tasks' / 'planned'
+    lane_dir.mkdir(parents=True)
+    (lane_dir / 'WP04.md').write_text('# WP04: Work package\n', encoding='utf-8')
+    git(tmp_path, 'init', '-q')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(dashboard, 'COMMIT_REFS_TTL', 0)
+    return tmp_path
+
+
+def messages(index, task_id):
+    return [c['message'] for c in index.commits_for(task_id)]
+
+
+def test_phantom_tokens_are_ignored(repo):
+    commit(repo, 'Handle UTF-8 names and CVE-2024 fix over HTTP2 with SHA256')
+    commit(repo, '[T005] Regular task')
+
+    index = CommitIndex()
+
+    assert messages(index, 'T005') == ['[T005] Regular task']
+    for token in ['UTF-8', 'CVE-2024', 'HTTP2', 'SHA256']:
+        assert index.commits_for(token) == []
+    assert len(index._commits) == 1
+
+
+def test_short_header_and_work_package_ids(repo):
+    commit(repo, 'T1: short id')
+    commit(repo, 'feat: TASK-1 header task')
+    commit(repo, '[WP04.3] sub task')
+
+    index = CommitIndex()
+
+    assert messages(index, 'T1') == ['T1: short id']
+    assert messages(index, 'TASK-1') == ['feat: TASK-1 header task']
+    # A sub-task commit is listed under its work package
+    assert messages(index, 'WP04') == ['[WP04.3] sub task']
+
+
+def test_new_task_ids_find_older_commits(repo):
+    commit(repo, 'T007 written before the task existed')
+    index = CommitIndex()
+    assert index.commits_for('T007') == []
+
+    tasks_file = repo / 'specs' / '001-feature' / 'tasks.md'
+    tasks_file.write_text(TASKS + '- [ ] T007 Added later\n', encoding='utf-8')
+
+    assert messages(index, 'T007') == ['T007 written before the task existed']
+
+
+def test_new_commits_are_indexed_incrementally(repo):
+    commit(repo, 'T005 first')
+    index = CommitIndex()
+    assert messages(index, 'T005') == ['T005 first']
+
+    commit(repo, 'T005 second')
+
+    assert messages(index, 'T005') == ['T005 second', 'T005 first']
@@ -0,0 +1,45 @@
+"""ETag and Vary headers of compressed responses."""
+
+from conftest import http_get
+
+
+def test_each_encoding_has_its_own_etag(dashboard_server):
+    url = f'{dashboard_server.base_url}/static/dashboard.js'
+    _, plain, _ = http_get(url, {'Accept-Encoding': 'identity'})
+    _, gzipped, _ = http_get(url, {'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in plain
+    assert gzipped['Content-Encoding'] == 'gzip'
+    assert gzipped['ETag'] == plain['ETag'][:-1] + '-gzip"'
+    assert 'Accept-Encoding' in plain['Vary']
+    assert 'Accept-Encoding' in gzipped['Vary']
+
+
+def test_not_modified_keeps_the_encoding_etag_and_vary(dashboard_server):
+    url = f'{dashboard_server.base_url}/static/dashboard.js'
+    _, headers, _ = http_get(url, {'Accept-Encoding': 'gzip'})
+    etag = headers['ETag']
+
+    status, headers, _ = http_get(url, {'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert status == 304
+    assert headers['ETag'] == etag
+    assert 'Accept-Encoding' in headers['Vary']
+
+
+def test_not_modified_api_response_sends_vary(dashboard_server):
+    url = f'{dashboard_server.base_url}/api/features'
+    _, headers, _ = http_get(url)
+
+    status, not_modified, _ = http_get(url, {'If-None-Match': headers['ETag']})
+    assert status == 304
+    assert not_modified['Vary'] == headers['Vary']
+
+
+def test_images_are_not_varied_on_encoding(dashboard_server):
+    url = f'{dashboard_server.base_url}/static/logo.png'
+    _, headers, _ = http_get(url, {'Accept-Encoding': 'gzip'})
+
+    status, not_modified, _ = http_get(url, {'If-None-Match': headers['ETag']})
+    assert status == 304
+    assert not_modified['Vary'] is None
+    assert headers['Vary'] is None
@@ -0,0 +1,77 @@
+"""ETag revalidation and the /api/events stream."""
+
+import json
+import urllib.request
+
+from conftest import http_get
+
+
+def read_event(response):
+    """Read the next Server-Sent Event, skipping keepalive comments"""
+    event_type, data = None, None
+    while True:
+        line = response.readline().decode('utf-8')
+        assert line, 'event stream closed'
+        line = line.rstrip('\n')
+        if line.startswith('event: '):
+            event_type = line[len('event: '):]
+        elif line.startswith('data: '):
+            data = json.loads(line[len('data: '):])
+        elif not line and event_type is not None:
+            return event_type, data
+
+
+def test_features_etag_revalidates_until_a_feature_changes(dashboard_server, dashboard_project):
+    url = f'{dashboard_server.base_url}/api/features'
+    status, headers, _ = http_get(url)
+    etag = headers['ETag']
+    assert status == 200 and etag
+
+    status, headers, body = http_get(url, {'If-None-Match': etag})
+    assert status == 304
+    assert headers['ETag'] == etag
+    assert body == b''
+
+    (dashboard_project / 'specs' / '001-alpha' / 'plan.md').write_text('# Plan\n', encoding='utf-8')
+    dashboard_server.index.refresh()
+
+    status, headers, _ = http_get(url, {'If-None-Match': etag})
+    assert status == 200
+    assert headers['ETag'] != etag
+
+
+def test_kanban_etag_depends_on_the_query(dashboard_server):
+    url = f'{dashboard_server.base_url}/api/kanban/001-alpha'
+    _, headers, _ = http_get(url)
+    etag = headers['ETag']
+
+    status, _, _ = http_get(url, {'If-None-Match': etag})
+    assert status == 304
+    status, headers, _ = http_get(url + '?lane=done', {'If-None-Match': etag})
+    assert status == 200
+    assert headers['ETag'] != etag
+
+
+def test_event_stream_reports_board_changes(dashboard_server, dashboard_project):
+    # Only boards a client has loaded are pushed
+    http_get(f'{dashboard_server.base_url}/api/kanban/001-alpha')
+
+    request = urllib.request.Request(f'{dashboard_server.base_url}/api/events')
+    with urllib.request.urlopen(request, timeout=5) as response:
+        assert response.headers['Content-Type'].startswith('text/event-stream')
+        event_type, data = read_event(response)
+        assert event_type == 'ready'
+        assert data['version'] == dashboard_server.index.version
+
+        tasks_file = dashboard_project / 'specs' / '001-alpha' / 'tasks.md'
+        tasks_file.write_text(tasks_file.read_text(encoding='utf-8').replace('- [ ] T004', '- [x] T004'),
+                              encoding='utf-8')
+        dashboard_server.index.refresh()
+
+        events = {}
+        while 'kanban' not in events:
+            event_type, data = read_event(response)
+            events[event_type] = data
+
+    assert events['kanban']['feature_id'] == '001-alpha'
+    assert 'T004' in [task['id'] for task in events['kanban']['lanes']['done']]
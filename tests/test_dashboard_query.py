@@ -0,0 +1,60 @@
+"""lane/limit/cursor/q/fields parameters of /api/features and /api/kanban."""
+
+import json
+
+import pytest
+
+from specmix.dashboard import encode_json, scan_all_features, scan_feature_kanban
+
+from conftest import http_get
+
+
+@pytest.mark.parametrize('path', ['/api/features', '/api/kanban/001-alpha'])
+@pytest.mark.parametrize('query', [
+    'limit=0',
+    'limit=abc',
+    'limit=100000',
+    'cursor=-1',
+    'cursor=abc',
+    'lane=nowhere',
+    'lane=planned,nowhere',
+])
+def test_bad_list_parameters_are_rejected(dashboard_server, path, query):
+    status, _, _ = http_get(f'{dashboard_server.base_url}{path}?{query}')
+    assert status == 400
+
+
+@pytest.mark.parametrize('fields', ['to_dict', '__slots__', 'nope', 'id,nope'])
+def test_unknown_kanban_fields_are_rejected(dashboard_server, fields):
+    status, _, _ = http_get(f'{dashboard_server.base_url}/api/kanban/001-alpha?fields={fields}')
+    assert status == 400
+
+
+def test_features_without_parameters_match_the_scan(dashboard_server):
+    status, _, body = http_get(f'{dashboard_server.base_url}/api/features')
+    assert status == 200
+    assert json.loads(body) == json.loads(encode_json(scan_all_features()))
+
+
+def test_kanban_without_parameters_matches_the_scan(dashboard_server):
+    status, _, body = http_get(f'{dashboard_server.base_url}/api/kanban/001-alpha')
+    assert status == 200
+    assert json.loads(body) == json.loads(encode_json(scan_feature_kanban('001-alpha')))
+
+
+def test_kanban_page_with_projection(dashboard_server):
+    url = f'{dashboard_server.base_url}/api/kanban/001-alpha?lane=planned&limit=2&q=parser&fields=id'
+    status, _, body = http_get(url)
+    assert status == 200
+    data = json.loads(body)
+    assert list(data['lanes']) == ['planned']
+    assert data['lanes']['planned'] == [{'id': 'T001'}, {'id': 'T002'}]
+
+
+def test_features_page(dashboard_server):
+    status, _, body = http_get(f'{dashboard_server.base_url}/api/features?limit=1')
+    assert status == 200
+    data = json.loads(body)
+    assert len(data['features']) == 1
+    assert data['page']['total'] == 2
+    assert data['page']['next_cursor'] == 1
@@ -0,0 +1,64 @@
+"""
+Import-time regression tests for the spec-mix CLI.
+
+Agent hooks run the CLI hundreds of times per session, so `import specmix`
+must not pull in network, TLS or interactive UI modules, nor the command
+sub-apps; those are loaded when a command needs them.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Modules that must only be imported by the commands that use them
+LAZY_MODULES = [
+    "httpx",
+    "truststore",
+    "readchar",
+    "rich.live",
+    "rich.progress",
+    "specmix.dashboard",
+    "specmix.dashboard_command",
+    "specmix.lang_command",
+    "specmix.mission_command",
+    "specmix.mode_command",
+    "specmix.mcp_server",
+]
+
+# Cumulative `import specmix` time budget in microseconds; generous enough
+# for a slow CI runner, far below what the eager imports used to cost
+IMPORT_BUDGET_US = 500_000
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+    )
+
+
+def test_import_does_not_load_lazy_modules():
+    result = _run_python(
+        "-c",
+        "import specmix, sys; print('\\n'.join(sys.modules))",
+    )
+    loaded = set(result.stdout.split())
+
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    assert eager == [], f"imported at startup: {', '.join(eager)}"
+
+
+def test_import_time_budget():
+    result = _run_python("-X", "importtime", "-c", "import specmix")
+
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| specmix$", result.stderr, re.MULTILINE)
+    assert match, "no importtime line for specmix"
+    cumulative = int(match.group(1))
+    assert cumulative < IMPORT_BUDGET_US, f"import specmix took {cumulative} us"
@@ -0,0 +1,62 @@
+"""Tool timeouts in the MCP server count only the time a tool runs."""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from specmix import mcp_server
+
+
+@pytest.fixture
+def slow_tools(monkeypatch):
+    def call_tool(name, arguments):
+        time.sleep(arguments['seconds'])
+        return [mcp_server.types.TextContent(type="text", text=f"{name} done")]
+
+    monkeypatch.setattr(mcp_server, '_call_tool', call_tool)
+    mcp_server.set_tool_limits(workers=4, timeout=0.5)
+    yield
+    mcp_server.set_tool_limits()
+
+
+def call(name, seconds):
+    return mcp_server.handle_call_tool(name, {'seconds': seconds})
+
+
+def texts(results):
+    return [result[0].text for result in results]
+
+
+def test_waiting_for_the_write_lock_is_not_timed(slow_tools):
+    async def run():
+        return await asyncio.gather(*(call('create_task', 0.3) for _ in range(3)))
+
+    # Run one after another (0.9 s in total), each well within its own timeout
+    assert texts(asyncio.run(run())) == ['create_task done'] * 3
+
+
+def test_write_timeout_says_the_write_may_still_apply(slow_tools):
+    [result] = asyncio.run(call('create_task', 0.8))
+
+    assert 'did not finish' in result.text
+    assert 'may still be applied' in result.text
+
+
+def test_read_timeout(slow_tools):
+    [result] = asyncio.run(call('get_project_context', 0.8))
+
+    assert 'did not finish' in result.text
+    assert 'may still be applied' not in result.text
+
+
+def test_write_behind_a_stuck_write_is_not_run(slow_tools):
+    async def run():
+        return await asyncio.gather(call('create_task', 1.2), call('move_tasks', 0.1))
+
+    stuck, queued = texts(asyncio.run(run()))
+
+    assert 'may still be applied' in stuck
+    assert 'was not run' in queued and 'Nothing was changed' in queued
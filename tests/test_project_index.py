@@ -0,0 +1,85 @@
+"""ProjectIndex refreshes and the bounded file caches."""
+
+import os
+import threading
+
+import pytest
+
+from specmix import dashboard
+from specmix.dashboard import FileCache, ProjectIndex
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    for name in ['001-first', '002-second']:
+        feature_dir = tmp_path / 'specs' / name
+        feature_dir.mkdir(parents=True)
+        (feature_dir / 'spec.md').write_text('# Spec\n', encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_unreadable_feature_is_not_reread_every_poll(project, monkeypatch):
+    read_info = dashboard.get_feature_info
+    reads = []
+
+    def get_feature_info(feature_dir, *args, **kwargs):
+        reads.append(feature_dir.name)
+        if feature_dir.name == '003-half-created':
+            return None
+        return read_info(feature_dir, *args, **kwargs)
+
+    monkeypatch.setattr(dashboard, 'get_feature_info', get_feature_info)
+    index = ProjectIndex()
+    index.refresh()
+    (project / 'specs' / '003-half-created').mkdir()
+    reads.clear()
+
+    for _ in range(3):
+        index.refresh()
+
+    assert reads == ['003-half-created']
+    assert sorted(f['id'] for f in index.features()) == ['001-first', '002-second']
+
+
+def test_feature_that_becomes_unreadable_is_reported_removed(project, monkeypatch):
+    index = ProjectIndex()
+    index.refresh()
+    after = index.event_seq
+
+    monkeypatch.setattr(dashboard, 'get_feature_info', lambda *args, **kwargs: None)
+    (project / 'specs' / '001-first' / 'plan.md').write_text('# Plan\n', encoding='utf-8')
+    index.refresh()
+
+    events = [event for _, event in index.wait_for_events(after, 0)]
+    removed = os.path.join('specs', '001-first')
+    assert {'type': 'features', 'data': {'updated': [], 'removed': [removed]}} in events
+
+
+def test_concurrent_refreshes_publish_one_event(project):
+    index = ProjectIndex()
+    index.refresh()
+    after = index.event_seq
+    (project / 'specs' / '004-new').mkdir()
+
+    threads = [threading.Thread(target=index.refresh) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    events = index.wait_for_events(after, 0)
+    assert [event['type'] for _, event in events] == ['features']
+
+
+def test_file_cache_is_bounded():
+    cache = FileCache(max_entries=2)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache.get('a')
+    cache['c'] = 3
+
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.pop('a') == 1 and cache.pop('a') is None
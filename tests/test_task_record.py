@@ -0,0 +1,27 @@
+"""Task records behave like read-only dicts of their data fields."""
+
+import pytest
+
+from specmix.dashboard import KANBAN_FIELDS, Task, encode_json, parse_list_query
+
+
+def test_item_access_exposes_only_fields():
+    task = Task('T001', 'Title', 'specs/001/tasks.md')
+
+    assert task['id'] == 'T001'
+    assert task.get('title') == 'Title'
+    for name in ['to_dict', 'get', '__class__', '__slots__']:
+        assert task.get(name) is None
+        assert task.get(name, 'default') == 'default'
+        with pytest.raises(KeyError):
+            task[name]
+
+
+def test_task_encodes_as_json():
+    assert encode_json([Task('T001', 'Title', 'p')]) == '[{"id":"T001","title":"Title","path":"p"}]'
+
+
+def test_fields_projection_rejects_unknown_names():
+    assert parse_list_query({'fields': ['id,title']}, KANBAN_FIELDS)['fields'] == ['id', 'title']
+    with pytest.raises(ValueError):
+        parse_list_query({'fields': ['id,to_dict']}, KANBAN_FIELDS)
@@ -0,0 +1,215 @@
+"""
+Round-trip tests for the tasks.md span editor (TasksIndex, move_tasks_in_file,
+add_tasks_to_file): every edit is checked by re-parsing the file with
+parse_tasks_markdown.
+"""
+
+import pytest
+
+from specmix.dashboard import add_tasks_to_file, move_tasks_in_file, parse_tasks_markdown
+
+SECTION_TASKS = """\
+# Tasks
+
+## Planned
+
+- [ ] T001 First task
+- [ ] T002 Second task
+  - indented note
+
+## Doing
+
+### T003: Header task
+Body of the header task
+
+## Done
+
+- [x] T004 Finished task
+"""
+
+FLAT_TASKS = """\
+# Tasks
+
+- [ ] T001 First task
+- [x] T002 Second task
+- [ ] T003 Third task
+"""
+
+PHASE_TASKS = """\
+# Tasks
+
+## Phase 1: Setup
+
+- [ ] T001 Create project
+- [x] T002 Add config
+"""
+
+
+@pytest.fixture
+def tasks_file(tmp_path):
+    feature_dir = tmp_path / "specs" / "001-feature"
+    feature_dir.mkdir(parents=True)
+    return feature_dir / "tasks.md"
+
+
+def lanes_of(tasks_file):
+    lanes = parse_tasks_markdown(tasks_file)['lanes']
+    return {lane: [task['id'] for task in tasks] for lane, tasks in lanes.items()}
+
+
+def test_move_between_sections(tasks_file):
+    tasks_file.write_text(SECTION_TASKS, encoding='utf-8')
+
+    moved, errors = move_tasks_in_file(tasks_file, [
+        {'task_id': 'T002', 'lane': 'doing'},
+        {'task_id': 'T003', 'lane': 'done'},
+    ])
+
+    assert errors == []
+    assert moved == [('T002', 'doing'), ('T003', 'done')]
+    assert lanes_of(tasks_file) == {
+        'planned': ['T001'],
+        'doing': ['T002'],
+        'for_review': [],
+        'done': ['T004', 'T003'],
+    }
+    text = tasks_file.read_text(encoding='utf-8')
+    # Sub-lines and header bodies travel with their task
+    assert '- [ ] T002 Second task\n  - indented note\n' in text
+    assert '### T003: Header task\nBody of the header task' in text
+    assert text.count('T002') == 1 and text.count('T003') == 1
+
+
+def test_move_to_done_checks_the_box(tasks_file):
+    tasks_file.write_text(SECTION_TASKS, encoding='utf-8')
+
+    move_tasks_in_file(tasks_file, [{'task_id': 'T001', 'lane': 'done'}])
+
+    assert '- [x] T001 First task' in tasks_file.read_text(encoding='utf-8')
+    assert lanes_of(tasks_file)['done'] == ['T004', 'T001']
+
+
+def test_move_to_lane_without_section(tasks_file):
+    tasks_file.write_text(SECTION_TASKS, encoding='utf-8')
+
+    moved, errors = move_tasks_in_file(tasks_file, [{'task_id': 'T001', 'lane': 'for_review'}])
+
+    assert errors == []
+    assert '## For Review' in tasks_file.read_text(encoding='utf-8')
+    assert lanes_of(tasks_file) == {
+        'planned': ['T002'],
+        'doing': ['T003'],
+        'for_review': ['T001'],
+        'done': ['T004'],
+    }
+
+
+def test_move_errors_leave_file_untouched(tasks_file):
+    tasks_file.write_text(SECTION_TASKS, encoding='utf-8')
+
+    moved, errors = move_tasks_in_file(tasks_file, [
+        {'task_id': 'T999', 'lane': 'done'},
+        {'task_id': 'T001', 'lane': 'nowhere'},
+    ])
+
+    assert moved == []
+    assert len(errors) == 2
+    assert tasks_file.read_text(encoding='utf-8') == SECTION_TASKS
+
+
+def test_flat_file_checkbox_toggles(tasks_file):
+    tasks_file.write_text(FLAT_TASKS, encoding='utf-8')
+
+    moved, errors = move_tasks_in_file(tasks_file, [
+        {'task_id': 'T001', 'lane': 'done'},
+        {'task_id': 'T002', 'lane': 'planned'},
+    ])
+
+    assert errors == []
+    assert tasks_file.read_text(encoding='utf-8') == FLAT_TASKS.replace(
+        '- [ ] T001', '- [x] T001').replace('- [x] T002', '- [ ] T002')
+    assert lanes_of(tasks_file) == {
+        'planned': ['T002', 'T003'],
+        'doing': [],
+        'for_review': [],
+        'done': ['T001'],
+    }
+
+
+def test_flat_file_rejects_other_lanes(tasks_file):
+    tasks_file.write_text(FLAT_TASKS, encoding='utf-8')
+
+    moved, errors = move_tasks_in_file(tasks_file, [{'task_id': 'T001', 'lane': 'doing'}])
+
+    assert moved == []
+    assert errors
+    assert tasks_file.read_text(encoding='utf-8') == FLAT_TASKS
+
+
+def test_phase_file_is_refused(tasks_file):
+    tasks_file.write_text(PHASE_TASKS, encoding='utf-8')
+
+    moved, errors = move_tasks_in_file(tasks_file, [{'task_id': 'T001', 'lane': 'done'}])
+
+    assert moved == []
+    assert errors
+    assert tasks_file.read_text(encoding='utf-8') == PHASE_TASKS
+
+
+def test_repeated_edits_are_not_served_from_cache(tasks_file):
+    tasks_file.write_text(FLAT_TASKS, encoding='utf-8')
+    lanes_of(tasks_file)
+
+    for lane in ['done', 'planned', 'done']:
+        move_tasks_in_file(tasks_file, [{'task_id': 'T003', 'lane': lane}])
+        assert 'T003' in lanes_of(tasks_file)[lane]
+
+
+def test_add_to_section_file(tasks_file):
+    tasks_file.write_text(SECTION_TASKS, encoding='utf-8')
+
+    add_tasks_to_file(tasks_file, ['### T005: New task\nDetails', '### T006: Another'])
+
+    assert lanes_of(tasks_file) == {
+        'planned': ['T001', 'T002', 'T005', 'T006'],
+        'doing': ['T003'],
+        'for_review': [],
+        'done': ['T004'],
+    }
+
+
+def test_add_to_lane_without_section(tasks_file):
+    tasks_file.write_text(SECTION_TASKS, encoding='utf-8')
+
+    add_tasks_to_file(tasks_file, ['### T005: Needs review'], lane='for_review')
+
+    assert lanes_of(tasks_file)['for_review'] == ['T005']
+    assert lanes_of(tasks_file)['planned'] == ['T001', 'T002']
+
+
+def test_add_to_flat_file(tasks_file):
+    tasks_file.write_text(FLAT_TASKS.rstrip('\n'), encoding='utf-8')
+
+    add_tasks_to_file(tasks_file, ['### T004: Appended'])
+
+    assert lanes_of(tasks_file)['planned'] == ['T001', 'T003', 'T004']
+    assert lanes_of(tasks_file)['done'] == ['T002']
+
+
+def test_add_creates_missing_file(tasks_file):
+    add_tasks_to_file(tasks_file, ['### T001: First'])
+
+    text = tasks_file.read_text(encoding='utf-8')
+    assert all(f'## {heading}' in text for heading in ['Planned', 'Doing', 'For Review', 'Done'])
+    assert lanes_of(tasks_file)['planned'] == ['T001']
+
+
+def test_lock_file_stays_out_of_the_spec_directory(tasks_file):
+    tasks_file.write_text(FLAT_TASKS, encoding='utf-8')
+
+    move_tasks_in_file(tasks_file, [{'task_id': 'T001', 'lane': 'done'}])
+
+    assert sorted(path.name for path in tasks_file.parent.iterdir()) == ['tasks.md']
+    state_root = tasks_file.parent.parent.parent / '.spec-mix' / 'state'
+    assert (state_root / '001-feature' / 'tasks.lock').exists()
+    assert (state_root / '.gitignore').read_text(encoding='utf-8') == '*\n'
@@ -0,0 +1,59 @@
+"""
+parse_tasks_markdown against fixture files.
+
+The expected results in tests/fixtures/tasks/*.json were produced by the
+original regex-based parser, so these tests pin the single-pass parser to
+its behavior: lane assignment for section, flat and phase files, dotted
+and header task IDs, and checkbox states.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from specmix.dashboard import encode_json, parse_tasks_markdown
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'tasks'
+
+
+def expected(name, tasks_file):
+    text = (FIXTURES / f'{name}.json').read_text(encoding='utf-8')
+    return json.loads(text.replace('{path}', json.dumps(str(tasks_file))[1:-1]))
+
+
+@pytest.mark.parametrize('name', sorted(path.stem for path in FIXTURES.glob('*.md')))
+def test_matches_original_parser(name, tmp_path):
+    tasks_file = tmp_path / 'tasks.md'
+    tasks_file.write_bytes((FIXTURES / f'{name}.md').read_bytes())
+
+    result = json.loads(encode_json(parse_tasks_markdown(tasks_file)))
+
+    assert result == expected(name, tasks_file)
+
+
+def test_checkbox_state_decides_lane_in_flat_files(tmp_path):
+    tasks_file = tmp_path / 'tasks.md'
+    tasks_file.write_text('- [ ] T001 open\n- [x] T002 done\n- [X] T003 done\n', encoding='utf-8')
+
+    lanes = parse_tasks_markdown(tasks_file)['lanes']
+
+    assert [task['id'] for task in lanes['planned']] == ['T001']
+    assert [task['id'] for task in lanes['done']] == ['T002', 'T003']
+
+
+def test_result_is_cached_until_the_file_changes(tmp_path):
+    tasks_file = tmp_path / 'tasks.md'
+    tasks_file.write_text('- [ ] T001 open\n', encoding='utf-8')
+    first = parse_tasks_markdown(tasks_file)
+
+    assert parse_tasks_markdown(tasks_file) is first
+
+    tasks_file.write_text('- [x] T001 open\n', encoding='utf-8')
+    assert [task['id'] for task in parse_tasks_markdown(tasks_file)['lanes']['done']] == ['T001']
+
+
+def test_missing_file_gives_empty_lanes(tmp_path):
+    result = parse_tasks_markdown(tmp_path / 'missing.md')
+
+    assert result['lanes'] == {'planned': [], 'doing': [], 'for_review': [], 'done': []}